@@ -0,0 +1,7 @@
+CREATE TABLE source_cache (
+    source_name TEXT PRIMARY KEY,
+    last_etag TEXT,
+    last_modified TEXT,
+    most_recent_hash TEXT,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,2 @@
+ALTER TABLE source_cache ADD COLUMN seen_items TEXT NOT NULL DEFAULT '';
+ALTER TABLE source_cache DROP COLUMN most_recent_hash;
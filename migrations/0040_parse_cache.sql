@@ -0,0 +1,6 @@
+CREATE TABLE parse_cache (
+    file_name TEXT PRIMARY KEY,
+    parser_version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
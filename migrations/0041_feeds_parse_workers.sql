@@ -0,0 +1,4 @@
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    parse_workers INTEGER NOT NULL DEFAULT 0;
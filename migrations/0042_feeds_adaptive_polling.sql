@@ -0,0 +1,9 @@
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    min_polling_interval INTEGER;
+
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    max_polling_interval INTEGER;
@@ -0,0 +1,4 @@
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    catch_up_depth INTEGER NOT NULL DEFAULT 5;
@@ -0,0 +1,4 @@
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    polling_mode TEXT NOT NULL DEFAULT 'feed';
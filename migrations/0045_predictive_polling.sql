@@ -0,0 +1,14 @@
+ALTER TABLE
+    show_entry
+ADD COLUMN
+    created_at TIMESTAMP;
+
+UPDATE
+    show_entry
+SET
+    created_at = last_update;
+
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    predictive_polling BOOLEAN NOT NULL DEFAULT 0;
@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS show_rule (
+    id INTEGER PRIMARY KEY,
+    show_id INTEGER NOT NULL REFERENCES shows(id) ON DELETE CASCADE,
+    action TEXT NOT NULL CHECK (action IN ('include', 'exclude')),
+    match_type TEXT NOT NULL CHECK (match_type IN ('keyword', 'regex', 'group')),
+    pattern TEXT NOT NULL
+);
@@ -0,0 +1,4 @@
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    batch_backfill BOOLEAN NOT NULL DEFAULT 0;
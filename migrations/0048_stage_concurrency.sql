@@ -0,0 +1,14 @@
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    fetch_concurrency INTEGER NOT NULL DEFAULT 4;
+
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    parse_concurrency INTEGER NOT NULL DEFAULT 1;
+
+ALTER TABLE
+    feeds_config
+ADD COLUMN
+    resolve_concurrency INTEGER NOT NULL DEFAULT 4;
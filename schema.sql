@@ -48,6 +48,21 @@ CREATE TABLE seen_release (
     PRIMARY KEY (title, release_group, episode, resolution)
 );
 
+CREATE TABLE source_cache (
+    source_name TEXT PRIMARY KEY,
+    last_etag TEXT,
+    last_modified TEXT,
+    seen_items TEXT NOT NULL DEFAULT '',
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE parse_cache (
+    file_name TEXT PRIMARY KEY,
+    parser_version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE library (
     id INTEGER PRIMARY KEY,
     folder TEXT NOT NULL,
@@ -77,7 +92,16 @@ CREATE TABLE show_entry (
     torrent_hash TEXT NOT NULL,
     file_path TEXT,
     created_manually BOOLEAN NOT NULL DEFAULT '0',
-    last_update TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    last_update TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP
+);
+
+CREATE TABLE show_rule (
+    id INTEGER PRIMARY KEY,
+    show_id INTEGER NOT NULL REFERENCES shows(id) ON DELETE CASCADE,
+    action TEXT NOT NULL CHECK (action IN ('include', 'exclude')),
+    match_type TEXT NOT NULL CHECK (match_type IN ('keyword', 'regex', 'group')),
+    pattern TEXT NOT NULL
 );
 
 
@@ -98,7 +122,17 @@ CREATE TABLE feeds_config (
     polling_interval INTEGER NOT NULL DEFAULT 900,
     complete_check_interval INTEGER NOT NULL DEFAULT 15,
     fuzzy_cutoff INTEGER NOT NULL DEFAULT 90,
-    seed_ratio_limit REAL NOT NULL DEFAULT 0.0
+    seed_ratio_limit REAL NOT NULL DEFAULT 0.0,
+    parse_workers INTEGER NOT NULL DEFAULT 0,
+    min_polling_interval INTEGER,
+    max_polling_interval INTEGER,
+    catch_up_depth INTEGER NOT NULL DEFAULT 5,
+    polling_mode TEXT NOT NULL DEFAULT 'feed',
+    predictive_polling BOOLEAN NOT NULL DEFAULT 0,
+    batch_backfill BOOLEAN NOT NULL DEFAULT 0,
+    fetch_concurrency INTEGER NOT NULL DEFAULT 4,
+    parse_concurrency INTEGER NOT NULL DEFAULT 1,
+    resolve_concurrency INTEGER NOT NULL DEFAULT 4
 );
 
 CREATE TABLE torrent_config (
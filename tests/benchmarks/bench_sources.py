@@ -0,0 +1,83 @@
+"""
+Compares how many items per second each source
+parsing path produces.
+
+Run with `just bench` or `python -m tests.benchmarks.bench_sources`.
+"""
+
+import argparse
+from collections.abc import Callable
+import json
+import time
+
+import feedparser
+
+from tsundoku.feeds.rss import parse_rss_items
+from tsundoku.sources import Source
+
+
+def make_rss(count: int) -> bytes:
+    items = "".join(f"<item><title>[Group] Show {i % 50} - {i:02} (1080p) [{i:08X}].mkv</title><link>https://example.com/download/{i}.torrent</link><guid isPermaLink=\"true\">https://example.com/view/{i}</guid><pubDate>Sat, 18 Oct 2025 12:00:00 -0000</pubDate><nyaa:seeders>10</nyaa:seeders><nyaa:leechers>1</nyaa:leechers><nyaa:infoHash>{i:040x}</nyaa:infoHash><nyaa:size>1.4 GiB</nyaa:size><description><![CDATA[<a href='https://example.com/view/{i}'>#{i}</a>]]></description></item>" for i in range(count))
+
+    return f'<?xml version="1.0"?><rss xmlns:nyaa="https://nyaa.si/xmlns/nyaa" version="2.0"><channel><title>Bench</title>{items}</channel></rss>'.encode()
+
+
+def make_json(count: int) -> bytes:
+    releases = [
+        {
+            "id": i,
+            "name": f"[Group] Show {i % 50} - {i:02} (1080p) [{i:08X}].mkv",
+            "hash": f"{i:040x}",
+            "links": {"torrent": f"https://example.com/download/{i}.torrent"},
+            "size": 1503238553,
+            "seeders": 10,
+        }
+        for i in range(count)
+    ]
+
+    return json.dumps({"data": {"releases": releases}}).encode()
+
+
+JSON_SOURCE = Source.from_object(
+    {
+        "name": "Bench JSON",
+        "version": "1.0.0",
+        "url": "https://example.com/api",
+        "type": "json",
+        "itemsPath": "$.data.releases",
+        "jsonItemKeyMapping": {"filename": "$.name", "torrent": "$.links.torrent", "infohash": "$.hash", "guid": "$.id"},
+    }
+)
+
+
+def measure(name: str, func: Callable[[], list], rounds: int) -> None:
+    count = len(func())
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<12} {count * rounds / elapsed:>12,.0f} items/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=75, help="items per document")
+    parser.add_argument("--rounds", type=int, default=200, help="documents parsed per path")
+    args = parser.parse_args()
+
+    rss = make_rss(args.items)
+    document = make_json(args.items)
+
+    json_map = JSON_SOURCE.json_map
+    if json_map is None:
+        raise TypeError("benchmark source is not a JSON source")
+
+    measure("feedparser", lambda: feedparser.parse(rss)["items"], max(args.rounds // 10, 1))
+    measure("rss stream", lambda: parse_rss_items(rss, ("title", "link")), args.rounds)
+    measure("json", lambda: json_map.get_items(document), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from tests.mock import (
     MockTsundokuApp,
     filesystem,
     mock_feedparser_parse,
+    mock_fetch_feed,
     mock_get_all_sources,
 )
 
@@ -17,6 +18,7 @@ async def create_app(
 ) -> AsyncGenerator[MockTsundokuApp, None]:
     monkeypatch.setattr("feedparser.parse", mock_feedparser_parse)
     monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", mock_get_all_sources)
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", mock_fetch_feed)
 
     monkeypatch.setattr("pathlib.Path.symlink_to", filesystem.mock_symlink_to)
     monkeypatch.setattr("pathlib.Path.mkdir", filesystem.mock_mkdir)
@@ -1,13 +1,15 @@
 from .app import MockTsundokuApp, UserType
 from .dl_client import InMemoryDownloadClient, MockDownloadManager
-from .rss_feed import mock_feedparser_parse
+from .rss_feed import NYAA_FEED, mock_feedparser_parse, mock_fetch_feed
 from .sources import mock_get_all_sources
 
 __all__ = (
+    "NYAA_FEED",
     "InMemoryDownloadClient",
     "MockDownloadManager",
     "MockTsundokuApp",
     "UserType",
     "mock_feedparser_parse",
+    "mock_fetch_feed",
     "mock_get_all_sources",
 )
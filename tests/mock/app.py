@@ -19,7 +19,7 @@ from quart_rate_limiter import RateLimiter
 from tsundoku.app import CustomFluentLocalization
 from tsundoku.asqlite import Connection, connect
 from tsundoku.blueprints import api_blueprint, ux_blueprint
-from tsundoku.feeds import Downloader, Poller
+from tsundoku.feeds import Downloader, EpisodeMap, ParseCache, Poller, ShowRuleIndex, WatchedShowIndex
 from tsundoku.flags import Flags
 from tsundoku.user import User
 
@@ -46,6 +46,10 @@ class MockTsundokuApp(Quart):
 
     poller: Poller
     downloader: Downloader
+    show_index: WatchedShowIndex
+    episode_map: EpisodeMap
+    parse_cache: ParseCache
+    show_rules: ShowRuleIndex
 
     flags: Flags
 
@@ -74,6 +78,10 @@ class MockTsundokuApp(Quart):
         self.source_lock = asyncio.Lock()
 
         self.flags = Flags()
+        self.show_index = WatchedShowIndex()
+        self.episode_map = EpisodeMap()
+        self.parse_cache = ParseCache()
+        self.show_rules = ShowRuleIndex()
 
         self.dl_client = MockDownloadManager()
 
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
@@ -32,9 +33,12 @@ MAGNET_RE = re.compile(r"magnet:\?.+btih:([\d\w]+)")
 
 class MockDownloadManager(Manager):
     _client: "InMemoryDownloadClient"
+    file_structures: dict[str, list[str]]
 
     def __init__(self) -> None:
         self._client = InMemoryDownloadClient()
+        self.magnet_cache = OrderedDict()
+        self.file_structures = {}
 
     @property
     def torrents(self) -> list[InMemoryTorrent]:
@@ -53,7 +57,10 @@ class MockDownloadManager(Manager):
         return await super().get_magnet(location)
 
     async def get_file_structure(self, location: str) -> list[str]:
-        raise NotImplementedError()
+        if location not in self.file_structures:
+            raise NotImplementedError()
+
+        return self.file_structures[location]
 
 
 class InMemoryDownloadClient(TorrentClient):
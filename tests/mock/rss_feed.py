@@ -3,6 +3,8 @@ import random
 import string
 from typing import Any, TypedDict, cast
 
+from tsundoku.feeds.poller import FeedResponse
+
 
 class MockRSSFeed(TypedDict):
     items: list["MockRSSFeedItem"]
@@ -13,6 +15,34 @@ class MockRSSFeedItem(TypedDict):
     link: str
 
 
+NYAA_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:nyaa="https://nyaa.si/xmlns/nyaa" version="2.0">
+  <channel>
+    <title>Nyaa - Home - Torrent File RSS</title>
+    <link>https://nyaa.si/</link>
+    <item>
+      <title>[SubsPlease] Show A - 02 (1080p) [AAAA0002].mkv</title>
+      <link>https://nyaa.si/download/3.torrent</link>
+      <guid isPermaLink="true">https://nyaa.si/view/3</guid>
+      <nyaa:infoHash>cccccccccccccccccccccccccccccccccccccccc</nyaa:infoHash>
+    </item>
+    <item>
+      <title>[SubsPlease] Show B - 05 (1080p) [BBBB0005].mkv</title>
+      <link>https://nyaa.si/download/2.torrent</link>
+      <guid isPermaLink="true">https://nyaa.si/view/2</guid>
+      <nyaa:infoHash>bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb</nyaa:infoHash>
+    </item>
+    <item>
+      <title>[SubsPlease] Show A - 01 (1080p) [AAAA0001].mkv</title>
+      <link>https://nyaa.si/download/1.torrent</link>
+      <guid isPermaLink="true">https://nyaa.si/view/1</guid>
+      <nyaa:infoHash>aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa</nyaa:infoHash>
+    </item>
+  </channel>
+</rss>
+"""
+
+
 BASE32_CHARSET = string.ascii_letters + "234567"
 
 
@@ -25,3 +55,7 @@ def mock_feedparser_parse(*_: Any, **__: Any) -> MockRSSFeed:
         titles = [line.strip() for line in fd if line]
 
     return cast(MockRSSFeed, {"items": [{"title": title, "link": generate_fake_magnet()} for title in titles]})
+
+
+async def mock_fetch_feed(*_: Any, **__: Any) -> FeedResponse:
+    return FeedResponse(200, None, None, b"")
@@ -0,0 +1,21 @@
+from tsundoku.feeds.breaker import BASE_BACKOFF, FAILURE_THRESHOLD, CircuitBreaker
+
+
+def test_breaker_opens_after_repeated_failures() -> None:
+    breaker = CircuitBreaker()
+
+    for _ in range(FAILURE_THRESHOLD - 1):
+        assert breaker.record_failure(0.0, "timeout") is None
+    assert breaker.state(0.0) == "closed"
+
+    assert breaker.record_failure(0.0, "timeout") == BASE_BACKOFF
+    assert not breaker.allow(1.0)
+    assert breaker.state(1.0) == "open"
+
+    # A failed trial fetch doubles the backoff.
+    assert breaker.state(BASE_BACKOFF) == "half-open"
+    assert breaker.record_failure(BASE_BACKOFF, "timeout") == BASE_BACKOFF * 2
+
+    breaker.record_success()
+    assert breaker.state(BASE_BACKOFF) == "closed"
+    assert breaker.failures == 0
@@ -0,0 +1,46 @@
+from typing import Any
+
+import bencodepy
+import pytest
+
+from tests.mock import MockTsundokuApp
+from tsundoku.dl_client import Manager
+
+TORRENT = bencodepy.encode({b"announce": b"http://tracker.example/announce", b"info": {b"name": b"Show - 01.mkv", b"length": 1, b"piece length": 1, b"pieces": b""}})
+
+
+class FakeResponse:
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None: ...
+
+    async def read(self) -> bytes:
+        return TORRENT
+
+
+class FakeSession:
+    requests: list[str]
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    def get(self, location: str, **_: Any) -> FakeResponse:
+        self.requests.append(location)
+        return FakeResponse()
+
+
+async def test_torrent_magnets_are_cached(app: MockTsundokuApp, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("tsundoku.dl_client.client.MAX_CACHED_MAGNETS", 1)
+
+    session = FakeSession()
+    manager = Manager(app.app_context(), session)  # type: ignore
+
+    first = await manager.get_magnet("https://example.com/1.torrent")
+    assert first.startswith("magnet:?xt=urn:btih:")
+    assert await manager.get_magnet("https://example.com/1.torrent") == first
+    assert len(session.requests) == 1
+
+    await manager.get_magnet("https://example.com/2.torrent")
+    await manager.get_magnet("https://example.com/1.torrent")
+    assert len(session.requests) == 3
@@ -0,0 +1,45 @@
+import logging
+
+import pytest
+
+from tests.mock import MockTsundokuApp
+from tsundoku.feeds import ParseCache
+
+
+def test_lru_evicts_oldest() -> None:
+    cache = ParseCache(maxsize=2)
+    cache.parse("[SubsPlease] Frieren - 01 (1080p) [AAAAAAAA].mkv")
+    cache.parse("[SubsPlease] Frieren - 02 (1080p) [AAAAAAAA].mkv")
+    cache.parse("[SubsPlease] Frieren - 03 (1080p) [AAAAAAAA].mkv")
+
+    assert "[SubsPlease] Frieren - 01 (1080p) [AAAAAAAA].mkv" not in cache
+    assert cache.stats.size == 2
+    assert cache.stats.misses == 3
+
+
+async def test_repeated_poll_hits_cache(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    await app.poller.poll()
+    misses = app.parse_cache.stats.misses
+
+    await app.poller.poll(force=True)
+
+    assert misses > 0
+    assert app.parse_cache.stats.misses == misses
+    assert app.parse_cache.stats.hits >= misses
+
+
+async def test_results_persisted(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    title = "[SubsPlease] Frieren - 01 (1080p) [AAAAAAAA].mkv"
+    expected = app.parse_cache.parse(title)
+    await app.parse_cache.flush(app)  # type: ignore
+
+    restarted = ParseCache()
+    await restarted.preload(app, [title])  # type: ignore
+
+    assert restarted.stats.persistent_hits == 1
+    assert restarted.parse(title) == expected
+    assert restarted.stats.misses == 0
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+
+import pytest
+
+from tsundoku.feeds.pipeline import Pipeline
+
+
+async def test_pipeline_passes_outputs_between_stages() -> None:
+    async def split(value: int) -> list[int]:
+        return [value, value + 100]
+
+    async def double(value: int) -> list[int]:
+        return [value * 2]
+
+    pipeline = Pipeline(queue_size=1)
+    pipeline.add_stage("split", 2, split)
+    pipeline.add_stage("double", 3, double)
+
+    results = await pipeline.run(range(5))
+
+    assert sorted(results) == sorted([value * 2 for value in range(5)] + [(value + 100) * 2 for value in range(5)])
+    assert [stats.processed for stats in pipeline.stats] == [5, 10]
+
+
+async def test_slow_stage_does_not_block_upstream() -> None:
+    all_parsed = asyncio.Event()
+    parsed = []
+
+    async def parse(value: int) -> list[int]:
+        parsed.append(value)
+        if len(parsed) == 3:
+            all_parsed.set()
+        return [value]
+
+    async def handle(value: int) -> list[int]:
+        # The first input is only handled once every input was parsed.
+        if value == 0:
+            await all_parsed.wait()
+        return [value]
+
+    pipeline = Pipeline(queue_size=4)
+    pipeline.add_stage("parse", 1, parse)
+    pipeline.add_stage("handle", 1, handle)
+
+    results = await asyncio.wait_for(pipeline.run(range(3)), timeout=1)
+
+    assert results == [0, 1, 2]
+
+
+async def test_failing_input_is_dropped(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    async def check(value: int) -> list[int]:
+        if value == 1:
+            raise ValueError(value)
+        return [value]
+
+    pipeline = Pipeline(queue_size=1)
+    pipeline.add_stage("check", 1, check)
+
+    assert await pipeline.run(range(3)) == [0, 2]
@@ -1,8 +1,26 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import json
 import logging
+from pathlib import Path
+from typing import Any
 
 import pytest
 
-from tests.mock import MockTsundokuApp
+from tests.mock import NYAA_FEED, MockTsundokuApp, mock_feedparser_parse
+from tests.mock.sources import MOCK_SOURCE
+from tsundoku.config import FeedsConfig
+from tsundoku.feeds.breaker import FAILURE_THRESHOLD
+from tsundoku.feeds.cache import SeenItems, SourceSchedule
+from tsundoku.feeds.poller import MAX_CONCURRENT_MAGNET_RESOLUTIONS, FeedResponse, Poller
+from tsundoku.manager import Show
+from tsundoku.sources import Source
+
+
+def load_default_source(name: str) -> Source:
+    return Source.from_object(json.loads(Path(f"default_sources/{name}.json").read_text(encoding="utf-8")))
 
 
 async def test_all_found_are_managed(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
@@ -64,3 +82,601 @@ async def test_rss_force_poll(app: MockTsundokuApp, caplog: pytest.LogCaptureFix
 
     assert len(found) > 0
     assert len(found) == len(found_after)
+
+
+async def test_sources_fetched_concurrently(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async def many_sources() -> AsyncGenerator[Source, None]:
+        for i in range(3):
+            yield Source.from_object({**json.loads(MOCK_SOURCE), "name": f"Mock Source {i}"})
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_fetch_feed(*_: Any, **__: Any) -> FeedResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return FeedResponse(200, None, None, b"")
+
+    monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", many_sources)
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", slow_fetch_feed)
+
+    await app.poller.poll()
+
+    assert max_in_flight == 3
+
+
+async def test_configured_stage_concurrency(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async def many_sources() -> AsyncGenerator[Source, None]:
+        for i in range(3):
+            yield Source.from_object({**json.loads(MOCK_SOURCE), "name": f"Mock Source {i}"})
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_fetch_feed(*_: Any, **__: Any) -> FeedResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return FeedResponse(200, None, None, b"")
+
+    monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", many_sources)
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", slow_fetch_feed)
+
+    cfg = await FeedsConfig.retrieve(app)  # type: ignore
+    cfg.fetch_concurrency = 1
+    cfg.parse_concurrency = 2
+    await cfg.save()
+    await app.poller.update_config()
+
+    await app.poller.poll()
+
+    workers = {stats.name: stats.workers for stats in app.poller.stage_stats}
+    assert max_in_flight == 1
+    assert workers["fetch"] == 1
+    assert workers["parse"] == 2
+    assert workers["match"] == 1
+
+
+async def test_show_index_invalidated_on_update(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    await app.show_index.ensure_loaded(app)  # type: ignore
+    assert app.show_index.get_by_id(1) is not None
+
+    show = await Show.from_id(app, 1, lazy_metadata=True)  # type: ignore
+    show.watch = False
+    await show.update()
+
+    found = await app.poller.poll()
+
+    assert app.show_index.get_by_id(1) is None
+    assert all(entry.show_id != 1 for entry in found)
+
+
+async def test_force_poll_skips_existing_entries(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    found = await app.poller.poll()
+    found_after = await app.poller.poll(force=True)
+
+    assert len(found) > 0
+    assert len(found_after) == 0
+    for entry in found:
+        assert app.episode_map.get(entry.show_id, entry.episode) is not None
+
+
+async def test_episode_map_keeps_highest_version(app: MockTsundokuApp) -> None:
+    async with app.acquire_db() as con:
+        await con.execute("DELETE FROM show_entry;")
+        await con.executemany(
+            """
+            INSERT INTO
+                show_entry (show_id, episode, version, torrent_hash, created_manually)
+            VALUES
+                (1, 1, ?, 'hash', ?);
+            """,
+            [("v9", False), ("v10", True), ("v2", False)],
+        )
+
+    await app.episode_map.load(app)  # type: ignore
+
+    entry = app.episode_map.get(1, 1)
+    assert entry is not None
+    assert entry.version == "v10"
+    assert entry.created_manually
+
+
+async def test_rss_cache_persisted(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    found = await app.poller.poll()
+
+    async with app.acquire_db() as con:
+        await con.execute("DELETE FROM show_entry;")
+
+    restarted = Poller(app.app_context())
+    await restarted.update_config()
+    await restarted.load_rss_cache()
+    found_after = await restarted.poll()
+
+    assert len(found) > 0
+    assert len(found_after) == 0
+
+
+async def test_rss_top_item_removed(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    feed = mock_feedparser_parse()
+    monkeypatch.setattr("feedparser.parse", lambda *_, **__: feed)
+    found = await app.poller.poll()
+
+    async with app.acquire_db() as con:
+        await con.execute("DELETE FROM show_entry;")
+
+    monkeypatch.setattr("feedparser.parse", lambda *_, **__: {"items": feed["items"][1:]})
+    found_after = await app.poller.poll()
+
+    assert len(found) > 0
+    assert len(found_after) == 0
+
+
+def test_seen_items_bounded() -> None:
+    seen = SeenItems(maxlen=3)
+    for key in ("a", "b", "c", "d"):
+        seen.add(key)
+
+    assert len(seen) == 3
+    assert "a" not in seen
+    assert "d" in seen
+    assert SeenItems.deserialize(seen.serialize()).serialize() == "b c d"
+
+
+async def test_poll_with_parse_workers(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    cfg = await FeedsConfig.retrieve(app)  # type: ignore
+    cfg.parse_workers = 1
+    await cfg.save()
+    await app.poller.update_config()
+
+    try:
+        found = await app.poller.poll()
+    finally:
+        app.poller.shutdown_parse_executor()
+
+    assert len(found) > 0
+    assert app.parse_cache.stats.misses > 0
+    assert app.parse_cache.stats.hits >= app.parse_cache.stats.misses
+
+
+async def test_broken_parse_workers_replaced(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    class BrokenExecutor(ProcessPoolExecutor):
+        def submit(self, *_: Any, **__: Any) -> Any:
+            raise BrokenProcessPool
+
+    app.poller.parse_workers = 1
+    app.poller.parse_executor = BrokenExecutor(max_workers=1)
+
+    try:
+        await app.poller.parse_in_batch(["[SubsPlease] Kimetsu no Yaiba - 01 (1080p).mkv"])
+        replaced = app.poller.parse_executor
+    finally:
+        app.poller.shutdown_parse_executor()
+
+    assert "[SubsPlease] Kimetsu no Yaiba - 01 (1080p).mkv" in app.parse_cache
+    assert replaced is not None
+    assert not isinstance(replaced, BrokenExecutor)
+
+
+def test_source_schedule_adapts() -> None:
+    schedule = SourceSchedule(900.0)
+
+    # 10 new items in 900 seconds, one is expected every 300 seconds.
+    schedule.record(10, 900.0, 60, 3600)
+    assert schedule.new_item_rate == pytest.approx(0.3 * 10 / 900)
+    assert schedule.interval == pytest.approx(300)
+    assert schedule.next_poll_at == pytest.approx(1200)
+
+    interval = schedule.interval
+    schedule.record(0, 1200.0, 60, 3600)
+    assert schedule.idle_polls == 1
+    assert schedule.interval > interval
+
+    for now in range(2, 12):
+        schedule.record(0, 1200.0 + now * 3600, 60, 3600)
+    assert schedule.interval == 3600
+    assert schedule.idle_polls == 11
+
+
+def test_source_schedule_failures_are_not_idle() -> None:
+    schedule = SourceSchedule(900.0)
+    schedule.record(10, 900.0, 60, 3600)
+    interval = schedule.interval
+
+    schedule.record_failure(1000.0)
+    schedule.record_failure(1100.0)
+
+    assert schedule.idle_polls == 0
+    assert schedule.failed_polls == 2
+    assert schedule.interval == interval
+    assert schedule.next_poll_at == 1100.0 + interval
+
+
+async def test_adaptive_poll_skips_sources_not_due(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    cfg = await FeedsConfig.retrieve(app)  # type: ignore
+    cfg.min_polling_interval = 300
+    cfg.max_polling_interval = 3600
+    await cfg.save()
+    await app.poller.update_config()
+
+    assert app.poller.is_adaptive
+
+    found = await app.poller.poll(due_only=True)
+
+    async with app.acquire_db() as con:
+        await con.execute("DELETE FROM show_entry;")
+
+    app.poller.reset_rss_cache()
+    found_after = await app.poller.poll(due_only=True)
+
+    assert len(found) > 0
+    assert len(found_after) == 0
+    assert app.poller.seconds_until_next_poll() > 0
+
+
+async def test_removed_source_schedule_dropped(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    cfg = await FeedsConfig.retrieve(app)  # type: ignore
+    cfg.min_polling_interval = 300
+    cfg.max_polling_interval = 3600
+    await cfg.save()
+    await app.poller.update_config()
+
+    app.poller.source_schedule["removed"] = SourceSchedule(900.0)
+    await app.poller.poll(due_only=True)
+
+    assert "removed" not in app.poller.source_schedule
+    assert app.poller.seconds_until_next_poll() > 0
+
+
+async def test_poll_uses_streaming_parser(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async def fetch_nyaa_feed(*_: Any, **__: Any) -> FeedResponse:
+        return FeedResponse(200, None, None, NYAA_FEED)
+
+    def fail(*_: Any, **__: Any) -> None:
+        raise AssertionError("feedparser should not be used for RSS 2.0 feeds")
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", fetch_nyaa_feed)
+    monkeypatch.setattr("feedparser.parse", fail)
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    items = await app.poller.get_items_from_source(source)
+    items_after = await app.poller.get_items_from_source(source)
+
+    assert len(items) == 3
+    assert len(items_after) == 0
+
+
+def _make_page(ids: list[int]) -> bytes:
+    items = "".join(f"<item><title>Release {id_}</title><link>magnet:?xt=urn:btih:{id_:040}</link><guid>{id_}</guid></item>" for id_ in ids)
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+async def test_catch_up_pages_until_seen_item(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    pages = {1: [10, 9, 8], 2: [7, 6, 5], 3: [4, 3], 4: [2, 1]}
+    fetched = []
+
+    async def fetch_page(_: Poller, __: Source, ___: dict[str, str], page: int = 1) -> FeedResponse:
+        fetched.append(page)
+        return FeedResponse(200, None, None, _make_page(pages.get(page, [])))
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", fetch_page)
+
+    definition = json.loads(MOCK_SOURCE)
+    definition["pageParameter"] = "p"
+    source = Source.from_object(definition)
+
+    app.poller.catch_up_depth = 5
+    app.poller.source_cache[source.name].seen_items.add(app.poller.get_item_key({"id": "3"}))
+
+    items = await app.poller.get_items_from_source(source)
+
+    assert [item["id"] for item in items] == ["10", "9", "8", "7", "6", "5", "4"]
+    assert sorted(fetched) == [1, 2, 3]
+
+
+async def test_catch_up_keeps_items_when_page_fails(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    pages = {1: [10, 9, 8], 3: [4, 3]}
+
+    async def fetch_page(_: Poller, __: Source, headers: dict[str, str], page: int = 1) -> FeedResponse:
+        if headers.get("If-None-Match") == "v1":
+            return FeedResponse(304, None, None, b"")
+        if page == 2:
+            raise TimeoutError
+
+        return FeedResponse(200, "v1", None, _make_page(pages.get(page, [])))
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", fetch_page)
+
+    definition = json.loads(MOCK_SOURCE)
+    definition["pageParameter"] = "p"
+    source = Source.from_object(definition)
+
+    app.poller.catch_up_depth = 5
+    app.poller.source_cache[source.name].seen_items.add(app.poller.get_item_key({"id": "1"}))
+
+    items = await app.poller.get_items_from_source(source)
+
+    assert [item["id"] for item in items] == ["10", "9", "8", "4", "3"]
+    assert app.poller.source_cache[source.name].last_etag == "v1"
+    assert await app.poller.get_items_from_source(source) == []
+
+
+async def test_failed_parse_keeps_previous_validators(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    async def fetch_feed(*_: Any, **__: Any) -> FeedResponse:
+        return FeedResponse(200, "v2", None, b"")
+
+    def fail(*_: Any, **__: Any) -> None:
+        raise ValueError
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", fetch_feed)
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.parse_feed", fail)
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    app.poller.source_cache[source.name].last_etag = "v1"
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await app.poller.get_items_from_source(source)
+
+    assert app.poller.source_cache[source.name].last_etag == "v1"
+
+
+async def test_concurrent_polls_are_coalesced(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    calls = []
+
+    async def counting_fetch(*_: Any, **__: Any) -> FeedResponse:
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return FeedResponse(200, None, None, b"")
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", counting_fetch)
+
+    first, second = await asyncio.gather(app.poller.poll(), app.poller.poll())
+    assert first is second
+    assert len(calls) == 1
+
+    calls.clear()
+    results = await asyncio.gather(app.poller.poll(), app.poller.poll(force=True), app.poller.poll(force=True))
+    assert results[1] is results[2]
+    assert len(calls) == 2
+
+
+async def test_magnets_resolved_concurrently(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    resolve_magnet = app.dl_client.get_magnet
+    in_flight = 0
+    peak = 0
+
+    async def slow_get_magnet(location: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await resolve_magnet(location)
+
+    monkeypatch.setattr(app.dl_client, "get_magnet", slow_get_magnet)
+
+    found = await app.poller.poll()
+
+    assert len(found) > 1
+    assert 1 < peak <= MAX_CONCURRENT_MAGNET_RESOLUTIONS
+
+
+async def test_failing_source_is_skipped(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    calls = []
+
+    async def failing_fetch(*_: Any, **__: Any) -> FeedResponse:
+        calls.append(None)
+        return FeedResponse(503, None, None, b"")
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", failing_fetch)
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    for _ in range(FAILURE_THRESHOLD + 2):
+        assert await app.poller.fetch_items_from_source(source) == []
+
+    assert len(calls) == FAILURE_THRESHOLD
+    assert app.poller.source_breaker[source.name].state(app.poller.loop.time()) == "open"
+
+
+async def test_poll_records_stage_stats(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    found = await app.poller.poll()
+
+    stats = {stats.name: stats for stats in app.poller.stage_stats}
+    assert list(stats) == ["fetch", "dedupe", "parse", "match", "resolve", "handle"]
+    assert stats["fetch"].processed == 1
+    assert stats["handle"].processed == len(found)
+
+
+async def test_targeted_polling_searches_each_show(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async def sources() -> AsyncGenerator[Source, None]:
+        yield Source.from_object({**json.loads(MOCK_SOURCE), "name": "Nyaa.si", "url": "https://nyaa.si/?page=rss&c=1_2"})
+        yield Source.from_object(json.loads(MOCK_SOURCE))
+
+    urls = []
+
+    async def recording_fetch(_: Poller, source: Source, *__: Any, **___: Any) -> FeedResponse:
+        urls.append(source.url)
+        return FeedResponse(200, None, None, b"")
+
+    monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", sources)
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", recording_fetch)
+
+    cfg = await FeedsConfig.retrieve(app)  # type: ignore
+    cfg.polling_mode = "targeted"
+    await cfg.save()
+    await app.poller.update_config()
+
+    await app.poller.poll()
+
+    await app.show_index.ensure_loaded(app)  # type: ignore
+    search_urls = [url for url in urls if "&q=" in url]
+    assert len(search_urls) == len(app.show_index.titles) > 0
+    assert "https://nyaa.si/?page=rss&c=1_2" not in urls
+    assert "https://mock.com/rss/" in urls
+
+
+async def test_duplicate_releases_across_sources_checked_once(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    title = "[SubsPlease] Sousou no Frieren - 05 (1080p) [ABCD1234].mkv"
+    feeds = {
+        # Nyaa lists the infohash, Tokyo Toshokan only links a torrent file.
+        "Nyaa.si": f'<rss version="2.0" xmlns:nyaa="https://nyaa.si/xmlns/nyaa"><channel><item><title>{title}</title><link>https://nyaa.si/download/1.torrent</link><guid>https://nyaa.si/view/1</guid><nyaa:infohash>{"ab" * 20}</nyaa:infohash></item></channel></rss>',
+        "Tokyo Toshokan": f'<rss version="2.0"><channel><item><title>{title}</title><link>https://www.tokyotosho.info/1.torrent</link><guid>https://www.tokyotosho.info/details.php?id=1</guid></item></channel></rss>',
+    }
+
+    async def sources() -> AsyncGenerator[Source, None]:
+        yield load_default_source("nyaa")
+        yield load_default_source("tokyotosho")
+
+    async def fetch_feed(_: Poller, source: Source, *__: Any, **___: Any) -> FeedResponse:
+        return FeedResponse(200, None, None, feeds[source.name].encode())
+
+    monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", sources)
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", fetch_feed)
+
+    checked = []
+    check_item = Poller.check_item
+
+    async def recording_check_item(self: Poller, source: Source, item: dict, *args: Any) -> Any:
+        checked.append(source.get_filename(item))
+        return await check_item(self, source, item, *args)
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.check_item", recording_check_item)
+
+    await app.poller.poll()
+
+    assert checked == [title]
+
+
+async def test_invalid_item_does_not_drop_feed(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    feed = mock_feedparser_parse()
+    monkeypatch.setattr("feedparser.parse", lambda *_, **__: {"items": [{"guid": "missing-fields"}, *feed["items"]]})
+
+    found = await app.poller.poll()
+
+    assert len(found) > 0
+
+
+async def test_untitled_item_does_not_drop_feed(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    feed = mock_feedparser_parse()
+    untitled = {"link": f"magnet:?xt=urn:btih:{'a' * 40}"}
+    monkeypatch.setattr("feedparser.parse", lambda *_, **__: {"items": [untitled, *feed["items"]]})
+
+    found = await app.poller.poll()
+
+    assert len(found) > 0
+
+
+async def test_infohash_mapping_skips_torrent_download(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async def no_download(*_: Any, **__: Any) -> str:
+        raise AssertionError("torrent file should not be downloaded")
+
+    monkeypatch.setattr(app.dl_client, "get_magnet", no_download)
+
+    definition = json.loads(MOCK_SOURCE)
+    definition["rssItemKeyMapping"]["infohash"] = "$.nyaa_infohash"
+    source = Source.from_object(definition)
+
+    item = {"title": "Show - 01.mkv", "link": "https://mock.com/1.torrent", "nyaa_infohash": "abcdef0123456789abcdef0123456789abcdef01"}
+    magnet = await app.poller.get_torrent_link(source, item)
+
+    assert magnet.startswith("magnet:?xt=urn:btih:abcdef0123456789abcdef0123456789abcdef01")
+    assert "btih:abcdef0123456789abcdef0123456789abcdef01" in app.poller.get_release_keys(source, item)
+
+
+async def test_batch_backfill_adds_one_torrent(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    link = "magnet:?xt=urn:btih:abcdef0123456789abcdef0123456789abcdef01&dn=Chainsaw+Man"
+    item = {"title": "[SubsPlease] Chainsaw Man (01-12) (1080p) [Batch]", "link": link}
+
+    assert await app.poller.check_feed(source, [item]) == []
+
+    app.poller.batch_backfill = True
+    found = await app.poller.check_feed(source, [item])
+
+    assert sorted(entry.episode for entry in found) == list(range(1, 13))
+    assert len(app.dl_client.torrents) == 1
+
+    checks = []
+    check_torrent_completed = app.dl_client.check_torrent_completed
+
+    async def counting_check(torrent_id: str) -> bool:
+        checks.append(torrent_id)
+        return await check_torrent_completed(torrent_id)
+
+    monkeypatch.setattr(app.dl_client, "check_torrent_completed", counting_check)
+    await app.downloader.check_show_entries()
+
+    assert checks == [app.dl_client.torrents[0].torrent_id]
+
+
+async def test_batch_without_range_lists_files(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async def get_magnet(_: str) -> str:
+        return "magnet:?xt=urn:btih:abcdef0123456789abcdef0123456789abcdef01"
+
+    monkeypatch.setattr(app.dl_client, "get_magnet", get_magnet)
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    link = "https://nyaa.si/download/1.torrent"
+    item = {"title": "[SubsPlease] Chainsaw Man (1080p) [Batch]", "link": link}
+    app.dl_client.file_structures[link] = [f"[SubsPlease] Chainsaw Man - {episode:02} (1080p).mkv" for episode in range(1, 4)]
+
+    app.poller.batch_backfill = True
+    found = await app.poller.check_feed(source, [item])
+
+    assert sorted(entry.episode for entry in found) == [1, 2, 3]
+    assert len(app.dl_client.torrents) == 1
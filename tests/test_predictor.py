@@ -0,0 +1,79 @@
+from datetime import UTC, datetime, timedelta
+import logging
+
+import pytest
+
+from tests.mock import MockTsundokuApp
+from tsundoku.feeds.predictor import MIN_HALF_WIDTH, ReleasePredictor, learn_window
+
+# A Saturday at 15:30 UTC.
+FIRST_RELEASE = datetime(2025, 10, 4, 15, 30, tzinfo=UTC)
+
+
+def test_weekly_releases_learn_a_window() -> None:
+    arrivals = [FIRST_RELEASE + timedelta(weeks=week, minutes=week % 3) for week in range(5)]
+
+    window = learn_window(1, arrivals)
+
+    assert window is not None
+    assert window.half_width == MIN_HALF_WIDTH
+    assert window.minutes_until(5 * 24 * 60 + 15 * 60 + 31) == 0
+    assert window.minutes_until(5 * 24 * 60 + 14 * 60) == pytest.approx(60, abs=2)
+
+
+def test_irregular_releases_learn_no_window() -> None:
+    arrivals = [FIRST_RELEASE + timedelta(days=3 * release, hours=5 * release) for release in range(5)]
+
+    assert learn_window(1, arrivals) is None
+    assert learn_window(1, arrivals[:2]) is None
+
+
+async def test_predictor_learns_from_entries(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async with app.acquire_db() as con:
+        await con.execute("DELETE FROM show_entry;")
+        for episode in range(1, 5):
+            arrived_at = FIRST_RELEASE + timedelta(weeks=episode)
+            await con.execute(
+                """
+                INSERT INTO
+                    show_entry (show_id, episode, torrent_hash, created_at)
+                VALUES
+                    (1, ?, 'hash', ?);
+                """,
+                episode,
+                arrived_at.strftime("%Y-%m-%d %H:%M:%S"),
+            )
+
+    predictor = ReleasePredictor()
+    await predictor.refresh(app)  # type: ignore
+
+    assert [window.show_id for window in predictor.windows] == [1]
+    assert [window.show_id for window in predictor.active_windows(FIRST_RELEASE + timedelta(weeks=6))] == [1]
+    assert predictor.seconds_until_next_window(FIRST_RELEASE - timedelta(hours=2)) == pytest.approx(90 * 60, abs=60)
+
+
+async def test_predictor_ignores_unwatched_shows(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    async with app.acquire_db() as con:
+        await con.execute("DELETE FROM show_entry;")
+        await con.execute("UPDATE shows SET watch = 0 WHERE id = 1;")
+        for episode in range(1, 5):
+            arrived_at = FIRST_RELEASE + timedelta(weeks=episode)
+            await con.execute(
+                """
+                INSERT INTO
+                    show_entry (show_id, episode, torrent_hash, created_at)
+                VALUES
+                    (1, ?, 'hash', ?);
+                """,
+                episode,
+                arrived_at.strftime("%Y-%m-%d %H:%M:%S"),
+            )
+
+    predictor = ReleasePredictor()
+    await predictor.refresh(app)  # type: ignore
+
+    assert predictor.windows == []
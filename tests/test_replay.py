@@ -0,0 +1,95 @@
+import json
+import logging
+from pathlib import Path
+import sqlite3
+from xml.sax.saxutils import escape
+
+import pytest
+
+from tests.mock import mock_get_all_sources
+from tests.mock.sources import MOCK_SOURCE
+from tsundoku.feeds.poller import FeedResponse
+from tsundoku.feeds.recorder import FeedRecorder, load_recordings
+from tsundoku.feeds.replay import replay
+from tsundoku.sources import Source
+
+
+def build_feed() -> bytes:
+    titles = [line.strip() for line in Path("tests/mock/_rss_item_titles.txt").read_text(encoding="utf-8").splitlines() if line.strip()]
+    items = "".join(f"<item><title>{escape(title)}</title><link>https://mock.com/{i}.torrent</link><guid>https://mock.com/view/{i}</guid></item>" for i, title in enumerate(titles))
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Mock</title>{items}</channel></rss>'.encode()
+
+
+def create_database(path: Path) -> None:
+    con = sqlite3.connect(path)
+    try:
+        con.executescript(Path("schema.sql").read_text(encoding="utf-8"))
+        con.executescript(Path("tests/mock/_data.sql").read_text(encoding="utf-8"))
+        con.commit()
+    finally:
+        con.close()
+
+
+def test_recordings_round_trip(tmp_path: Path) -> None:
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    recorder = FeedRecorder(tmp_path)
+
+    recorder.record(source, 1, {"Accept-Encoding": "gzip"}, FeedResponse(200, '"a"', None, b"first"))
+    recorder.record(source, 2, {}, FeedResponse(304, None, "yesterday", b""))
+
+    recordings = load_recordings(tmp_path)[source.name]
+
+    assert [(r.page, r.status, r.body) for r in recordings] == [(1, 200, b"first"), (2, 304, b"")]
+    assert recordings[0].request_headers == {"Accept-Encoding": "gzip"}
+    assert recordings[0].etag == '"a"'
+    assert recordings[1].last_modified == "yesterday"
+
+
+async def test_replay_reports_matches(tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+    monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", mock_get_all_sources)
+
+    database = tmp_path / "tsundoku.db"
+    create_database(database)
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    recorder = FeedRecorder(tmp_path / "recordings")
+    feed = build_feed()
+    recorder.record(source, 1, {}, FeedResponse(200, None, None, feed))
+    recorder.record(source, 1, {}, FeedResponse(200, None, None, feed))
+
+    report = await replay(tmp_path / "recordings", database)
+
+    assert report.polls == 2
+    assert report.items > 0
+    assert report.matches > 0
+    assert report.torrents == report.matches
+    assert report.stages["match"].processed == 1
+
+    con = sqlite3.connect(database)
+    try:
+        assert con.execute("SELECT COUNT(*) FROM show_entry;").fetchone()[0] == 0
+    finally:
+        con.close()
+
+
+async def test_replay_does_not_share_sources(tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+    monkeypatch.setattr("tsundoku.feeds.poller.get_all_sources", mock_get_all_sources)
+    monkeypatch.setattr("tsundoku.feeds.poller.SHARED_DB_PATH", tmp_path / "shared.db")
+
+    database = tmp_path / "tsundoku.db"
+    create_database(database)
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    FeedRecorder(tmp_path / "recordings").record(source, 1, {}, FeedResponse(200, None, None, build_feed()))
+
+    report = await replay(tmp_path / "recordings", database)
+
+    assert report.matches > 0
+    assert not (tmp_path / "shared.db").exists()
+
+
+async def test_replay_without_recordings(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="No recordings"):
+        await replay(tmp_path, tmp_path / "tsundoku.db")
@@ -0,0 +1,38 @@
+import feedparser
+import pytest
+
+from tests.mock import NYAA_FEED
+from tsundoku.feeds.rss import UnsupportedFeedError, parse_rss_items
+
+
+def test_streaming_matches_feedparser() -> None:
+    items = parse_rss_items(NYAA_FEED, ("title", "link"))
+    expected = feedparser.parse(NYAA_FEED)["items"]
+
+    assert len(items) == len(expected)
+    for item, reference in zip(items, expected, strict=True):
+        for key in ("title", "link", "id", "nyaa_infohash"):
+            assert item[key] == reference[key]
+
+
+def test_streaming_stops_at_seen_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("tsundoku.feeds.rss.EARLY_EXIT_SEEN_RUN", 1)
+
+    items = parse_rss_items(NYAA_FEED, ("title", "link"), lambda item: item["id"].endswith("/2"))
+
+    assert [item["id"] for item in items] == ["https://nyaa.si/view/3", "https://nyaa.si/view/2"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b'<feed xmlns="http://www.w3.org/2005/Atom"></feed>',
+        NYAA_FEED[: len(NYAA_FEED) // 2],
+        NYAA_FEED.replace(b"<link>", b"<enclosure>").replace(b"</link>", b"</enclosure>"),
+    ],
+    ids=["empty", "atom", "truncated", "missing-field"],
+)
+def test_streaming_rejects_unsupported_feeds(body: bytes) -> None:
+    with pytest.raises(UnsupportedFeedError):
+        parse_rss_items(body, ("title", "link"))
@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+
+from tests.mock import MockTsundokuApp
+from tsundoku.manager import SeenRelease
+from tsundoku.utils import parse_anime_title
+
+
+async def test_add_many_keeps_highest_version(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    v1 = parse_anime_title("[SubsPlease] Frieren - 05v1 (1080p) [AAAAAAAA].mkv")
+    v2 = parse_anime_title("[SubsPlease] Frieren - 05v2 (1080p) [BBBBBBBB].mkv")
+    unversioned = parse_anime_title("[SubsPlease] Frieren - 05 (1080p) [CCCCCCCC].mkv")
+
+    await SeenRelease.add_many(app, [(v1, "v1"), (v2, "v2"), (unversioned, "v0")])  # type: ignore
+
+    releases = await SeenRelease.filter(app, title="Frieren", episode=5)  # type: ignore
+
+    assert len(releases) == 1
+    assert releases[0].torrent_destination == "v2"
+
+
+async def test_add_many_skips_invalid(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    no_group = parse_anime_title("Frieren - 06 (1080p).mkv")
+
+    await SeenRelease.add_many(app, [(no_group, "magnet")])  # type: ignore
+
+    assert await SeenRelease.filter(app, title="Frieren") == []  # type: ignore
+
+
+async def test_add_many_compares_dotted_versions(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    parsed = parse_anime_title("[SubsPlease] Frieren - 07 (1080p) [DDDDDDDD].mkv")
+    newer = {**parsed, "release_version": "v1.10"}
+    older = {**parsed, "release_version": "v1.9"}
+
+    await SeenRelease.add_many(app, [(newer, "newer"), (older, "older")])  # type: ignore
+
+    releases = await SeenRelease.filter(app, title="Frieren", episode=7)  # type: ignore
+
+    assert len(releases) == 1
+    assert releases[0].torrent_destination == "newer"
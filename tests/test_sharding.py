@@ -0,0 +1,106 @@
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests.mock import MockTsundokuApp, mock_feedparser_parse
+from tests.mock.sources import MOCK_SOURCE
+from tsundoku.feeds.poller import FeedResponse
+from tsundoku.feeds.sharding import SharedSources
+from tsundoku.sources import Source
+
+
+async def test_lease_held_by_one_instance(tmp_path: Path) -> None:
+    first = SharedSources(tmp_path / "shared.db", owner="first")
+    second = SharedSources(tmp_path / "shared.db", owner="second")
+
+    assert await first.acquire("nyaa")
+    assert not await second.acquire("nyaa")
+    assert await first.acquire("nyaa")
+    assert first.holds("nyaa")
+    assert not second.holds("nyaa")
+
+
+async def test_expired_lease_taken_over(tmp_path: Path) -> None:
+    first = SharedSources(tmp_path / "shared.db", owner="first", ttl=-1.0)
+    second = SharedSources(tmp_path / "shared.db", owner="second")
+
+    assert await first.acquire("nyaa")
+    assert await second.acquire("nyaa")
+    assert not await first.acquire("nyaa")
+
+
+async def test_released_lease_taken_over(tmp_path: Path) -> None:
+    first = SharedSources(tmp_path / "shared.db", owner="first")
+    second = SharedSources(tmp_path / "shared.db", owner="second")
+
+    assert await first.acquire("nyaa")
+    await first.release_all()
+
+    assert not first.holds("nyaa")
+    assert await second.acquire("nyaa")
+
+
+async def test_stale_lease_given_up(tmp_path: Path) -> None:
+    first = SharedSources(tmp_path / "shared.db", owner="first")
+    second = SharedSources(tmp_path / "shared.db", owner="second")
+
+    assert await first.acquire("nyaa")
+    await first.heartbeat(stale_after=-1.0)
+
+    assert not first.holds("nyaa")
+    assert await second.acquire("nyaa")
+
+
+async def test_published_items_read_once(tmp_path: Path) -> None:
+    leader = SharedSources(tmp_path / "shared.db", owner="leader")
+    follower = SharedSources(tmp_path / "shared.db", owner="follower")
+
+    await leader.publish("nyaa", [{"title": "a"}, {"title": "b"}])
+    assert await follower.read("nyaa") == [{"title": "a"}, {"title": "b"}]
+    assert await follower.read("nyaa") == []
+
+    await leader.publish("nyaa", [{"title": "c"}])
+    assert await follower.read("nyaa") == [{"title": "c"}]
+    assert await leader.read("nyaa") == []
+    assert await follower.read("other") == []
+
+
+async def test_follower_polls_published_items(tmp_path: Path, app: MockTsundokuApp, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    leader = SharedSources(tmp_path / "shared.db", owner="leader")
+    assert await leader.acquire(source.name)
+    await leader.publish(source.name, [dict(item) for item in mock_feedparser_parse()["items"]])
+
+    calls = []
+
+    async def counting_fetch(*_: Any, **__: Any) -> FeedResponse:
+        calls.append(None)
+        return FeedResponse(200, None, None, b"")
+
+    monkeypatch.setattr("tsundoku.feeds.poller.Poller.fetch_feed", counting_fetch)
+    app.poller.shared_sources = SharedSources(tmp_path / "shared.db", owner="follower")
+
+    found = await app.poller.poll()
+    found_after = await app.poller.poll()
+
+    assert len(found) > 0
+    assert len(found_after) == 0
+    assert calls == []
+
+
+async def test_leader_publishes_fetched_items(tmp_path: Path, app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    app.poller.shared_sources = SharedSources(tmp_path / "shared.db", owner="leader")
+    follower = SharedSources(tmp_path / "shared.db", owner="follower")
+
+    await app.poller.poll()
+
+    source = Source.from_object(json.loads(MOCK_SOURCE))
+    assert app.poller.shared_sources.holds(source.name)
+    assert len(await follower.read(source.name)) > 0
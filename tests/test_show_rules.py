@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+
+from tests.mock import MockTsundokuApp, UserType
+from tsundoku.feeds import ShowRuleIndex
+from tsundoku.manager import ShowRule
+
+
+def test_rule_patterns() -> None:
+    rules = [
+        ShowRule(None, 1, 1, "exclude", "keyword", "HEVC, x265"),  # type: ignore
+        ShowRule(None, 2, 2, "include", "group", "SubsPlease"),  # type: ignore
+        ShowRule(None, 3, 3, "exclude", "regex", r"\bbatch\b"),  # type: ignore
+        ShowRule(None, 4, 3, "include", "keyword", "1080p"),  # type: ignore
+    ]
+    index = ShowRuleIndex()
+    index.build(rules)
+
+    assert len(index) == 4
+    assert index.rejected_shows("[SubsPlease] Show - 01 (1080p).mkv") == set()
+    assert index.rejected_shows("[SubsPlease] Show - 01 (1080p) [HEVC].mkv") == {1}
+    assert index.rejected_shows("[Erai-raws] Show - 01 [1080p][x265].mkv") == {1, 2}
+    assert index.rejected_shows("[SubsPlease] Show - 01 (720p).mkv") == {3}
+    assert index.rejected_shows("[subsplease] Show (01-12) (1080p) [Batch]") == {3}
+    assert index.rejected_shows("[Group] Shevcx - 01.mkv") == {2, 3}
+
+
+def test_invalid_rule_patterns() -> None:
+    for match_type, pattern in (
+        ("keyword", " , "),
+        ("group", ""),
+        ("regex", "(unclosed"),
+        ("regex", r"(a)\1"),
+        ("regex", "(?P<name>a)"),
+        ("regex", "(?i)a"),
+        ("codec", "HEVC"),
+    ):
+        with pytest.raises(ValueError):  # noqa: PT011
+            ShowRule.compile_pattern(match_type, pattern)
+
+
+async def test_excluded_show_not_downloaded(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    await app.show_rules.ensure_loaded(app)  # type: ignore
+    await ShowRule.new(app, 1, "exclude", "regex", ".")  # type: ignore
+
+    found = await app.poller.poll()
+
+    assert len(found) > 0
+    assert all(entry.show_id != 1 for entry in found)
+
+
+async def test_show_rules_api(app: MockTsundokuApp, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.CRITICAL, logger="tsundoku")
+
+    client = await app.test_client(user_type=UserType.REGULAR)
+    response = await client.post("/api/v1/shows/1/rules", json={"action": "exclude", "match_type": "keyword", "pattern": "HEVC"})
+    assert response.status_code == 200
+    rule = (await response.json)["result"]
+
+    response = await client.post("/api/v1/shows/1/rules", json={"action": "exclude", "match_type": "regex", "pattern": "("})
+    assert response.status_code == 400
+
+    response = await client.get("/api/v1/shows/1/rules")
+    assert (await response.json)["result"] == [rule]
+
+    response = await client.delete(f"/api/v1/shows/1/rules/{rule['id_']}")
+    assert response.status_code == 200
+    assert await ShowRule.from_show_id(app, 1) == []  # type: ignore
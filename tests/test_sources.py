@@ -0,0 +1,145 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.mock.sources import MOCK_SOURCE
+from tsundoku.sources import JsonPath, Source, SourceRegistry, get_definition_digest
+
+
+async def test_registry_reloads_on_mtime_change(tmp_path: Path) -> None:
+    (tmp_path / "COPIED").write_bytes(b"")
+    definition = tmp_path / "mock.json"
+    definition.write_text(MOCK_SOURCE)
+
+    registry = SourceRegistry(tmp_path)
+    first = await registry.get_all()
+    assert [source.version for source in first] == ["1.0.0"]
+    assert await registry.get_all() == first
+
+    changed = json.loads(MOCK_SOURCE)
+    changed["version"] = "1.0.1"
+    definition.write_text(json.dumps(changed))
+    stat = definition.stat()
+    os.utime(definition, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [source.version for source in await registry.get_all()] == ["1.0.1"]
+
+    definition.unlink()
+    assert await registry.get_all() == []
+
+
+async def test_registry_reports_invalid_source_once(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.ERROR, logger="tsundoku")
+
+    (tmp_path / "COPIED").write_bytes(b"")
+    (tmp_path / "broken.json").write_text('{"name": "Broken"}')
+    (tmp_path / "mock.json").write_text(MOCK_SOURCE)
+
+    registry = SourceRegistry(tmp_path)
+    assert len(await registry.get_all()) == 1
+    assert len(await registry.get_all()) == 1
+
+    errors = [record for record in caplog.records if "broken.json" in record.getMessage()]
+    assert len(errors) == 1
+
+
+async def test_registry_upgrades_older_default_sources(tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    caplog.set_level(logging.WARNING, logger="tsundoku")
+    monkeypatch.setattr("tsundoku.sources.PREVIOUS_DEFAULT_SOURCES", frozenset({get_definition_digest(json.loads(MOCK_SOURCE))}))
+
+    defaults = tmp_path / "defaults"
+    installed = tmp_path / "sources"
+    defaults.mkdir()
+    installed.mkdir()
+    (installed / "COPIED").write_bytes(b"")
+
+    bundled = json.loads(MOCK_SOURCE)
+    bundled["version"] = "1.1.0"
+    (defaults / "mock.json").write_text(json.dumps(bundled))
+    (defaults / "removed.json").write_text(json.dumps({**bundled, "name": "Removed"}))
+
+    custom = json.loads(MOCK_SOURCE)
+    custom["version"] = "2.0.0"
+    (defaults / "custom.json").write_text(json.dumps({**bundled, "name": "Custom"}))
+    (installed / "custom.json").write_text(json.dumps({**custom, "name": "Custom"}))
+    (installed / "mock.json").write_text(MOCK_SOURCE)
+
+    edited = json.loads(MOCK_SOURCE)
+    edited["url"] = "https://mirror.mock.com/rss/"
+    (defaults / "edited.json").write_text(json.dumps({**bundled, "name": "Edited"}))
+    (installed / "edited.json").write_text(json.dumps({**edited, "name": "Edited"}))
+
+    registry = SourceRegistry(installed, defaults)
+    versions = {source.name: source.version for source in await registry.get_all()}
+
+    assert versions == {"Mock Source": "1.1.0", "Custom": "2.0.0", "Edited": "1.0.0"}
+    assert not (installed / "removed.json").exists()
+
+    warnings = [record for record in caplog.records if "edited.json" in record.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_page_url() -> None:
+    definition = json.loads(MOCK_SOURCE)
+    definition["url"] = "https://mock.com/rss/?page=rss&p=1"
+    definition["pageParameter"] = "p"
+    source = Source.from_object(definition)
+
+    assert source.get_page_url(1) == definition["url"]
+    assert source.get_page_url(3) == "https://mock.com/rss/?page=rss&p=3"
+
+
+def test_magnet_from_infohash_field() -> None:
+    definition = json.loads(MOCK_SOURCE)
+    definition["rssItemKeyMapping"]["infohash"] = "$.nyaa_infohash"
+    definition["trackers"] = ["http://tracker.example/announce"]
+    source = Source.from_object(definition)
+
+    item = {"title": "Show - 01.mkv", "link": "https://mock.com/1.torrent", "nyaa_infohash": "ABCDEF0123456789ABCDEF0123456789ABCDEF01"}
+    magnet = source.get_magnet(item)
+
+    assert magnet is not None
+    assert magnet.startswith("magnet:?xt=urn:btih:abcdef0123456789abcdef0123456789abcdef01&dn=Show+-+01.mkv")
+    assert "tr=http%3A%2F%2Ftracker.example%2Fannounce" in magnet
+    assert source.get_magnet({"title": "Show - 01.mkv", "link": "https://mock.com/1.torrent"}) is None
+
+
+def test_json_path() -> None:
+    document = {"data": {"releases": [{"links": [{"url": "a"}, {"url": "b"}]}]}}
+
+    assert JsonPath("$.data.releases[0].links[1].url").get(document) == "b"
+    assert JsonPath("$.data.missing.url").get(document) is None
+    assert JsonPath("$").get(document) is document
+    with pytest.raises(Exception, match="Invalid JSON path"):
+        JsonPath("$.data..releases")
+
+
+def test_json_source_items() -> None:
+    source = Source.from_object(
+        {
+            "name": "JSON Source",
+            "version": "1.0.0",
+            "url": "https://mock.com/api",
+            "type": "json",
+            "itemsPath": "$.data",
+            "jsonItemKeyMapping": {"filename": "$.name", "torrent": "$.links.torrent", "infohash": "$.hash", "guid": "$.id"},
+        }
+    )
+    body = json.dumps(
+        {
+            "data": [
+                {"id": 1, "name": "Show - 01.mkv", "links": {"torrent": "https://mock.com/1.torrent"}, "hash": "ab" * 20},
+                {"id": 2, "name": "Show - 02.mkv"},
+            ]
+        }
+    ).encode()
+
+    assert source.json_map is not None
+    items = source.json_map.get_items(body)
+
+    assert items == [{"id": "1", "title": "Show - 01.mkv", "link": "https://mock.com/1.torrent", "infohash": "ab" * 20}]
+    assert source.get_filename(items[0]) == "Show - 01.mkv"
+    assert source.get_infohash(items[0]) == "ab" * 20
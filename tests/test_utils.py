@@ -59,3 +59,32 @@ class TestCompareVersionStrings(unittest.TestCase):
 
     def test_semver_7(self) -> None:
         assert utils.compare_version_strings("2.0.0", "1.0.0") == 1
+
+
+class TestNormalizeInfohash(unittest.TestCase):
+    def test_hex(self) -> None:
+        assert utils.normalize_infohash("ABCDEF0123456789ABCDEF0123456789ABCDEF01") == "abcdef0123456789abcdef0123456789abcdef01"
+
+    def test_base32_magnet(self) -> None:
+        assert utils.normalize_infohash("magnet:?xt=urn:btih:VPG66AJDIVTYTK6N54ASGRLHRGV433YB&dn=x") == "abcdef0123456789abcdef0123456789abcdef01"
+
+    def test_torrent_url(self) -> None:
+        assert utils.normalize_infohash("https://nyaa.si/download/1.torrent") is None
+
+
+class TestNormalizeReleaseName(unittest.TestCase):
+    def test_same_release(self) -> None:
+        first = utils.normalize_release_name("[SubsPlease] Show - 01 (1080p) [ABCD1234].mkv")
+        second = utils.normalize_release_name("[SubsPlease] Show - 01 (1080p) [ABCD1234]")
+        assert first == second
+
+
+class TestGetBatchEpisodes(unittest.TestCase):
+    def test_range(self) -> None:
+        assert utils.get_batch_episodes({"episode_number": ["01", "04"]}) == [1, 2, 3, 4]
+
+    def test_single_episode(self) -> None:
+        assert utils.get_batch_episodes({"episode_number": "01"}) == []
+
+    def test_no_episode(self) -> None:
+        assert utils.get_batch_episodes({}) == []
@@ -117,6 +117,13 @@ if __name__ == "__main__":
         nargs=1,
         help="Finds duplicate keys in a given language.",
     )
+    parser.add_argument(
+        "--replay-feeds",
+        type=str,
+        nargs="?",
+        const="",
+        help="Replays recorded feeds through the poller against a copy of the database and reports its throughput. Defaults to the recordings in the data directory.",
+    )
     args = parser.parse_args()
 
     if args.dbshell:
@@ -134,6 +141,19 @@ if __name__ == "__main__":
 
         database_source = DATA_DIR / DATABASE_FILE_NAME
         asyncio.run(migrate(database_source))
+    elif args.replay_feeds is not None:
+        from tsundoku.constants import DATA_DIR, DATABASE_FILE_NAME
+        from tsundoku.feeds.recorder import RECORDINGS_DIR
+        from tsundoku.feeds.replay import replay
+
+        recordings = Path(args.replay_feeds) if args.replay_feeds else RECORDINGS_DIR
+        try:
+            report = asyncio.run(replay(recordings, DATA_DIR / DATABASE_FILE_NAME))
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+
+        print(report)
     elif args.create_user:
         username = input("Username: ")
         match = False
@@ -33,7 +33,7 @@ from tsundoku.config import GeneralConfig
 from tsundoku.constants import DATA_DIR, DATABASE_FILE_NAME
 from tsundoku.database import acquire, migrate, sync_acquire
 from tsundoku.dl_client import Manager
-from tsundoku.feeds import Downloader, Poller
+from tsundoku.feeds import Downloader, EpisodeMap, ParseCache, Poller, ShowRuleIndex, WatchedShowIndex
 from tsundoku.flags import Flags
 from tsundoku.fluent import CustomFluentLocalization
 from tsundoku.git import check_for_updates
@@ -51,6 +51,10 @@ class TsundokuApp(Quart):
     dl_client: Manager
     poller: Poller
     downloader: Downloader
+    show_index: WatchedShowIndex
+    episode_map: EpisodeMap
+    parse_cache: ParseCache
+    show_rules: ShowRuleIndex
 
     acquire_db: Callable[..., AbstractAsyncContextManager[Connection]]
     sync_acquire_db: Callable[..., AbstractContextManager[sqlite3.Connection]]
@@ -71,6 +75,10 @@ class TsundokuApp(Quart):
 
         self.connected_websockets = set()
         self.flags = Flags()
+        self.show_index = WatchedShowIndex()
+        self.episode_map = EpisodeMap()
+        self.parse_cache = ParseCache()
+        self.show_rules = ShowRuleIndex()
 
     def get_fluent(self) -> CustomFluentLocalization:
         if self._active_localization is not None and self._active_localization.preferred_locale == self.flags.LOCALE:
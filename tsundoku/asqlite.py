@@ -38,6 +38,8 @@ from typing import (
     overload,
 )
 
+from tsundoku.utils import compare_version_strings
+
 __version__ = "2.0.0a"
 
 PARSE_DECLTYPES = sqlite3.PARSE_DECLTYPES
@@ -481,10 +483,20 @@ class Connection:
             return await cursor.fetchall()
 
 
+def _version_collation(first: str, second: str) -> int:
+    # Orders release versions like `compare_version_strings`, so that
+    # v10 sorts after v9. Anything unparsable is compared as text.
+    try:
+        return compare_version_strings(first, second)
+    except ValueError:
+        return (first > second) - (first < second)
+
+
 def _connect_pragmas(db: str | bytes, **kwargs: Any) -> sqlite3.Connection:
     connection = sqlite3.connect(db, **kwargs)
     sqlite3.register_adapter(bool, int)
     sqlite3.register_converter("BOOLEAN", lambda v: bool(int(v)))
+    connection.create_collation("VERSION", _version_collation)
     connection.execute("pragma journal_mode=wal")
     connection.execute("pragma foreign_keys=ON")
     connection.isolation_level = None
@@ -31,6 +31,7 @@ from tsundoku.config import (
     TorrentConfig,
 )
 from tsundoku.decorators import deny_readonly
+from tsundoku.sources import source_registry
 from tsundoku.user import User
 from tsundoku.utils import directory_is_writable
 from tsundoku.webhooks import WebhookBase
@@ -41,6 +42,7 @@ from .nyaa import NyaaAPI
 from .response import APIResponse
 from .seen_releases import SeenReleasesAPI
 from .show_entries import ShowEntriesAPI
+from .show_rules import ShowRulesAPI
 from .shows import ShowsAPI
 from .webhookbase import WebhookBaseAPI
 from .webhooks import WebhooksAPI
@@ -221,6 +223,50 @@ async def check_for_releases() -> APIResponse:
     return APIResponse(result=found_items)
 
 
+@api_blueprint.route("/sources", methods=["GET"])
+async def get_sources() -> APIResponse:
+    """
+    Returns every installed RSS source along with
+    the state of its circuit breaker.
+
+    .. :quickref: Sources; Retrieves RSS sources.
+
+    :returns: List[:class:`dict`]
+    """
+    now = asyncio.get_running_loop().time()
+    sources = await source_registry.get_all()
+
+    return APIResponse(
+        result=[
+            {
+                "name": source.name,
+                "version": source.version,
+                "url": source.url,
+                "breaker": app.poller.source_breaker[source.name].to_dict(now),
+            }
+            for source in sources
+        ]
+    )
+
+
+@api_blueprint.route("/sources/reload", methods=["POST"])
+@deny_readonly
+async def reload_sources() -> APIResponse:
+    """
+    Forces Tsundoku to re-read every RSS source definition.
+
+    .. :quickref: Sources; Reloads RSS source definitions.
+
+    :returns: List[:class:`str`]
+    """
+    logger.info("API - Reloading RSS sources")
+
+    source_registry.invalidate()
+    sources = await source_registry.get_all()
+
+    return APIResponse(result=[f"{source.name}@{source.version}" for source in sources])
+
+
 @api_blueprint.route("/shows/<int:show_id>/cache", methods=["DELETE"])
 async def delete_show_cache(show_id: int) -> APIResponse:
     """
@@ -351,6 +397,16 @@ def setup_views() -> None:
         methods=["PUT"],
     )
 
+    # Setup ShowRulesAPI URL rules.
+    show_rules_view = ShowRulesAPI.as_view("show_rules_api")
+
+    api_blueprint.add_url_rule("/shows/<int:show_id>/rules", view_func=show_rules_view, methods=["GET", "POST"])
+    api_blueprint.add_url_rule(
+        "/shows/<int:show_id>/rules/<int:rule_id>",
+        view_func=show_rules_view,
+        methods=["DELETE"],
+    )
+
     # Setup WebhookBaseAPI URL rules.
     webhookbase_view = WebhookBaseAPI.as_view("webhookbase_api")
 
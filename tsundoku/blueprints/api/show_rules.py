@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tsundoku.app import TsundokuApp
+
+    app: TsundokuApp
+else:
+    from quart import current_app as app
+
+from quart import request, views
+
+from tsundoku.manager import Show, ShowRule
+
+from .response import APIResponse
+
+
+class ShowRulesAPI(views.MethodView):
+    async def get(self, show_id: int) -> APIResponse:
+        rules = [rule.to_dict() for rule in await ShowRule.from_show_id(app, show_id)]
+        return APIResponse(result=rules)
+
+    async def post(self, show_id: int) -> APIResponse:
+        arguments = await request.get_json()
+
+        try:
+            await Show.from_id(app, show_id, lazy_metadata=True, lazy_entries=True, lazy_webhooks=True)
+        except ValueError:
+            return APIResponse(status=404, error="Show with specified ID does not exist.")
+
+        try:
+            rule = await ShowRule.new(
+                app,
+                show_id,
+                str(arguments.get("action", "")),
+                str(arguments.get("match_type", "")),
+                str(arguments.get("pattern", "")),
+            )
+        except ValueError as e:
+            return APIResponse(status=400, error=str(e))
+
+        return APIResponse(result=rule.to_dict())
+
+    async def delete(self, show_id: int, rule_id: int) -> APIResponse:
+        try:
+            rule = await ShowRule.from_id(app, rule_id)
+        except ValueError:
+            return APIResponse(status=404, error="Rule with specified ID does not exist.")
+
+        if rule.show_id != show_id:
+            return APIResponse(status=404, error="Rule with specified ID does not exist.")
+
+        await rule.delete()
+        return APIResponse(result=rule.to_dict())
@@ -298,6 +298,9 @@ class ShowsAPI(views.MethodView):
                 show_id,
             )
 
+        app.show_index.invalidate()
+        app.show_rules.invalidate()
+
         logger.info(f"Show Deleted - {title}")
 
         return APIResponse(result=True)
@@ -112,6 +112,16 @@ export interface GeneralConfig {
   polling_interval?: number;
   complete_check_interval?: number;
   fuzzy_cutoff?: number;
+  parse_workers?: number;
+  min_polling_interval?: number | null;
+  max_polling_interval?: number | null;
+  catch_up_depth?: number;
+  polling_mode?: "feed" | "targeted";
+  predictive_polling?: boolean;
+  batch_backfill?: boolean;
+  fetch_concurrency?: number;
+  parse_concurrency?: number;
+  resolve_concurrency?: number;
   update_do_check?: boolean;
   locale?: string;
   log_level?: string;
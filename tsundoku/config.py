@@ -172,6 +172,16 @@ class FeedsConfig(Config):
     complete_check_interval: int
     fuzzy_cutoff: int
     seed_ratio_limit: float
+    parse_workers: int
+    min_polling_interval: int | None
+    max_polling_interval: int | None
+    catch_up_depth: int
+    polling_mode: str
+    predictive_polling: bool
+    batch_backfill: bool
+    fetch_concurrency: int
+    parse_concurrency: int
+    resolve_concurrency: int
 
     def check_polling_interval(self, value: str) -> None:
         if isinstance(value, str) and not value.isdigit():
@@ -206,6 +216,59 @@ class FeedsConfig(Config):
         if ratio < 0.0:
             raise ConfigCheckFailError("Seed ratio limit must be at least 0.0")
 
+    def check_parse_workers(self, value: str) -> None:
+        if isinstance(value, str) and not value.isdigit():
+            raise ConfigCheckFailError(f"'{value}' is not a valid integer")
+
+        if int(value) > 32:
+            raise ConfigCheckFailError("Parse workers can be at most 32")
+
+    def check_catch_up_depth(self, value: str) -> None:
+        if isinstance(value, str) and not value.isdigit():
+            raise ConfigCheckFailError(f"'{value}' is not a valid integer")
+
+        if int(value) > 50:
+            raise ConfigCheckFailError("Catch-up depth can be at most 50 pages")
+
+    def _check_concurrency(self, value: str, stage: str) -> None:
+        if isinstance(value, str) and not value.isdigit():
+            raise ConfigCheckFailError(f"'{value}' is not a valid integer")
+
+        concurrency = int(value)
+        if concurrency < 1:
+            raise ConfigCheckFailError(f"{stage} concurrency must be at least 1")
+        if concurrency > 16:
+            raise ConfigCheckFailError(f"{stage} concurrency can be at most 16")
+
+    def check_fetch_concurrency(self, value: str) -> None:
+        self._check_concurrency(value, "Fetch")
+
+    def check_parse_concurrency(self, value: str) -> None:
+        self._check_concurrency(value, "Parse")
+
+    def check_resolve_concurrency(self, value: str) -> None:
+        self._check_concurrency(value, "Resolve")
+
+    def check_polling_mode(self, value: str) -> None:
+        if value not in ("feed", "targeted"):
+            raise ConfigCheckFailError(f"'{value}' is not a valid polling mode")
+
+    def check_min_polling_interval(self, value: str | None) -> None:
+        if value is None:
+            return
+
+        self.check_polling_interval(value)
+
+    def check_max_polling_interval(self, value: str | None) -> None:
+        if value is None:
+            return
+
+        self.check_polling_interval(value)
+
+        minimum = self.min_polling_interval
+        if minimum is not None and int(value) < int(minimum):
+            raise ConfigCheckFailError("Maximum polling interval must be at least the minimum polling interval")
+
 
 class TorrentConfig(Config):
     TABLE_NAME = "torrent_config"
@@ -31,3 +31,6 @@ DATABASE_FILE_NAME = "tsundoku.db"
 LOGGING_FILE_NAME = "tsundoku.log"
 
 DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
+
+# A database shared by several instances to split up polling sources.
+SHARED_DB_PATH = Path(os.environ["SHARED_DB_PATH"]) if os.getenv("SHARED_DB_PATH") else None
@@ -1,4 +1,5 @@
 import base64
+from collections import OrderedDict
 import hashlib
 import logging
 from pathlib import Path
@@ -19,16 +20,21 @@ from tsundoku.dl_client.transmission import TransmissionClient
 
 logger = logging.getLogger("tsundoku")
 
+# Number of resolved torrent file URLs kept in memory.
+MAX_CACHED_MAGNETS = 512
+
 
 class Manager:
     app: "TsundokuApp"
     session: aiohttp.ClientSession
+    magnet_cache: OrderedDict[str, str]
 
     __last_hash: int | None
 
     def __init__(self, app_context: Any, session: aiohttp.ClientSession) -> None:
         self.app = app_context.app
         self.session = session
+        self.magnet_cache = OrderedDict()
         self.__last_hash = None
 
         self._client: TorrentClient
@@ -71,7 +77,8 @@ class Manager:
         The magnet URL for that torrent is then resolved and returned.
 
         If the location parameter is already detected to be a magnet URL,
-        it will instantly return it.
+        it will instantly return it. Magnet URLs resolved from torrent
+        files are cached by location.
 
         Parameters
         ----------
@@ -96,6 +103,12 @@ class Manager:
 
         if location.startswith("magnet:?"):
             return re.sub(pattern, b32_to_sha1, location)
+
+        cached = self.magnet_cache.get(location)
+        if cached is not None:
+            self.magnet_cache.move_to_end(location)
+            return cached
+
         async with self.session.get(location) as resp:
             torrent_bytes = await resp.read()
             metadata: Any = bencodepy.decode(torrent_bytes)
@@ -106,8 +119,13 @@ class Manager:
         digest = hashlib.sha1(hash_data).hexdigest()
 
         magnet_url = f"magnet:?xt=urn:btih:{digest}&dn={metadata[b'info'][b'name'].decode()}&tr={metadata[b'announce'].decode()}"
+        magnet_url = re.sub(pattern, b32_to_sha1, magnet_url)
+
+        self.magnet_cache[location] = magnet_url
+        if len(self.magnet_cache) > MAX_CACHED_MAGNETS:
+            self.magnet_cache.popitem(last=False)
 
-        return re.sub(pattern, b32_to_sha1, magnet_url)
+        return magnet_url
 
     async def get_file_structure(self, location: str) -> list[str]:
         """
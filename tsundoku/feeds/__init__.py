@@ -1,4 +1,6 @@
 from .downloader import Downloader
+from .matcher import EpisodeMap, ShowRuleIndex, WatchedShowIndex
+from .parse_cache import ParseCache
 from .poller import Poller
 
-__all__ = ["Downloader", "Poller"]
+__all__ = ["Downloader", "EpisodeMap", "ParseCache", "Poller", "ShowRuleIndex", "WatchedShowIndex"]
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+
+# Consecutive failures after which a source is skipped.
+FAILURE_THRESHOLD = 3
+
+# Seconds a source is skipped for the first time it trips,
+# doubled every consecutive time up to the maximum.
+BASE_BACKOFF = 60.0
+MAX_BACKOFF = 3600.0
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Tracks the health of a single source, so that a
+    source that keeps failing is skipped for a while
+    instead of slowing down every poll.
+
+    Attributes
+    ----------
+    failures: int
+        Number of consecutive failed fetches.
+    trips: int
+        Number of consecutive times the breaker opened.
+    open_until: float
+        The event loop time until which the
+        source is skipped.
+    last_error: Optional[str]
+        Description of the most recent failure.
+    """
+
+    failures: int = 0
+    trips: int = 0
+    open_until: float = 0.0
+    last_error: str | None = None
+
+    def state(self, now: float) -> str:
+        """
+        Returns the state of the breaker.
+
+        Parameters
+        ----------
+        now: float
+            The current event loop time.
+
+        Returns
+        -------
+        str
+            "open" while the source is skipped, "half-open" when
+            a single trial fetch is allowed after tripping, and
+            "closed" otherwise.
+        """
+        if now < self.open_until:
+            return "open"
+        if self.trips:
+            return "half-open"
+
+        return "closed"
+
+    def allow(self, now: float) -> bool:
+        return now >= self.open_until
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.last_error = None
+
+    def record_failure(self, now: float, error: str) -> float | None:
+        """
+        Records a failed fetch, opening the breaker
+        if the failure threshold is reached.
+
+        Parameters
+        ----------
+        now: float
+            The current event loop time.
+        error: str
+            Description of the failure.
+
+        Returns
+        -------
+        Optional[float]
+            The number of seconds the source is
+            skipped for, if the breaker opened.
+        """
+        self.failures += 1
+        self.last_error = error
+
+        # A failed trial fetch re-opens the breaker immediately.
+        if self.failures < FAILURE_THRESHOLD and not self.trips:
+            return None
+
+        backoff = min(BASE_BACKOFF * 2**self.trips, MAX_BACKOFF)
+        self.trips += 1
+        self.open_until = now + backoff
+
+        return backoff
+
+    def to_dict(self, now: float) -> dict:
+        return {
+            "state": self.state(now),
+            "failures": self.failures,
+            "retry_in": max(self.open_until - now, 0.0),
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,243 @@
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tsundoku.app import TsundokuApp
+
+logger = logging.getLogger("tsundoku")
+
+# Number of item keys remembered per source. This comfortably covers
+# several pages of even the busiest feeds.
+MAX_SEEN_ITEMS = 1000
+
+# New items an adaptive schedule aims to find per poll.
+TARGET_NEW_ITEMS_PER_POLL = 1.0
+
+# Weight of the latest poll in a source's moving average of new items.
+NEW_ITEM_RATE_WEIGHT = 0.3
+
+# Growth of the interval for each consecutive poll without new items.
+IDLE_BACKOFF = 1.5
+
+
+class SeenItems:
+    """
+    A bounded set of item keys that have already
+    been processed for a single source.
+
+    Keys are kept in insertion order in a fixed-size
+    ring alongside a set for constant-time lookups.
+    Once full, the oldest key is evicted for each new one.
+    """
+
+    __ring: deque[str]
+    __keys: set[str]
+
+    def __init__(self, keys: Iterable[str] = (), maxlen: int = MAX_SEEN_ITEMS) -> None:
+        self.__ring = deque(maxlen=maxlen)
+        self.__keys = set()
+
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__keys
+
+    def __len__(self) -> int:
+        return len(self.__ring)
+
+    def add(self, key: str) -> None:
+        """
+        Adds a key to the set, evicting the
+        oldest key if the set is full.
+
+        Parameters
+        ----------
+        key: str
+            The key to add.
+        """
+        if key in self.__keys:
+            return
+
+        if len(self.__ring) == self.__ring.maxlen:
+            self.__keys.discard(self.__ring[0])
+
+        self.__ring.append(key)
+        self.__keys.add(key)
+
+    def serialize(self) -> str:
+        return " ".join(self.__ring)
+
+    @classmethod
+    def deserialize(cls, value: str | None) -> "SeenItems":
+        return cls(value.split() if value else ())
+
+
+@dataclass
+class SourceCache:
+    """
+    Represents a cache for a single RSS feed source.
+
+    Attributes
+    ----------
+    last_etag: str
+        The last ETag value for the feed.
+    last_modified: str
+        The last modified value for the feed.
+    seen_items: SeenItems
+        The keys of the items in the feed that
+        have already been processed.
+    """
+
+    last_etag: str | None = None
+    last_modified: str | None = None
+    seen_items: SeenItems = field(default_factory=SeenItems)
+
+    @classmethod
+    async def load_all(cls, app: "TsundokuApp") -> dict[str, "SourceCache"]:
+        """
+        Loads every persisted source cache.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to load the caches with.
+
+        Returns
+        -------
+        dict[str, SourceCache]
+            The caches, keyed by source name.
+        """
+        async with app.acquire_db() as con:
+            rows = await con.fetchall(
+                """
+                SELECT
+                    source_name,
+                    last_etag,
+                    last_modified,
+                    seen_items
+                FROM
+                    source_cache;
+            """
+            )
+
+        return {row["source_name"]: cls(row["last_etag"], row["last_modified"], SeenItems.deserialize(row["seen_items"])) for row in rows}
+
+    async def save(self, app: "TsundokuApp", source_name: str) -> None:
+        """
+        Persists the cache of a source so it
+        survives restarts.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to save the cache with.
+        source_name: str
+            The name of the source the cache belongs to.
+        """
+        async with app.acquire_db() as con:
+            await con.execute(
+                """
+                INSERT INTO source_cache (
+                    source_name,
+                    last_etag,
+                    last_modified,
+                    seen_items
+                ) VALUES (?, ?, ?, ?)
+                ON CONFLICT (source_name)
+                DO UPDATE SET
+                    last_etag = excluded.last_etag,
+                    last_modified = excluded.last_modified,
+                    seen_items = excluded.seen_items,
+                    updated_at = CURRENT_TIMESTAMP;
+                """,
+                source_name,
+                self.last_etag,
+                self.last_modified,
+                self.seen_items.serialize(),
+            )
+
+
+@dataclass
+class SourceSchedule:
+    """
+    The adaptive polling schedule of a single source.
+
+    The interval is chosen so that a poll is expected to
+    find about `TARGET_NEW_ITEMS_PER_POLL` new items at the
+    source's recent rate of new items, and grows further
+    with every consecutive poll that found nothing new.
+
+    Attributes
+    ----------
+    interval: float
+        The current number of seconds between polls.
+    next_poll_at: float
+        The event loop time the source is next due at.
+    last_poll_at: Optional[float]
+        The event loop time of the last successful poll.
+    new_item_rate: float
+        Moving average of new items per second.
+    idle_polls: int
+        Number of consecutive polls without new items,
+        including 304 Not Modified responses.
+    failed_polls: int
+        Number of consecutive polls that failed, which
+        do not count as idle.
+    """
+
+    interval: float
+    next_poll_at: float = 0.0
+    last_poll_at: float | None = None
+    new_item_rate: float = 0.0
+    idle_polls: int = 0
+    failed_polls: int = 0
+
+    def is_due(self, now: float) -> bool:
+        return now >= self.next_poll_at
+
+    def record(self, new_items: int, now: float, minimum: float, maximum: float) -> None:
+        """
+        Records the outcome of a poll and
+        schedules the next one.
+
+        Parameters
+        ----------
+        new_items: int
+            The number of new items the poll found.
+        now: float
+            The current event loop time.
+        minimum: float
+            The lower bound for the interval.
+        maximum: float
+            The upper bound for the interval.
+        """
+        elapsed = now - self.last_poll_at if self.last_poll_at is not None else self.interval
+        rate = new_items / max(elapsed, 1.0)
+        self.new_item_rate = (1 - NEW_ITEM_RATE_WEIGHT) * self.new_item_rate + NEW_ITEM_RATE_WEIGHT * rate
+
+        self.last_poll_at = now
+        self.failed_polls = 0
+        self.idle_polls = 0 if new_items else self.idle_polls + 1
+
+        interval = TARGET_NEW_ITEMS_PER_POLL / self.new_item_rate if self.new_item_rate > 0 else maximum
+        interval *= IDLE_BACKOFF**self.idle_polls
+
+        self.interval = min(max(interval, minimum), maximum)
+        self.next_poll_at = now + self.interval
+
+    def record_failure(self, now: float) -> None:
+        """
+        Records a failed poll, retrying at the current
+        interval without changing the schedule.
+
+        Parameters
+        ----------
+        now: float
+            The current event loop time.
+        """
+        self.failed_polls += 1
+        self.next_poll_at = now + self.interval
@@ -117,6 +117,7 @@ class Downloader:
         magnet_url: str,
         version: str,
         manual: bool = False,
+        torrent_hash: str | None = None,
     ) -> int | None:
         """
         Begins downloading an episode of a show
@@ -135,24 +136,20 @@ class Downloader:
             The magnet URL to use to initiate the download.
         version: str
             The version of the release.
+        torrent_hash: Optional[str]
+            The hash of a torrent that was already added
+            for the magnet URL, shared by every episode
+            of a batch release.
 
         Returns
         -------
         Optional[int]:
             The ID of the added entry.
         """
-        try:
-            torrent_hash = await self.app.dl_client.add_torrent(magnet_url)
-        except Exception as e:
-            logger.exception(f"Failed to begin handling, could not connect to download client: {e}")
-            self.app.flags.DL_CLIENT_CONNECTION_ERROR = True
-            return None
-
-        self.app.flags.DL_CLIENT_CONNECTION_ERROR = False
-
         if torrent_hash is None:
-            logger.warning(f"Failed to add Magnet URL {magnet_url} to download client")
-            return None
+            torrent_hash = await self.add_torrent(magnet_url)
+            if torrent_hash is None:
+                return None
 
         # TODO: handle entry insertion in the Entry class
         async with self.app.acquire_db() as con, con.cursor() as cur:
@@ -164,10 +161,11 @@ class Downloader:
                             episode,
                             version,
                             torrent_hash,
-                            created_manually
+                            created_manually,
+                            created_at
                         )
                     VALUES
-                        (:show_id, :episode, :version, :torrent_hash, :manual);
+                        (:show_id, :episode, :version, :torrent_hash, :manual, CURRENT_TIMESTAMP);
                 """,
                 {
                     "show_id": show_id,
@@ -199,12 +197,64 @@ class Downloader:
             entry = await cur.fetchone()
 
         entry = Entry(self.app, entry)
+        self.app.episode_map.record(entry.show_id, entry.episode, entry.version, entry.created_manually)
         await entry.set_state(EntryState.downloading)
 
         logger.info(f"Release Marked as Downloading - <e{entry.id}>")
 
         return entry.id
 
+    async def begin_handling_batch(self, show_id: int, episodes: list[int], magnet_url: str, version: str) -> list[int]:
+        """
+        Begins downloading several episodes of a show
+        from a single batch release.
+
+        The torrent is added to the download client once
+        and every episode's entry tracks the same torrent.
+
+        Parameters
+        ----------
+        show_id: int
+            The ID of the show in the `shows` table.
+        episodes: list[int]
+            The episodes of the show in the batch.
+        magnet_url: str
+            The magnet URL of the batch.
+        version: str
+            The version of the release.
+
+        Returns
+        -------
+        List[int]:
+            The IDs of the added entries.
+        """
+        torrent_hash = await self.add_torrent(magnet_url)
+        if torrent_hash is None:
+            return []
+
+        entry_ids = []
+        for episode in episodes:
+            entry_id = await self.begin_handling(show_id, episode, magnet_url, version, torrent_hash=torrent_hash)
+            if entry_id is not None:
+                entry_ids.append(entry_id)
+
+        return entry_ids
+
+    async def add_torrent(self, magnet_url: str) -> str | None:
+        try:
+            torrent_hash = await self.app.dl_client.add_torrent(magnet_url)
+        except Exception as e:
+            logger.exception(f"Failed to begin handling, could not connect to download client: {e}")
+            self.app.flags.DL_CLIENT_CONNECTION_ERROR = True
+            return None
+
+        self.app.flags.DL_CLIENT_CONNECTION_ERROR = False
+
+        if torrent_hash is None:
+            logger.warning(f"Failed to add Magnet URL {magnet_url} to download client")
+
+        return torrent_hash
+
     async def handle_move(self, entry: Entry) -> Path | None:
         """
         Handles the move for a downloaded entry.
@@ -353,7 +403,7 @@ class Downloader:
 
         return None
 
-    async def check_show_entry(self, entry: Entry) -> None:
+    async def check_show_entry(self, entry: Entry, completed_torrents: dict[str, bool] | None = None) -> None:
         """
         Checks a specific show entry for download completion.
         If an entry is completed, send it to renaming and moving.
@@ -362,6 +412,9 @@ class Downloader:
         ----------
         entry: Entry
             The object of the entry in the database.
+        completed_torrents: Optional[dict[str, bool]]
+            Completion states of torrents that were already
+            checked, updated with the entry's torrent.
         """
         logger.info(f"Checking Release Status - <e{entry.id}>")
 
@@ -370,7 +423,13 @@ class Downloader:
 
         # Sometimes the file path may exist on disk, but it isn't fully
         # downloaded by the torrent client at this point in time.
-        is_completed = await self.app.dl_client.check_torrent_completed(entry.torrent_hash)
+        if completed_torrents is not None and entry.torrent_hash in completed_torrents:
+            is_completed = completed_torrents[entry.torrent_hash]
+        else:
+            is_completed = await self.app.dl_client.check_torrent_completed(entry.torrent_hash)
+            if completed_torrents is not None:
+                completed_torrents[entry.torrent_hash] = is_completed
+
         if not is_completed:
             logger.info(f"<e{entry.id}> torrent state is not completed")
             return
@@ -489,6 +548,9 @@ class Downloader:
             """
             )
 
+        # Entries from a batch release share a torrent, which
+        # only needs to be checked once.
+        completed_torrents: dict[str, bool] = {}
         for entry in entries:
             entry = Entry(self.app, entry)
-            await self.check_show_entry(entry)
+            await self.check_show_entry(entry, completed_torrents)
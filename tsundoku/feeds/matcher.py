@@ -0,0 +1,345 @@
+from dataclasses import dataclass
+import logging
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tsundoku.app import TsundokuApp
+
+from tsundoku.manager import ShowRule
+from tsundoku.utils import compare_version_strings
+
+logger = logging.getLogger("tsundoku")
+
+
+@dataclass
+class WatchedShow:
+    """
+    The subset of a show's attributes that the
+    poller needs in order to match feed items.
+
+    Attributes
+    ----------
+    id_: int
+        The ID of the show.
+    title: str
+        The title of the show.
+    preferred_resolution: Optional[str]
+        The show's preferred resolution, if any.
+    preferred_release_group: Optional[str]
+        The show's preferred release group, if any.
+    """
+
+    id_: int
+    title: str
+    preferred_resolution: str | None
+    preferred_release_group: str | None
+
+
+class WatchedShowIndex:
+    """
+    An in-memory index of every watched show.
+
+    The index is loaded from the database on first
+    use and kept until it is invalidated, which happens
+    whenever a show is inserted, updated, or deleted.
+    """
+
+    __titles: list[str]
+    __by_title: dict[str, WatchedShow]
+    __by_id: dict[int, WatchedShow]
+    __loaded: bool
+    __generation: int
+
+    def __init__(self) -> None:
+        self.__titles = []
+        self.__by_title = {}
+        self.__by_id = {}
+        self.__loaded = False
+        self.__generation = 0
+
+    @property
+    def titles(self) -> list[str]:
+        return self.__titles
+
+    def invalidate(self) -> None:
+        """
+        Marks the index as stale, it will be
+        reloaded on its next use.
+        """
+        self.__loaded = False
+        self.__generation += 1
+
+    async def ensure_loaded(self, app: "TsundokuApp") -> None:
+        """
+        Loads the index from the database if it
+        has not been loaded or has been invalidated.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to load the shows with.
+        """
+        if self.__loaded:
+            return
+
+        generation = self.__generation
+        async with app.acquire_db() as con:
+            rows = await con.fetchall(
+                """
+                SELECT
+                    id,
+                    title,
+                    watch,
+                    preferred_resolution,
+                    preferred_release_group
+                FROM
+                    shows;
+            """
+            )
+
+        shows = [WatchedShow(row["id"], row["title"], row["preferred_resolution"], row["preferred_release_group"]) for row in rows if row["watch"]]
+
+        self.__by_title = {show.title: show for show in shows}
+        self.__titles = list(self.__by_title.keys())
+        self.__by_id = {show.id_: show for show in shows}
+        # Only trust the load if nothing was invalidated while it ran.
+        self.__loaded = generation == self.__generation
+
+        logger.debug(f"Loaded watched show index, {len(shows)} shows")
+
+    def get_by_title(self, title: str) -> WatchedShow | None:
+        return self.__by_title.get(title)
+
+    def get_by_id(self, show_id: int) -> WatchedShow | None:
+        return self.__by_id.get(show_id)
+
+
+class ShowRuleIndex:
+    """
+    Every show's include and exclude rules,
+    compiled into a single regular expression.
+
+    Each rule is an optional lookahead with its own named
+    group, so one search of a filename reports every rule
+    that matches it. Like the WatchedShowIndex, the pattern
+    is built on first use and kept until it is invalidated,
+    which happens whenever a rule is added or removed.
+    """
+
+    __pattern: re.Pattern | None
+    __rules: dict[str, ShowRule]
+    __included_shows: set[int]
+    __loaded: bool
+    __generation: int
+
+    def __init__(self) -> None:
+        self.__pattern = None
+        self.__rules = {}
+        self.__included_shows = set()
+        self.__loaded = False
+        self.__generation = 0
+
+    def __len__(self) -> int:
+        return len(self.__rules)
+
+    def invalidate(self) -> None:
+        """
+        Marks the index as stale, it will be
+        rebuilt on its next use.
+        """
+        self.__loaded = False
+        self.__generation += 1
+
+    def build(self, rules: list[ShowRule]) -> None:
+        """
+        Compiles the passed rules, replacing any
+        previously compiled rules. Rules with a pattern
+        that can no longer be compiled are skipped.
+
+        Parameters
+        ----------
+        rules: list[ShowRule]
+            The rules to compile.
+        """
+        parts = []
+        by_group = {}
+        for rule in rules:
+            try:
+                regex = rule.to_regex()
+            except ValueError:
+                logger.warning(f"Ignoring invalid rule <{rule.id_}> for <s{rule.show_id}>")
+                continue
+
+            group = f"r{rule.id_}"
+            parts.append(f"(?:(?=.*?(?P<{group}>{regex})))?")
+            by_group[group] = rule
+
+        self.__rules = by_group
+        self.__included_shows = {rule.show_id for rule in by_group.values() if rule.action == "include"}
+        self.__pattern = re.compile("^" + "".join(parts), re.IGNORECASE | re.DOTALL) if parts else None
+
+    async def ensure_loaded(self, app: "TsundokuApp") -> None:
+        """
+        Rebuilds the index from the database if it
+        has not been built or has been invalidated.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to load the rules with.
+        """
+        if self.__loaded:
+            return
+
+        generation = self.__generation
+        self.build(await ShowRule.all(app))
+        # Only trust the load if nothing was invalidated while it ran.
+        self.__loaded = generation == self.__generation
+
+        logger.debug(f"Compiled show rule index, {len(self.__rules)} rules")
+
+    def rejected_shows(self, filename: str) -> set[int]:
+        """
+        Returns the shows whose rules reject a release.
+
+        A show rejects a release if any of its exclude
+        rules match, or if it has include rules and
+        none of them match.
+
+        Parameters
+        ----------
+        filename: str
+            The release's filename.
+
+        Returns
+        -------
+        Set[int]
+            The IDs of the shows that reject the release.
+        """
+        if self.__pattern is None:
+            return set()
+
+        match = self.__pattern.match(filename)
+        if match is None:
+            return set(self.__included_shows)
+
+        excluded = set()
+        included = set()
+        for group, value in match.groupdict().items():
+            if value is None:
+                continue
+
+            rule = self.__rules[group]
+            if rule.action == "exclude":
+                excluded.add(rule.show_id)
+            else:
+                included.add(rule.show_id)
+
+        return excluded | (self.__included_shows - included)
+
+
+@dataclass
+class ParsedEpisode:
+    """
+    The most recent version of an episode
+    that already has an entry.
+
+    Attributes
+    ----------
+    version: str
+        The highest version with an entry.
+    created_manually: bool
+        Whether the entry with the highest
+        version was created manually.
+    """
+
+    version: str
+    created_manually: bool
+
+
+class EpisodeMap:
+    """
+    A per-show map of episode to the highest
+    version that has an entry in `show_entry`.
+
+    The map is reloaded at the start of each poll
+    and kept up to date as entries are inserted, so
+    duplicate and older-version checks do not need to
+    query the database.
+    """
+
+    __shows: dict[int, dict[int, ParsedEpisode]]
+
+    def __init__(self) -> None:
+        self.__shows = {}
+
+    async def load(self, app: "TsundokuApp") -> None:
+        """
+        Reloads the map from the `show_entry` table,
+        reading only the highest version of each episode.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to load entries with.
+        """
+        async with app.acquire_db() as con:
+            rows = await con.fetchall(
+                """
+                SELECT
+                    show_id,
+                    episode,
+                    MAX(version COLLATE VERSION) AS version,
+                    created_manually
+                FROM
+                    show_entry
+                GROUP BY
+                    show_id,
+                    episode;
+            """
+            )
+
+        self.__shows = {}
+        for row in rows:
+            self.record(row["show_id"], row["episode"], row["version"], bool(row["created_manually"]))
+
+    def record(self, show_id: int, episode: int, version: str, created_manually: bool) -> None:
+        """
+        Records that an entry exists for an episode,
+        keeping only the highest version.
+
+        Parameters
+        ----------
+        show_id: int
+            The ID of the show.
+        episode: int
+            The episode of the entry.
+        version: str
+            The release version of the entry.
+        created_manually: bool
+            Whether the entry was created manually.
+        """
+        episodes = self.__shows.setdefault(show_id, {})
+        existing = episodes.get(episode)
+        if existing is None or compare_version_strings(version, existing.version) >= 0:
+            episodes[episode] = ParsedEpisode(version, created_manually)
+
+    def get(self, show_id: int, episode: int) -> ParsedEpisode | None:
+        return self.__shows.get(show_id, {}).get(episode)
+
+    def episodes(self, show_id: int) -> set[int]:
+        """
+        Returns every episode of a show that has an entry.
+
+        Parameters
+        ----------
+        show_id: int
+            The ID of the show.
+
+        Returns
+        -------
+        Set[int]
+            The episodes with entries.
+        """
+        return set(self.__shows.get(show_id, {}))
@@ -0,0 +1,236 @@
+from collections import OrderedDict
+import importlib.metadata
+import json
+import logging
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+if TYPE_CHECKING:
+    from tsundoku.app import TsundokuApp
+
+from tsundoku.utils import ParserResult, parse_anime_title
+
+logger = logging.getLogger("tsundoku")
+
+# Number of parse results kept in memory.
+MAX_CACHED_PARSES = 4096
+
+# SQLite limits the number of bound parameters per statement.
+_PRELOAD_CHUNK_SIZE = 500
+
+# Persisted results are only trusted if they came from the same parser.
+PARSER_VERSION = importlib.metadata.version("anitomy-ng")
+
+
+class ParseCacheStats(NamedTuple):
+    """
+    Counters for a ParseCache.
+
+    Attributes
+    ----------
+    hits: int
+        Lookups answered from memory.
+    persistent_hits: int
+        Results loaded from the database.
+    misses: int
+        Lookups that had to run anitomy.
+    size: int
+        Number of results currently held in memory.
+    """
+
+    hits: int
+    persistent_hits: int
+    misses: int
+    size: int
+
+
+class ParseCache:
+    """
+    A memoizing wrapper around `parse_anime_title`,
+    keyed by the exact filename.
+
+    Results are held in a bounded in-memory LRU. Optionally,
+    results can be preloaded from and flushed to the
+    `parse_cache` table so that they survive restarts.
+    """
+
+    __results: OrderedDict[str, ParserResult]
+    __pending: dict[str, ParserResult]
+    __maxsize: int
+
+    hits: int
+    persistent_hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = MAX_CACHED_PARSES) -> None:
+        self.__results = OrderedDict()
+        self.__pending = {}
+        self.__maxsize = maxsize
+
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def __contains__(self, title: object) -> bool:
+        return title in self.__results
+
+    def __store(self, title: str, result: ParserResult) -> None:
+        self.__results[title] = result
+        self.__results.move_to_end(title)
+        if len(self.__results) > self.__maxsize:
+            self.__results.popitem(last=False)
+
+    @property
+    def stats(self) -> ParseCacheStats:
+        return ParseCacheStats(self.hits, self.persistent_hits, self.misses, len(self.__results))
+
+    def get(self, title: str) -> ParserResult | None:
+        """
+        Returns the cached parse result of a title
+        without parsing it on a miss.
+
+        Parameters
+        ----------
+        title: str
+            The title to look up.
+
+        Returns
+        -------
+        Optional[ParserResult]
+            A copy of the cached result, if any.
+        """
+        result = self.__results.get(title)
+        if result is None:
+            return None
+
+        self.hits += 1
+        self.__results.move_to_end(title)
+        return cast(ParserResult, dict(result))
+
+    def put(self, title: str, result: ParserResult) -> None:
+        """
+        Stores a parse result that was computed
+        elsewhere, marking it for persistence.
+
+        Parameters
+        ----------
+        title: str
+            The title that was parsed.
+        result: ParserResult
+            The result of parsing the title.
+        """
+        self.misses += 1
+        self.__store(title, result)
+        self.__pending[title] = result
+
+    def parse(self, title: str) -> ParserResult:
+        """
+        Parses an anime title, returning the cached
+        result if the title was parsed before.
+
+        Parameters
+        ----------
+        title: str
+            The title to parse.
+
+        Returns
+        -------
+        ParserResult
+            The parse result. Callers receive a copy
+            and are free to modify it.
+        """
+        cached = self.get(title)
+        if cached is not None:
+            return cached
+
+        result = parse_anime_title(title)
+        self.put(title, result)
+        return cast(ParserResult, dict(result))
+
+    async def preload(self, app: "TsundokuApp", titles: list[str]) -> None:
+        """
+        Loads persisted parse results for any of the
+        passed titles that are not already in memory.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to load results with.
+        titles: list[str]
+            The titles that are about to be parsed.
+        """
+        missing = list({title for title in titles if title not in self.__results})
+
+        async with app.acquire_db() as con:
+            for i in range(0, len(missing), _PRELOAD_CHUNK_SIZE):
+                chunk = missing[i : i + _PRELOAD_CHUNK_SIZE]
+                rows = await con.fetchall(
+                    f"""
+                    SELECT
+                        file_name,
+                        result
+                    FROM
+                        parse_cache
+                    WHERE
+                        parser_version = ?
+                        AND file_name IN ({", ".join("?" for _ in chunk)});
+                    """,
+                    PARSER_VERSION,
+                    *chunk,
+                )
+
+                for row in rows:
+                    self.persistent_hits += 1
+                    self.__store(row["file_name"], cast(ParserResult, json.loads(row["result"])))
+
+    async def flush(self, app: "TsundokuApp") -> None:
+        """
+        Persists every result parsed since
+        the last flush.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to save results with.
+        """
+        if not self.__pending:
+            return
+
+        pending = self.__pending
+        self.__pending = {}
+
+        async with app.acquire_db() as con, con.transaction():
+            await con.executemany(
+                """
+                INSERT OR REPLACE INTO parse_cache (
+                    file_name,
+                    parser_version,
+                    result
+                ) VALUES (?, ?, ?);
+                """,
+                [(title, PARSER_VERSION, json.dumps(result)) for title, result in pending.items()],
+            )
+
+    @staticmethod
+    async def delete_old(app: "TsundokuApp", /, days: int) -> None:
+        """
+        Deletes persisted results that are older than a
+        certain number of days, or that came from a
+        different parser version.
+
+        Parameters
+        ----------
+        days : int
+            The number of days.
+        """
+        async with app.acquire_db() as con:
+            await con.execute(
+                """
+                DELETE FROM
+                    parse_cache
+                WHERE
+                    parser_version != ?
+                    OR datetime('now', '-' || ? || ' day') > created_at;
+                """,
+                PARSER_VERSION,
+                days,
+            )
@@ -0,0 +1,162 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+logger = logging.getLogger("tsundoku")
+
+# Marks the end of a stage's input.
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """
+    Counters for a single pipeline stage.
+
+    Attributes
+    ----------
+    name: str
+        The name of the stage.
+    workers: int
+        The number of concurrent workers.
+    processed: int
+        The number of inputs handled.
+    busy: float
+        Seconds spent handling inputs, summed over workers.
+    blocked: float
+        Seconds spent waiting on a full downstream queue,
+        summed over workers. A stage that is blocked for long
+        feeds a bottleneck.
+    """
+
+    name: str
+    workers: int
+    processed: int = 0
+    busy: float = 0.0
+    blocked: float = 0.0
+
+    def __str__(self) -> str:
+        return f"{self.name} x{self.workers}: {self.processed} processed, {self.busy:.2f}s busy, {self.blocked:.2f}s blocked"
+
+
+@dataclass
+class Stage:
+    name: str
+    workers: int
+    handler: Callable[[Any], Awaitable[Iterable[Any]]]
+    stats: StageStats = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stats = StageStats(self.name, self.workers)
+
+
+class Pipeline:
+    """
+    A chain of stages connected by bounded queues.
+
+    Every stage runs its own number of workers. Each
+    worker takes one input at a time and passes every
+    output of the stage's handler on to the next stage,
+    waiting when that stage's queue is full. The outputs
+    of the last stage are collected and returned.
+    """
+
+    stages: list[Stage]
+    queue_size: int
+
+    def __init__(self, queue_size: int) -> None:
+        self.stages = []
+        self.queue_size = queue_size
+
+    @property
+    def stats(self) -> list[StageStats]:
+        return [stage.stats for stage in self.stages]
+
+    def add_stage(self, name: str, workers: int, handler: Callable[[Any], Awaitable[Iterable[Any]]]) -> None:
+        """
+        Appends a stage to the pipeline.
+
+        Parameters
+        ----------
+        name: str
+            The name of the stage, used in logs and stats.
+        workers: int
+            The number of inputs handled concurrently.
+        handler: Callable[[Any], Awaitable[Iterable[Any]]]
+            Handles one input and returns the outputs
+            to pass on. Errors are logged and the input
+            is dropped.
+        """
+        self.stages.append(Stage(name, max(workers, 1), handler))
+
+    async def _work(self, stage: Stage, inbox: asyncio.Queue, outbox: asyncio.Queue | None, results: list) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            value = await inbox.get()
+            if value is _DONE:
+                return
+
+            start = loop.time()
+            try:
+                outputs = list(await stage.handler(value))
+            except Exception:
+                logger.exception(f"Pipeline stage '{stage.name}' failed", exc_info=True)
+                outputs = []
+            stage.stats.busy += loop.time() - start
+            stage.stats.processed += 1
+
+            if outbox is None:
+                results += outputs
+                continue
+
+            start = loop.time()
+            for output in outputs:
+                await outbox.put(output)
+            stage.stats.blocked += loop.time() - start
+
+    async def _run_stage(self, index: int, queues: list[asyncio.Queue], results: list) -> None:
+        stage = self.stages[index]
+        outbox = queues[index + 1] if index + 1 < len(self.stages) else None
+
+        await asyncio.gather(*(self._work(stage, queues[index], outbox, results) for _ in range(stage.workers)))
+
+        if outbox is not None:
+            for _ in range(self.stages[index + 1].workers):
+                await outbox.put(_DONE)
+
+    async def _feed(self, inputs: Iterable[Any], inbox: asyncio.Queue) -> None:
+        for value in inputs:
+            await inbox.put(value)
+
+        for _ in range(self.stages[0].workers):
+            await inbox.put(_DONE)
+
+    async def run(self, inputs: Iterable[Any]) -> list:
+        """
+        Runs every input through the pipeline.
+
+        Parameters
+        ----------
+        inputs: Iterable[Any]
+            The inputs to the first stage.
+
+        Returns
+        -------
+        list
+            The outputs of the last stage.
+        """
+        if not self.stages:
+            return list(inputs)
+
+        queues: list[asyncio.Queue] = [asyncio.Queue(self.queue_size) for _ in self.stages]
+        results: list = []
+
+        await asyncio.gather(
+            self._feed(inputs, queues[0]),
+            *(self._run_stage(index, queues, results) for index in range(len(self.stages))),
+        )
+
+        return results
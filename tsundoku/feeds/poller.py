@@ -1,30 +1,85 @@
 import asyncio
 from collections import defaultdict
-from dataclasses import dataclass
-from functools import cmp_to_key, partial
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from functools import partial
 import hashlib
 import logging
+import multiprocessing
 import os
-from sqlite3 import Row
 from typing import TYPE_CHECKING, Any, NamedTuple
+from urllib.parse import urlsplit
 
 if TYPE_CHECKING:
     from tsundoku.app import TsundokuApp
 
+import aiohttp
 import feedparser
 
 from tsundoku.config import FeedsConfig
+from tsundoku.constants import SHARED_DB_PATH
+from tsundoku.feeds.breaker import CircuitBreaker
+from tsundoku.feeds.cache import SourceCache, SourceSchedule
 from tsundoku.feeds.fuzzy import extract_one
+from tsundoku.feeds.parse_cache import ParseCache
+from tsundoku.feeds.pipeline import Pipeline, StageStats
+from tsundoku.feeds.predictor import ReleasePredictor
+from tsundoku.feeds.recorder import RECORDINGS_DIR, FeedRecorder
+from tsundoku.feeds.rss import UnsupportedFeedError, parse_rss_items
+from tsundoku.feeds.sharding import LEASE_HEARTBEAT_INTERVAL, LEASE_TTL, SharedSources
 from tsundoku.manager import SeenRelease
+from tsundoku.nyaa import NyaaSearcher, SearchResult
 from tsundoku.sources import Source, get_all_sources
 from tsundoku.utils import (
+    ParserResult,
     compare_version_strings,
+    get_batch_episodes,
+    get_release_version,
+    normalize_infohash,
+    normalize_release_name,
     normalize_resolution,
-    parse_anime_title,
+    parse_anime_title_batch,
 )
 
 logger = logging.getLogger("tsundoku")
 
+# Upper bound on the number of source feeds being downloaded at once.
+MAX_CONCURRENT_FETCHES = 4
+
+# Number of older pages of a single source fetched at once while catching up.
+CATCH_UP_CONCURRENCY = 2
+
+# Parse workers must not be forked from the threads of a running app,
+# which can leave a child holding a lock no thread will ever release.
+PARSE_WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Upper bound on the number of torrent links being resolved at once.
+MAX_CONCURRENT_MAGNET_RESOLUTIONS = 4
+
+# Default number of workers for each stage of a poll. The fetch, parse and
+# resolve stages can be configured, matching and handling stay single-worker
+# so that `is_parsed` always sees earlier releases.
+STAGE_CONCURRENCY = {
+    "fetch": MAX_CONCURRENT_FETCHES,
+    "dedupe": 1,
+    "parse": 1,
+    "match": 1,
+    "resolve": MAX_CONCURRENT_MAGNET_RESOLUTIONS,
+    "handle": 1,
+}
+
+# Maximum number of inputs waiting between two stages.
+STAGE_QUEUE_SIZE = 16
+
+# Seconds between polls while a show's predicted release window is open.
+RELEASE_WINDOW_INTERVAL = 180
+
+# Missing episodes a batch release must cover to be downloaded
+# instead of waiting for single-episode releases.
+BATCH_MIN_MISSING = 2
+
 
 @dataclass
 class EntryMatch:
@@ -52,24 +107,61 @@ class FoundEntry(NamedTuple):
     episode: int
 
 
-@dataclass
-class SourceCache:
+class MatchedRelease(NamedTuple):
+    """
+    A feed item that matched a watched show and
+    is waiting for its torrent link to be resolved.
+
+    Attributes
+    ----------
+    show_id: int
+        The ID of the matched show.
+    episode: int
+        The episode of the release, 0 for batch releases.
+    version: str
+        The release version.
+    item: dict
+        The feed item.
+    episodes: Optional[tuple[int, ...]]
+        The missing episodes a batch release covers, empty
+        until its files are listed if its title has no episode
+        range. None for single-episode releases.
+    """
+
+    show_id: int
+    episode: int
+    version: str
+    item: dict
+    episodes: tuple[int, ...] | None = None
+
+
+class FeedFetchError(Exception):
     """
-    Represents a cache for a single RSS feed source.
+    Raised when a source's feed could not be
+    downloaded, or the response was rejected.
+    """
+
+
+class FeedResponse(NamedTuple):
+    """
+    The raw result of fetching a source's feed.
 
     Attributes
     ----------
-    last_etag: str
-        The last ETag value for the feed.
-    last_modified: str
-        The last modified value for the feed.
-    most_recent_hash: str
-        The hash of the most recent item in the feed.
+    status: int
+        The HTTP status code of the response.
+    etag: Optional[str]
+        The ETag header of the response, if any.
+    last_modified: Optional[str]
+        The Last-Modified header of the response, if any.
+    body: bytes
+        The (decompressed) response body.
     """
 
-    last_etag: str | None = None
-    last_modified: str | None = None
-    most_recent_hash: str | None = None
+    status: int
+    etag: str | None
+    last_modified: str | None
+    body: bytes
 
 
 class Poller:
@@ -88,21 +180,175 @@ class Poller:
 
     app: "TsundokuApp"
     source_cache: dict[str, SourceCache]
+    source_schedule: dict[str, SourceSchedule]
+    source_breaker: dict[str, CircuitBreaker]
+
+    interval: int
+    min_interval: int | None
+    max_interval: int | None
+    catch_up_depth: int
+    polling_mode: str
+    predictive_polling: bool
+    predictor: ReleasePredictor
+    batch_backfill: bool
+
+    recorder: FeedRecorder | None
+    shared_sources: SharedSources | None
+
+    parse_workers: int
+    parse_executor: ProcessPoolExecutor | None
+
+    stage_concurrency: dict[str, int]
+    stage_stats: list[StageStats]
+
+    poll_task: "asyncio.Future[list[FoundEntry]] | None"
+    poll_task_args: tuple[bool, bool]
+    trailing_poll_task: "asyncio.Future[list[FoundEntry]] | None"
 
     def __init__(self, app_context: Any) -> None:
         self.app = app_context.app
         self.loop = asyncio.get_running_loop()
 
         self.source_cache = defaultdict(SourceCache)
+        self.source_schedule = {}
+        self.source_breaker = defaultdict(CircuitBreaker)
+        self.fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self.magnet_semaphore = asyncio.Semaphore(MAX_CONCURRENT_MAGNET_RESOLUTIONS)
+
+        self.catch_up_depth = 0
+        self.polling_mode = "feed"
+        self.predictive_polling = False
+        self.predictor = ReleasePredictor()
+        self.batch_backfill = False
+
+        self.recorder = FeedRecorder(RECORDINGS_DIR) if self.app.flags.RECORD_FEEDS else None
+        self.shared_sources = SharedSources(SHARED_DB_PATH) if SHARED_DB_PATH is not None else None
+
+        self.parse_workers = 0
+        self.parse_executor = None
+
+        self.stage_concurrency = dict(STAGE_CONCURRENCY)
+        self.stage_stats = []
+
+        self.poll_task = None
+        self.poll_task_args = (False, False)
+        self.trailing_poll_task = None
 
     async def update_config(self) -> None:
         """
         Updates the configuration for the task.
         """
         cfg = await FeedsConfig.retrieve(self.app)
-        self.interval = cfg.polling_interval
+        self.interval = int(cfg.polling_interval)
         self.fuzzy_match_cutoff = cfg.fuzzy_cutoff
 
+        self.min_interval = int(cfg.min_polling_interval) if cfg.min_polling_interval is not None else None
+        self.max_interval = int(cfg.max_polling_interval) if cfg.max_polling_interval is not None else None
+        self.catch_up_depth = int(cfg.catch_up_depth)
+        self.polling_mode = cfg.polling_mode
+        self.predictive_polling = bool(cfg.predictive_polling)
+        self.batch_backfill = bool(cfg.batch_backfill)
+
+        concurrency = {
+            **STAGE_CONCURRENCY,
+            "fetch": int(cfg.fetch_concurrency),
+            "parse": int(cfg.parse_concurrency),
+            "resolve": int(cfg.resolve_concurrency),
+        }
+        if concurrency != self.stage_concurrency:
+            # Catch-up pages and torrent downloads outside the stages
+            # share the same limits.
+            self.fetch_semaphore = asyncio.Semaphore(concurrency["fetch"])
+            self.magnet_semaphore = asyncio.Semaphore(concurrency["resolve"])
+            self.stage_concurrency = concurrency
+
+        parse_workers = int(cfg.parse_workers)
+        if parse_workers != self.parse_workers:
+            self.shutdown_parse_executor()
+            self.parse_workers = parse_workers
+            if parse_workers > 0:
+                logger.info(f"Parsing feed items with {parse_workers} worker processes")
+                self.create_parse_executor()
+
+    def create_parse_executor(self) -> None:
+        """
+        Starts `parse_workers` parse worker processes.
+        """
+        context = multiprocessing.get_context(PARSE_WORKER_START_METHOD)
+        self.parse_executor = ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=context)
+
+    def shutdown_parse_executor(self) -> None:
+        """
+        Shuts down the parse worker processes, if any.
+        """
+        if self.parse_executor is not None:
+            self.parse_executor.shutdown(wait=False, cancel_futures=True)
+            self.parse_executor = None
+
+    @property
+    def is_adaptive(self) -> bool:
+        """
+        Whether sources are polled on their own adaptive
+        schedules rather than all at once every
+        `polling_interval` seconds.
+        """
+        return self.min_interval is not None and self.max_interval is not None
+
+    def get_schedule(self, source: Source) -> SourceSchedule:
+        """
+        Returns the polling schedule of a source,
+        creating it if it does not exist yet.
+
+        Parameters
+        ----------
+        source: Source
+            The source to get the schedule of.
+
+        Returns
+        -------
+        SourceSchedule
+            The source's schedule.
+        """
+        if source.name not in self.source_schedule:
+            self.source_schedule[source.name] = SourceSchedule(float(self.interval))
+
+        return self.source_schedule[source.name]
+
+    def in_release_window(self) -> bool:
+        """
+        Returns whether a watched show's predicted
+        release window is open.
+        """
+        return self.predictive_polling and bool(self.predictor.active_windows(datetime.now(UTC)))
+
+    def seconds_until_next_poll(self) -> float:
+        """
+        Returns how long the poller should sleep
+        before its next poll.
+
+        With predictive polling, polls are made every
+        `RELEASE_WINDOW_INTERVAL` seconds while a predicted
+        release window is open, and the poller wakes up
+        when the next window opens.
+
+        Returns
+        -------
+        float
+            The number of seconds to sleep.
+        """
+        if not self.is_adaptive or not self.source_schedule:
+            sleep_for = float(self.interval)
+        else:
+            next_poll_at = min(schedule.next_poll_at for schedule in self.source_schedule.values())
+            sleep_for = max(next_poll_at - self.loop.time(), 0.0)
+
+        if self.predictive_polling:
+            until_window = self.predictor.seconds_until_next_window(datetime.now(UTC))
+            if until_window is not None:
+                sleep_for = min(sleep_for, RELEASE_WINDOW_INTERVAL if until_window == 0 else until_window)
+
+        return sleep_for
+
     async def start(self) -> None:
         """
         The program will poll every n seconds, as specified
@@ -110,26 +356,85 @@ class Poller:
         """
         logger.debug("Poller task started.")
 
+        await self.load_rss_cache()
+
+        heartbeat_task = asyncio.create_task(self.heartbeat()) if self.shared_sources is not None else None
+
         if os.getenv("DISABLE_POLL_ON_START"):
             await self.update_config()
             logger.info(f"Polling disabled on start, waiting {self.interval} seconds before first poll...")
             await asyncio.sleep(self.interval)
 
-        while True:
-            await self.update_config()
+        try:
+            while True:
+                await self.update_config()
+
+                # Every source is checked while a release window is open, even
+                # if its adaptive schedule would not be due yet.
+                try:
+                    await self.poll(due_only=self.is_adaptive and not self.in_release_window())
+                except Exception:
+                    logger.error("An error occurred while polling RSS sources.", exc_info=True)
+
+                if self.predictive_polling:
+                    try:
+                        await self.predictor.refresh(self.app)
+                    except Exception:
+                        logger.error("An error occurred while predicting release windows.", exc_info=True)
+
+                try:
+                    await SeenRelease.delete_old(self.app, days=30)
+                except Exception:
+                    logger.error("An error occurred while deleting old seen releases.", exc_info=True)
+
+                try:
+                    await ParseCache.delete_old(self.app, days=30)
+                except Exception:
+                    logger.error("An error occurred while deleting old parse results.", exc_info=True)
+
+                sleep_for = self.seconds_until_next_poll()
+                logger.info(f"Sleeping {sleep_for:.0f} seconds before polling RSS sources again...")
+                await asyncio.sleep(sleep_for)
+        finally:
+            self.shutdown_parse_executor()
+
+            if heartbeat_task is not None:
+                heartbeat_task.cancel()
+            if self.shared_sources is not None:
+                try:
+                    await self.shared_sources.release_all()
+                except Exception:
+                    logger.error("An error occurred while releasing shared source leases.", exc_info=True)
+
+    async def heartbeat(self) -> None:
+        """
+        Keeps the leases of shared sources this
+        instance fetches alive while it runs.
+        """
+        if self.shared_sources is None:
+            return
 
-            try:
-                await self.poll()
-            except Exception:
-                logger.error("An error occurred while polling RSS sources.", exc_info=True)
+        while True:
+            await asyncio.sleep(LEASE_HEARTBEAT_INTERVAL)
 
+            # A source that was not fetched for two polls is no longer
+            # polled by this instance, and another one should take it.
+            stale_after = 2 * max(self.interval, self.max_interval or 0) + LEASE_TTL
             try:
-                await SeenRelease.delete_old(self.app, days=30)
+                await self.shared_sources.heartbeat(stale_after)
             except Exception:
-                logger.error("An error occurred while deleting old seen releases.", exc_info=True)
+                logger.error("An error occurred while renewing shared source leases.", exc_info=True)
 
-            logger.info(f"Sleeping {self.interval} seconds before polling RSS sources again...")
-            await asyncio.sleep(self.interval)
+    async def load_rss_cache(self) -> None:
+        """
+        Restores the cache attributes of every
+        source that were persisted before the
+        last shutdown.
+        """
+        try:
+            self.source_cache.update(await SourceCache.load_all(self.app))
+        except Exception:
+            logger.error("An error occurred while loading the RSS source cache.", exc_info=True)
 
     def reset_rss_cache(self) -> None:
         """
@@ -139,7 +444,7 @@ class Poller:
         """
         self.source_cache.clear()
 
-    async def poll(self, force: bool = False) -> list[FoundEntry]:
+    async def poll(self, force: bool = False, due_only: bool = False) -> list[FoundEntry]:
         """
         Iterates through every installed RSS source
         and will check for new items to download.
@@ -147,10 +452,19 @@ class Poller:
         Returns a list of releases found in the format
         (show_id, episode).
 
+        Only one poll runs at a time. A call made while a
+        poll is in flight joins it and shares its result if
+        that poll covers the call's arguments, otherwise a
+        single stronger poll is queued behind it and shared
+        by every such caller.
+
         Parameters
         ----------
         force: bool
             If True, will force a re-fetch of the RSS feed
+        due_only: bool
+            If True, only sources whose adaptive schedule
+            is due are checked.
 
         Returns
         -------
@@ -158,30 +472,298 @@ class Poller:
             A list of tuples in the format (show_id, episode).
             These are newly found entries that have begun processing.
         """
+        task = self.poll_task
+        if task is not None and not task.done():
+            running_force, running_due_only = self.poll_task_args
+            if (running_force or not force) and (due_only or not running_due_only):
+                logger.info("Joining in-flight check for New Releases")
+                return await asyncio.shield(task)
+
+            if self.trailing_poll_task is None or self.trailing_poll_task.done():
+                logger.info("Queueing a check for New Releases behind the in-flight check")
+                self.trailing_poll_task = asyncio.ensure_future(self._poll_after_in_flight())
+            return await asyncio.shield(self.trailing_poll_task)
+
+        self.poll_task_args = (force, due_only)
+        self.poll_task = asyncio.ensure_future(self._run_poll(force, due_only))
+        return await asyncio.shield(self.poll_task)
+
+    async def _poll_after_in_flight(self) -> list[FoundEntry]:
+        # The queued poll is always the strongest kind, so it covers
+        # every caller that could not join the in-flight poll.
+        while self.poll_task is not None and not self.poll_task.done():
+            await asyncio.wait([self.poll_task])
+
+        self.poll_task_args = (True, False)
+        self.poll_task = asyncio.ensure_future(self._run_poll(True, False))
+        return await self.poll_task
+
+    async def _run_poll(self, force: bool, due_only: bool) -> list[FoundEntry]:
         logger.info(f"Checking for New Releases... [force: {force}]")
 
         if force:
             self.reset_rss_cache()
 
-        found = []
+        await self.app.episode_map.load(self.app)
 
-        async for source in get_all_sources():
-            items = await self.get_items_from_source(source)
-            if not items:
-                continue
+        sources = [source async for source in get_all_sources()]
+        if self.polling_mode == "targeted":
+            sources = await self.get_targeted_sources(sources)
+
+        # Schedules of removed sources, or of search feeds for shows that are
+        # no longer watched, would otherwise keep the next poll overdue forever.
+        current = {source.name for source in sources}
+        for name in self.source_schedule.keys() - current:
+            del self.source_schedule[name]
+
+        if due_only:
+            now = self.loop.time()
+            sources = [source for source in sources if self.get_schedule(source).is_due(now)]
 
-            logger.info(f"`{source.name}@{source.version}` - Checking for New Releases...")
-            source_items = await self.check_feed(source, items)
-            found += source_items
-            logger.info(f"`{source.name}@{source.version}` - Checked for New Releases, {len(source_items)} items found")
+        # Every source moves through fetch, parse, match, resolve and handle
+        # stages independently, so a slow download client call for one feed
+        # does not hold up parsing the next.
+        pipeline = self.build_pipeline(fetch=True)
+        found = await pipeline.run(sources)
+
+        self.stage_stats = pipeline.stats
+        logger.debug(f"Poll stages: {'; '.join(str(stats) for stats in self.stage_stats)}")
 
         logger.info(f"Checked for New Releases, total of {len(found)} items found")
 
+        stats = self.app.parse_cache.stats
+        logger.debug(f"Parse cache: {stats.hits} hits, {stats.persistent_hits} persistent hits, {stats.misses} misses, {stats.size} cached")
+
         # This still returns information, despite not being used in this particular
         # task, because the REST API hooks into the running Poller task and will call
         # this. See: tsundoku/blueprints/api/routes.py#check_for_releases  # noqa: ERA001
         return found
 
+    async def get_targeted_sources(self, sources: list[Source]) -> list[Source]:
+        """
+        Replaces every nyaa.si source with one search
+        feed per watched show, so that only releases
+        that could match are downloaded and parsed.
+
+        Each search feed is its own source with its own
+        cache, so it is fetched with conditional GETs.
+
+        Parameters
+        ----------
+        sources: list[Source]
+            The installed sources.
+
+        Returns
+        -------
+        List[Source]
+            The sources to poll.
+        """
+        await self.app.show_index.ensure_loaded(self.app)
+        titles = self.app.show_index.titles
+
+        targeted = []
+        for source in sources:
+            if urlsplit(source.url).hostname != "nyaa.si":
+                targeted.append(source)
+                continue
+
+            targeted += [
+                replace(
+                    source,
+                    name=f"{source.name} search: {title}",
+                    url=NyaaSearcher._get_query_url(title, newest_first=True),
+                    page_parameter=None,
+                )
+                for title in titles
+            ]
+
+        return targeted
+
+    def build_pipeline(self, fetch: bool) -> Pipeline:
+        """
+        Builds the staged pipeline that sources
+        or feed items are checked with.
+
+        Parameters
+        ----------
+        fetch: bool
+            Whether the pipeline starts by fetching
+            sources, or with already fetched items.
+
+        Returns
+        -------
+        Pipeline
+            The pipeline.
+        """
+        concurrency = self.stage_concurrency
+
+        # Releases claimed by earlier feeds checked with this pipeline.
+        release_keys: set[str] = set()
+
+        pipeline = Pipeline(STAGE_QUEUE_SIZE)
+        if fetch:
+            pipeline.add_stage("fetch", concurrency["fetch"], self.fetch_stage)
+        pipeline.add_stage("dedupe", concurrency["dedupe"], partial(self.dedupe_stage, release_keys))
+        pipeline.add_stage("parse", concurrency["parse"], self.parse_stage)
+        pipeline.add_stage("match", concurrency["match"], self.match_stage)
+        pipeline.add_stage("resolve", concurrency["resolve"], self.resolve_stage)
+        pipeline.add_stage("handle", concurrency["handle"], self.handle_stage)
+
+        return pipeline
+
+    async def fetch_stage(self, source: Source) -> list[tuple[Source, list[dict]]]:
+        """
+        Fetches the new items of a source.
+        """
+        items = await self.fetch_items_from_source(source)
+        if not items:
+            return []
+
+        return [(source, items)]
+
+    async def dedupe_stage(self, release_keys: set[str], fetched: tuple[Source, list[dict]]) -> list[tuple[Source, list[dict]]]:
+        """
+        Drops items whose release was already listed
+        by another feed checked in the same poll.
+
+        An item is a duplicate if any of its keys was
+        claimed, so a release listed with its infohash
+        on one feed and only by name on another is
+        still recognised.
+        """
+        source, items = fetched
+
+        unique = []
+        for item in items:
+            try:
+                keys = self.get_release_keys(source, item)
+            except Exception:
+                logger.exception(f"`{source.name}@{source.version}` - poller failed to read item '{item!r}', skipping it", exc_info=True)
+                continue
+
+            if not release_keys.isdisjoint(keys):
+                logger.debug(f"`{source.name}@{source.version}` - Skipping duplicate release '{item!r}'")
+                continue
+
+            release_keys.update(keys)
+            unique.append(item)
+
+        if not unique:
+            return []
+
+        return [(source, unique)]
+
+    async def parse_stage(self, fetched: tuple[Source, list[dict]]) -> list[tuple[Source, list[dict]]]:
+        """
+        Warms the parse cache with every title of a fetched feed.
+        """
+        source, items = fetched
+
+        parsable = []
+        titles = []
+        for item in items:
+            try:
+                titles.append(source.get_filename(item))
+            except Exception:
+                logger.exception(f"`{source.name}@{source.version}` - poller failed to read the title of item '{item!r}', skipping it", exc_info=True)
+                continue
+
+            parsable.append(item)
+
+        if not parsable:
+            return []
+
+        try:
+            await self.app.parse_cache.preload(self.app, titles)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - failed to load cached parse results", exc_info=True)
+
+        try:
+            await self.parse_in_batch(titles)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - batch parse failed, parsing inline", exc_info=True)
+
+        return [(source, parsable)]
+
+    async def match_stage(self, parsed: tuple[Source, list[dict]]) -> list[tuple[Source, MatchedRelease]]:
+        """
+        Matches the items of a feed against watched shows, storing
+        unmatched releases as seen releases.
+        """
+        source, items = parsed
+        logger.info(f"`{source.name}@{source.version}` - Checking for New Releases...")
+
+        matches = []
+        seen_releases: list[tuple[ParserResult, str]] = []
+
+        for item in items:
+            try:
+                match = await self.check_item(source, item, seen_releases)
+
+                if match:
+                    matches.append((source, match))
+            except Exception:
+                logger.exception(
+                    f"`{source.name}@{source.version}` - poller failed to check item '{item!r}'",
+                    exc_info=True,
+                )
+
+        try:
+            await SeenRelease.add_many(self.app, seen_releases)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - failed to add seen releases", exc_info=True)
+
+        try:
+            await self.app.parse_cache.flush(self.app)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - failed to save parse results", exc_info=True)
+
+        logger.info(f"`{source.name}@{source.version}` - Checked for New Releases, {len(matches)} items matched")
+        return matches
+
+    async def resolve_stage(self, matched: tuple[Source, MatchedRelease]) -> list[tuple[MatchedRelease, str]]:
+        """
+        Resolves the magnet URL of a matched release.
+        """
+        source, match = matched
+
+        try:
+            # Only batches without an episode range in their title need their
+            # files listed, which downloads the torrent file.
+            if match.episodes is not None and not match.episodes:
+                batch = await self.list_batch_episodes(source, match)
+                if batch is None:
+                    return []
+                match = batch
+
+            magnet_url = await self.get_torrent_link(source, match.item)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - poller failed to resolve torrent link for '{match.item!r}'", exc_info=True)
+            return []
+
+        return [(match, magnet_url)]
+
+    async def handle_stage(self, resolved: tuple[MatchedRelease, str]) -> list[FoundEntry]:
+        """
+        Begins handling a resolved release.
+        """
+        match, magnet_url = resolved
+
+        if match.episodes is not None:
+            episodes = [episode for episode in match.episodes if not self.is_parsed(match.show_id, episode, match.version)]
+            if not episodes:
+                return []
+
+            await self.app.downloader.begin_handling_batch(match.show_id, episodes, magnet_url, match.version)
+            return [FoundEntry(match.show_id, episode) for episode in episodes]
+
+        # Another release handled in this poll may have claimed the episode.
+        if self.is_parsed(match.show_id, match.episode, match.version):
+            return []
+
+        await self.app.downloader.begin_handling(match.show_id, match.episode, magnet_url, match.version)
+        return [FoundEntry(match.show_id, match.episode)]
+
     async def check_feed(self, source: Source, items: list[dict]) -> list[FoundEntry]:
         """
         Iterates through the list of items in an
@@ -200,23 +782,48 @@ class Poller:
             A list of tuples in the format (show_id, episode).
             These are newly found entries that have begun processing.
         """
-        found_items = []
+        if not items:
+            return []
+
+        return await self.build_pipeline(fetch=False).run([(source, items)])
+
+    async def parse_in_batch(self, titles: list[str]) -> None:
+        """
+        Parses every title that is not already in the
+        parse cache as a single batch on the parse worker
+        processes, so that a large feed page does not block
+        the event loop.
 
-        for item in items:
-            try:
-                found = await self.check_item(source, item)
+        Does nothing if parse workers are disabled. If a
+        worker process died, the workers are restarted and
+        the batch is parsed in this process instead.
 
-                if found:
-                    found_items.append(found)
-            except Exception:
-                logger.exception(
-                    f"`{source.name}@{source.version}` - poller failed to check item '{item!r}'",
-                    exc_info=True,
-                )
+        Parameters
+        ----------
+        titles: list[str]
+            The titles to parse.
+        """
+        if self.parse_executor is None:
+            return
 
-        return found_items
+        missing = list(dict.fromkeys(title for title in titles if title not in self.app.parse_cache))
+        if not missing:
+            return
 
-    async def is_parsed(self, show_id: int, episode: int, version: str) -> bool:
+        try:
+            results = await self.loop.run_in_executor(self.parse_executor, parse_anime_title_batch, missing)
+        except BrokenProcessPool:
+            logger.warning("A parse worker process died, restarting parse workers", exc_info=True)
+            self.shutdown_parse_executor()
+            self.create_parse_executor()
+
+            results = await self.loop.run_in_executor(None, parse_anime_title_batch, missing)
+
+        for title, result in zip(missing, results, strict=True):
+            if result is not None:
+                self.app.parse_cache.put(title, result)
+
+    def is_parsed(self, show_id: int, episode: int, version: str) -> bool:
         """
         Will check if a specified episode of a
         show has already been parsed.
@@ -235,30 +842,11 @@ class Poller:
         bool
             True if the episode has been parsed, False otherwise.
         """
-        async with self.app.acquire_db() as con:
-            entries = await con.fetchall(
-                """
-                SELECT
-                    id,
-                    version,
-                    created_manually
-                FROM
-                    show_entry
-                WHERE show_id=? AND episode=?;
-            """,
-                show_id,
-                episode,
-            )
-
-        if not entries:
+        parsed = self.app.episode_map.get(show_id, episode)
+        if parsed is None:
             return False
 
-        def compare(first: Row, second: Row) -> int:
-            return compare_version_strings(first["version"], second["version"])
-
-        entries = sorted(entries, key=cmp_to_key(compare), reverse=True)
-
-        return entries[0]["created_manually"] or compare_version_strings(entries[0]["version"], version) >= 0
+        return parsed.created_manually or compare_version_strings(parsed.version, version) >= 0
 
     async def check_item_for_match(self, show_name: str) -> EntryMatch | None:
         """
@@ -279,52 +867,46 @@ class Poller:
             The EntryMatch for the passed show name.
             Could be None if no shows are desired.
         """
-        async with self.app.acquire_db() as con:
-            desired_shows = await con.fetchall(
-                """
-                SELECT
-                    id,
-                    title,
-                    watch,
-                    preferred_resolution,
-                    preferred_release_group
-                FROM
-                    shows;
-            """
-            )
-        show_list = {show["title"]: show["id"] for show in desired_shows if show["watch"]}
+        index = self.app.show_index
+        await index.ensure_loaded(self.app)
 
-        if not show_list:
+        titles = index.titles
+        if not titles:
             return None
 
         # Extracts a tuple in the format (matched_str, percent_match)
-        match = extract_one(show_name, list(show_list.keys()))
+        match = extract_one(show_name, titles)
 
         if match:
-            return EntryMatch(show_name, show_list[match[0]], match[1])
+            show = index.get_by_title(match[0])
+            if show is not None:
+                return EntryMatch(show_name, show.id_, match[1])
 
         return None
 
-    async def check_item(self, source: Source, item: dict) -> FoundEntry | None:
+    async def check_item(self, source: Source, item: dict, seen_releases: list[tuple[ParserResult, str]]) -> MatchedRelease | None:
         """
         Checks an item to see if it is from a
-        desired show entry, and will then begin
-        downloading the item if so.
+        desired show entry that should be downloaded.
 
         Parameters
         ----------
         item: dict
             The item to check for matches.
+        seen_releases: list[tuple[ParserResult, str]]
+            Unmatched releases are appended to this
+            list to be stored as seen releases in bulk.
 
         Returns
         -------
-        Optional[FoundEntry]
-            A tuple with (show_id, episode)
+        Optional[MatchedRelease]
+            The matched release, if the item
+            should be downloaded.
         """
         filename = source.get_filename(item)
 
         try:
-            parsed = parse_anime_title(filename)
+            parsed = self.app.parse_cache.parse(filename)
         except Exception:
             logger.exception(
                 f"`{source.name}@{source.version}` - anitomy failed to parse '{filename}'",
@@ -344,62 +926,199 @@ class Poller:
         if "anime_title" not in parsed:
             logger.warning(f"`{source.name}@{source.version}` - anitomy failed to retrieve 'anime_title' from '{filename}'")
             return None
-        if "episode_number" not in parsed:
-            logger.warning(f"`{source.name}@{source.version}` - anitomy failed to retrieve 'episode_number' from '{filename}'")
-            return None
-        if "batch" in release_info or isinstance(parsed["episode_number"], list):
+
+        episode = parsed.get("episode_number")
+        if "batch" in release_info or isinstance(episode, list):
+            if self.batch_backfill:
+                return await self.check_batch_item(source, item, parsed)
+
             logger.info(f"`{source.name}@{source.version}` - Ignoring batch release '{filename}'")
             return None
-        if not parsed["episode_number"].isdigit():
-            logger.info(f"`{source.name}@{source.version}` - Episode '{parsed['episode_number']}' is not an integer '{filename}'")
+
+        if episode is None:
+            logger.warning(f"`{source.name}@{source.version}` - anitomy failed to retrieve 'episode_number' from '{filename}'")
             return None
+        if not episode.isdigit():
+            logger.info(f"`{source.name}@{source.version}` - Episode '{episode}' is not an integer '{filename}'")
+            return None
+
+        show_episode = int(episode)
+
+        # One search of the combined pattern covers every show's rules.
+        await self.app.show_rules.ensure_loaded(self.app)
+        rejected = self.app.show_rules.rejected_shows(filename)
 
-        show_episode = int(parsed["episode_number"])
         match = await self.check_item_for_match(parsed["anime_title"])
 
         if match is None or match.match_percent < self.fuzzy_match_cutoff:
-            await SeenRelease.add(self.app, parsed, source.get_torrent(item))
+            seen_releases.append((parsed, source.get_torrent(item)))
             return None
 
-        release_version = parsed.get("release_version", "v0")
-        if not release_version.startswith("v"):
-            release_version = f"v{release_version}"
+        release_version = get_release_version(parsed)
+        if self.is_parsed(match.matched_id, show_episode, release_version):
+            return None
 
-        if await self.is_parsed(match.matched_id, show_episode, release_version):
+        if not self.check_show_filters(source, filename, parsed, match.matched_id, rejected):
             return None
 
-        async with self.app.acquire_db() as con:
-            preferences = await con.fetchone(
-                """
-                SELECT
-                    preferred_resolution,
-                    preferred_release_group
-                FROM
-                    shows
-                WHERE
-                    id=?;
-            """,
-                match.matched_id,
-            )
+        logger.info(f"`{source.name}@{source.version}` - Release Found for <s{match.matched_id}>, episode {show_episode}{release_version}")
+
+        return MatchedRelease(match.matched_id, show_episode, release_version, item)
+
+    def check_show_filters(self, source: Source, filename: str, parsed: ParserResult, show_id: int, rejected: set[int]) -> bool:
+        """
+        Checks a release of a watched show against the
+        show's rules and preferences.
+
+        Parameters
+        ----------
+        source: Source
+            The source the release is from.
+        filename: str
+            The release's filename.
+        parsed: ParserResult
+            The parsed filename.
+        show_id: int
+            The ID of the matched show.
+        rejected: set[int]
+            The shows whose rules reject the release.
+
+        Returns
+        -------
+        bool
+            True if the release should be downloaded.
+        """
+        if show_id in rejected:
+            logger.info(f"`{source.name}@{source.version}` - Ignoring release for '{filename}', rejected by the rules of <s{show_id}>")
+            return False
 
-        preferred_resolution = preferences["preferred_resolution"]
-        preferred_release_group = preferences["preferred_release_group"]
+        show = self.app.show_index.get_by_id(show_id)
+        if show is None:
+            return False
+
+        preferred_resolution = show.preferred_resolution
+        preferred_release_group = show.preferred_release_group
 
         resolution = normalize_resolution(parsed.get("video_resolution", ""))
         release_group = parsed.get("release_group")
         if preferred_resolution is not None and resolution != preferred_resolution:
             logger.info(f"`{source.name}@{source.version}` - Ignoring release for '{filename}', resolution {resolution} does not match preferred resolution {preferred_resolution}")
-            return None
+            return False
         if preferred_release_group is not None and release_group != preferred_release_group:
             logger.info(f"`{source.name}@{source.version}` - Ignoring release for '{filename}', release group {release_group} does not match preferred release group {preferred_release_group}")
+            return False
+
+        return True
+
+    async def check_batch_item(self, source: Source, item: dict, parsed: ParserResult) -> MatchedRelease | None:
+        """
+        Checks a batch release to see if it covers
+        enough missing episodes of a watched show
+        to be downloaded.
+
+        Parameters
+        ----------
+        source: Source
+            The source the item is from.
+        item: dict
+            The batch release.
+        parsed: ParserResult
+            The parsed filename of the release.
+
+        Returns
+        -------
+        Optional[MatchedRelease]
+            The matched batch, if it should be downloaded.
+        """
+        filename = source.get_filename(item)
+
+        await self.app.show_rules.ensure_loaded(self.app)
+        rejected = self.app.show_rules.rejected_shows(filename)
+
+        match = await self.check_item_for_match(parsed["anime_title"])
+        if match is None or match.match_percent < self.fuzzy_match_cutoff:
             return None
 
-        logger.info(f"`{source.name}@{source.version}` - Release Found for <s{match.matched_id}>, episode {show_episode}{release_version}")
+        release_version = get_release_version(parsed)
+        if not self.check_show_filters(source, filename, parsed, match.matched_id, rejected):
+            return None
 
-        magnet_url = await self.get_torrent_link(source, item)
-        await self.app.downloader.begin_handling(match.matched_id, show_episode, magnet_url, release_version)
+        # Without an episode range in the title, the covered
+        # episodes are only known once the files are listed.
+        missing: list[int] = []
+        episodes = get_batch_episodes(parsed)
+        if episodes:
+            missing = [episode for episode in episodes if not self.is_parsed(match.matched_id, episode, release_version)]
+            if len(missing) < BATCH_MIN_MISSING:
+                logger.info(f"`{source.name}@{source.version}` - Ignoring batch release '{filename}', <s{match.matched_id}> is missing {len(missing)} of its episodes")
+                return None
 
-        return FoundEntry(match.matched_id, show_episode)
+        logger.info(f"`{source.name}@{source.version}` - Batch Release Found for <s{match.matched_id}>, '{filename}'")
+
+        return MatchedRelease(match.matched_id, 0, release_version, item, tuple(missing))
+
+    async def list_batch_episodes(self, source: Source, match: MatchedRelease) -> MatchedRelease | None:
+        """
+        Lists the files of a matched batch release to
+        find the missing episodes it covers. Falls back
+        to the title's episode range if the files can not
+        be listed.
+
+        Parameters
+        ----------
+        source: Source
+            The source the batch is from.
+        match: MatchedRelease
+            The matched batch.
+
+        Returns
+        -------
+        Optional[MatchedRelease]
+            The batch with its covered episodes, or None if it
+            does not cover enough missing episodes.
+        """
+        result = SearchResult.from_necessary(self.app, match.show_id, source.get_torrent(match.item))
+        try:
+            async with self.magnet_semaphore:
+                listed = await result.get_episodes()
+        except Exception:
+            logger.warning(f"`{source.name}@{source.version}` - failed to list the files of batch release '{source.get_filename(match.item)}'", exc_info=True)
+            listed = []
+
+        episodes = sorted({episode for episode in listed or match.episodes or () if not self.is_parsed(match.show_id, episode, match.version)})
+        if len(episodes) < BATCH_MIN_MISSING:
+            logger.info(f"`{source.name}@{source.version}` - Ignoring batch release '{source.get_filename(match.item)}', <s{match.show_id}> is missing {len(episodes)} of its episodes")
+            return None
+
+        return match._replace(episodes=tuple(episodes))
+
+    def get_release_keys(self, source: Source, item: dict) -> set[str]:
+        """
+        Returns the keys identifying the release an item
+        is for, independent of the source listing it.
+
+        Parameters
+        ----------
+        source: Source
+            The source the item is from.
+        item: dict
+            The item.
+
+        Returns
+        -------
+        Set[str]
+            Every infohash the item exposes, and its
+            normalized filename.
+        """
+        candidates = [value for key, value in item.items() if key.endswith("_infohash") and isinstance(value, str)]
+        candidates.append(source.get_torrent(item))
+
+        infohashes = {normalize_infohash(candidate) for candidate in candidates}
+        infohashes.add(source.get_infohash(item))
+
+        keys = {f"btih:{infohash}" for infohash in infohashes if infohash is not None}
+        keys.add(f"name:{normalize_release_name(source.get_filename(item))}")
+        return keys
 
     def hash_rss_item(self, item: dict) -> str:
         """
@@ -424,6 +1143,360 @@ class Poller:
 
         return hashlib.sha256(to_hash.encode("utf-8")).hexdigest()
 
+    def get_item_key(self, item: dict) -> str:
+        """
+        Returns a compact key identifying an RSS item.
+
+        The item's guid is used when present, as it is
+        the feed's own stable identifier for the item,
+        otherwise the item's hash is used.
+
+        Parameters
+        ----------
+        item: dict
+            The item to get the key of.
+
+        Returns
+        -------
+        str
+            A 16 character hex key for the item.
+        """
+        guid = item.get("id")
+        if isinstance(guid, str) and guid:
+            return hashlib.sha256(guid.encode("utf-8")).hexdigest()[:16]
+
+        return self.hash_rss_item(item)[:16]
+
+    async def fetch_feed(self, source: Source, headers: dict[str, str], page: int = 1) -> FeedResponse:
+        """
+        Downloads the raw feed of a source using
+        the app's shared HTTP session, within the
+        source's timeouts and response size limit.
+
+        Parameters
+        ----------
+        source: Source
+            The source to download the feed of.
+        headers: dict[str, str]
+            Additional request headers, such as
+            conditional GET headers.
+        page: int
+            The page of the feed to download.
+
+        Returns
+        -------
+        FeedResponse
+            The status, caching headers, and body of the response.
+
+        Raises
+        ------
+        FeedFetchError
+            The response was larger than the source allows.
+        """
+        timeout = aiohttp.ClientTimeout(
+            total=source.connect_timeout + source.read_timeout,
+            sock_connect=source.connect_timeout,
+            sock_read=source.read_timeout,
+        )
+
+        async with self.app.session.get(source.get_page_url(page), headers=headers, timeout=timeout) as resp:
+            if resp.content_length is not None and resp.content_length > source.max_response_size:
+                raise FeedFetchError(f"response of {resp.content_length} bytes exceeds the limit of {source.max_response_size} bytes")
+
+            body = bytearray()
+            async for chunk in resp.content.iter_chunked(64 * 1024):
+                body += chunk
+                if len(body) > source.max_response_size:
+                    raise FeedFetchError(f"response exceeds the limit of {source.max_response_size} bytes")
+
+            return FeedResponse(resp.status, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), bytes(body))
+
+    async def get_shared_items(self, source: Source) -> list[dict] | None:
+        """
+        Returns the new items another instance published
+        for a shared source, if that instance holds the
+        source's lease.
+
+        Parameters
+        ----------
+        source: Source
+            The source to get items of.
+
+        Returns
+        -------
+        Optional[List[dict]]
+            The new published items, or None if this instance
+            should fetch the source itself.
+        """
+        if self.shared_sources is None:
+            return None
+
+        try:
+            if await self.shared_sources.acquire(source.name):
+                return None
+
+            items = await self.shared_sources.read(source.name)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - failed to read shared source, fetching it directly", exc_info=True)
+            return None
+
+        logger.debug(f"`{source.name}@{source.version}` - read {len(items)} items published by another instance")
+        return await self.take_new_items(source, self.source_cache[source.name], items)
+
+    async def publish_shared_items(self, source: Source, items: list[dict]) -> None:
+        """
+        Publishes the new items of a fetched source to the
+        other instances, if this instance holds its lease.
+
+        Parameters
+        ----------
+        source: Source
+            The fetched source.
+        items: list[dict]
+            The new items.
+        """
+        if self.shared_sources is None or not self.shared_sources.holds(source.name):
+            return
+
+        try:
+            await self.shared_sources.publish(source.name, items)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - failed to publish shared items", exc_info=True)
+
+    async def record_response(self, source: Source, page: int, headers: dict[str, str], response: FeedResponse) -> None:
+        """
+        Saves a feed response for offline replay,
+        if recording is enabled.
+
+        Parameters
+        ----------
+        source: Source
+            The source that was fetched.
+        page: int
+            The page that was fetched.
+        headers: dict[str, str]
+            The headers the feed was requested with.
+        response: FeedResponse
+            The response.
+        """
+        if self.recorder is None:
+            return
+
+        try:
+            await self.loop.run_in_executor(None, self.recorder.record, source, page, headers, response)
+        except Exception:
+            logger.exception(f"`{source.name}@{source.version}` - failed to record feed response", exc_info=True)
+
+    async def fetch_items_from_source(self, source: Source) -> list[dict]:
+        """
+        Wrapper around `get_items_from_source` that
+        logs and swallows any errors, so that one failing
+        source does not fail the entire poll.
+
+        Sources that keep failing are skipped for a
+        while by their circuit breaker.
+
+        Parameters
+        ----------
+        source: Source
+            The source to retrieve new items from.
+
+        Returns
+        -------
+        List[dict]
+            New items in the RSS feed.
+        """
+        failed = False
+        items = await self.get_shared_items(source)
+        if items is None:
+            breaker = self.source_breaker[source.name]
+            if not breaker.allow(self.loop.time()):
+                logger.debug(f"`{source.name}@{source.version}` - skipping source, circuit breaker is open")
+                if self.is_adaptive:
+                    self.get_schedule(source).record_failure(self.loop.time())
+                return []
+
+            try:
+                items = await self.get_items_from_source(source)
+            except Exception as e:
+                if isinstance(e, FeedFetchError | asyncio.TimeoutError | aiohttp.ClientError):
+                    logger.warning(f"`{source.name}@{source.version}` - failed to fetch feed: {e!r}")
+                else:
+                    logger.exception(f"`{source.name}@{source.version}` - failed to fetch feed", exc_info=True)
+
+                backoff = breaker.record_failure(self.loop.time(), repr(e))
+                if backoff is not None:
+                    logger.warning(f"`{source.name}@{source.version}` - source failed {breaker.failures} times in a row, skipping it for {backoff:.0f} seconds")
+                items = []
+                failed = True
+            else:
+                breaker.record_success()
+                await self.publish_shared_items(source, items)
+
+        if self.min_interval is not None and self.max_interval is not None:
+            schedule = self.get_schedule(source)
+            if failed:
+                schedule.record_failure(self.loop.time())
+            else:
+                schedule.record(len(items), self.loop.time(), self.min_interval, self.max_interval)
+            logger.debug(f"`{source.name}@{source.version}` - next poll in {schedule.interval:.0f} seconds")
+
+        return items
+
+    def parse_feed(self, source: Source, body: bytes, cache: SourceCache) -> list[dict]:
+        """
+        Parses the items of a downloaded feed.
+
+        JSON sources are decoded with their item mapping. RSS 2.0
+        feeds are parsed with the streaming parser, which only
+        pulls the fields the source maps and stops once it
+        reaches items that were already seen. Any other feed
+        is handed to feedparser.
+
+        Parameters
+        ----------
+        source: Source
+            The source the feed belongs to.
+        body: bytes
+            The downloaded feed.
+        cache: SourceCache
+            The source's cache, used to recognize
+            already seen items.
+
+        Returns
+        -------
+        List[dict]
+            The feed's items, in feed order.
+        """
+        if source.json_map is not None:
+            return source.json_map.get_items(body)
+
+        fields = (source.rss_key_map.filename, source.rss_key_map.torrent)
+        optional_fields = (source.rss_key_map.infohash,) if source.rss_key_map.infohash is not None else ()
+        try:
+            return parse_rss_items(body, fields, lambda item: self.get_item_key(item) in cache.seen_items, optional_fields)
+        except UnsupportedFeedError as e:
+            logger.debug(f"`{source.name}@{source.version}` - falling back to feedparser: {e}")
+
+        # feedparser only ever sees the downloaded bytes, never the URL.
+        return feedparser.parse(body)["items"]
+
+    def needs_catch_up(self, source: Source, cache: SourceCache, items: list[dict]) -> bool:
+        """
+        Returns whether older pages of a source
+        should be fetched to fill a gap.
+
+        Parameters
+        ----------
+        source: Source
+            The source that was fetched.
+        cache: SourceCache
+            The source's cache.
+        items: list[dict]
+            The items on the first page.
+
+        Returns
+        -------
+        bool
+            True if no item on the first page was seen
+            before, and the source can be paged.
+        """
+        if not self.catch_up_depth or source.page_parameter is None:
+            return False
+
+        # Nothing to catch up to on the very first fetch of a source.
+        if not len(cache.seen_items) or not items:
+            return False
+
+        return not any(self.get_item_key(item) in cache.seen_items for item in items)
+
+    async def fetch_page(self, source: Source, cache: SourceCache, page: int) -> list[dict]:
+        """
+        Fetches and parses an older page of a source.
+
+        Parameters
+        ----------
+        source: Source
+            The source to fetch.
+        cache: SourceCache
+            The source's cache.
+        page: int
+            The page to fetch.
+
+        Returns
+        -------
+        List[dict]
+            The items on the page, empty if
+            the page could not be fetched.
+        """
+        headers = {"Accept-Encoding": "gzip"}
+        async with self.fetch_semaphore:
+            response = await self.fetch_feed(source, headers, page)
+
+        await self.record_response(source, page, headers, response)
+
+        if not 200 <= response.status < 300:
+            logger.warning(f"`{source.name}@{source.version}` - page {page} responded with status {response.status}")
+            return []
+
+        return await self.loop.run_in_executor(None, self.parse_feed, source, response.body, cache)
+
+    async def catch_up(self, source: Source, cache: SourceCache) -> list[dict]:
+        """
+        Fetches older pages of a source until an already
+        seen item is found or `catch_up_depth` pages
+        were read.
+
+        Parameters
+        ----------
+        source: Source
+            The source to catch up on.
+        cache: SourceCache
+            The source's cache.
+
+        Returns
+        -------
+        List[dict]
+            The items on the older pages that could be
+            fetched, newest first.
+        """
+        logger.info(f"`{source.name}@{source.version}` - no previously seen items on the first page, catching up on up to {self.catch_up_depth} older pages")
+
+        items: list[dict] = []
+        last_page = self.catch_up_depth + 1
+        for start in range(2, last_page + 1, CATCH_UP_CONCURRENCY):
+            pages = range(start, min(start + CATCH_UP_CONCURRENCY, last_page + 1))
+            responses = await asyncio.gather(*(self.fetch_page(source, cache, page) for page in pages), return_exceptions=True)
+
+            results: list[list[dict]] = []
+            failed = False
+            for page, result in zip(pages, responses, strict=True):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+
+                    logger.warning(f"`{source.name}@{source.version}` - failed to fetch page {page} while catching up: {result!r}")
+                    failed = True
+                    continue
+
+                results.append(result)
+                items += result
+
+            if failed:
+                logger.warning(f"`{source.name}@{source.version}` - stopped catching up after a failed page, some releases may be missed")
+                break
+
+            if any(not page_items for page_items in results):
+                logger.info(f"`{source.name}@{source.version}` - reached the end of the feed while catching up")
+                break
+
+            if any(self.get_item_key(item) in cache.seen_items for page_items in results for item in page_items):
+                break
+        else:
+            logger.warning(f"`{source.name}@{source.version}` - catch-up depth reached before finding a seen item, some releases may be missed")
+
+        return items
+
     async def get_items_from_source(self, source: Source) -> list[dict]:
         """
         Returns new items from the current
@@ -434,56 +1507,73 @@ class Poller:
         List[dict]
             New items in the RSS feed.
         """
-        feed = await self.loop.run_in_executor(
-            None,
-            partial(
-                feedparser.parse,
-                source.url,
-                etag=self.source_cache[source.name].last_etag,
-                modified=self.source_cache[source.name].last_modified,
-            ),
-        )
+        cache = self.source_cache[source.name]
 
-        if hasattr(feed, "etag"):
-            self.source_cache[source.name].last_etag = feed.etag
-        else:
-            self.source_cache[source.name].last_etag = None
+        headers = {"Accept-Encoding": "gzip"}
+        if cache.last_etag is not None:
+            headers["If-None-Match"] = cache.last_etag
+        if cache.last_modified is not None:
+            headers["If-Modified-Since"] = cache.last_modified
 
-        if hasattr(feed, "modified"):
-            self.source_cache[source.name].last_modified = feed.modified
-        else:
-            self.source_cache[source.name].last_modified = None
+        async with self.fetch_semaphore:
+            response = await self.fetch_feed(source, headers)
+
+        await self.record_response(source, 1, headers, response)
 
         # 304 status means no new items according to the etag/modified attributes.
-        if hasattr(feed, "status") and feed.status == 304:
+        if response.status == 304:
             return []
 
-        if self.source_cache[source.name].last_etag is not None or self.source_cache[source.name].last_modified is not None:
-            return feed["items"]
+        if not 200 <= response.status < 300:
+            raise FeedFetchError(f"feed responded with status {response.status}")
 
-        new_items = []
+        items = await self.loop.run_in_executor(None, self.parse_feed, source, response.body, cache)
 
-        # Since new items in the RSS feed are inserted at index 0,
-        # the 0th index item is the most recent item in the feed.
-        if feed["items"]:
-            # If the first item in the feed is the same as it was
-            # on the previous iteration, the feed has no new items.
-            first_hash = self.hash_rss_item(feed["items"][0])
-            if first_hash == self.source_cache[source.name].most_recent_hash:
-                return []
+        # If nothing on the first page was seen before, Tsundoku was likely
+        # down for longer than the page covers and older pages may hold
+        # releases that would otherwise be missed.
+        if self.needs_catch_up(source, cache, items):
+            items += await self.catch_up(source, cache)
+
+        # The validators are only saved along with the items they cover,
+        # otherwise a failure above would turn the next fetch into a 304
+        # and the items on this response would never be checked.
+        cache.last_etag = response.etag
+        cache.last_modified = response.last_modified
 
-            new_items.append(feed["items"][0])
+        return await self.take_new_items(source, cache, items)
 
-            # Iterate through the rest of the items in the feed,
-            # repeating the same process above.
-            for item in feed["items"][1:]:
-                item_hash = self.hash_rss_item(item)
-                if item_hash == self.source_cache[source.name].most_recent_hash:
-                    break
+    async def take_new_items(self, source: Source, cache: SourceCache, items: list[dict]) -> list[dict]:
+        """
+        Returns the items of a source that were not seen
+        before, remembering them as seen.
 
+        Parameters
+        ----------
+        source: Source
+            The source the items are from.
+        cache: SourceCache
+            The source's cache.
+        items: list[dict]
+            The items.
+
+        Returns
+        -------
+        List[dict]
+            The new items.
+        """
+        # Only items that have not been processed on a previous poll are new.
+        # Keys are compared against every remembered item rather than a single
+        # anchor, so upstream removals or reordering do not make the whole feed
+        # look new again.
+        new_items = []
+        for item in items:
+            key = self.get_item_key(item)
+            if key not in cache.seen_items:
                 new_items.append(item)
+                cache.seen_items.add(key)
 
-            self.source_cache[source.name].most_recent_hash = first_hash
+        await cache.save(self.app, source.name)
 
         return new_items
 
@@ -501,4 +1591,10 @@ class Poller:
         str
             The found magnet URL.
         """
-        return await self.app.dl_client.get_magnet(source.get_torrent(item))
+        # Sources that expose an infohash do not need the torrent file downloaded.
+        magnet_url = source.get_magnet(item)
+        if magnet_url is not None:
+            return magnet_url
+
+        async with self.magnet_semaphore:
+            return await self.app.dl_client.get_magnet(source.get_torrent(item))
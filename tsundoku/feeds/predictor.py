@@ -0,0 +1,255 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tsundoku.app import TsundokuApp
+
+logger = logging.getLogger("tsundoku")
+
+MINUTES_PER_WEEK = 7 * 24 * 60
+
+# Episodes needed before a show's schedule is trusted.
+MIN_SAMPLES = 3
+
+# Only the most recent episodes describe the current schedule.
+MAX_SAMPLES = 10
+
+# How tightly arrivals must cluster, as the mean resultant length of
+# their weekly angles. 0.9 allows for a spread of about 12 hours.
+MIN_CONCENTRATION = 0.9
+
+# Bounds for half of a release window, in minutes.
+MIN_HALF_WIDTH = 30
+MAX_HALF_WIDTH = 180
+
+
+@dataclass
+class ReleaseWindow:
+    """
+    The part of the week a show's episodes
+    are expected to be released in.
+
+    Attributes
+    ----------
+    show_id: int
+        The ID of the show.
+    center: float
+        The expected release time, in minutes
+        since Monday 00:00 UTC.
+    half_width: float
+        Minutes before and after the center
+        that belong to the window.
+    samples: int
+        Number of episodes the window was learned from.
+    """
+
+    show_id: int
+    center: float
+    half_width: float
+    samples: int
+
+    def minutes_until(self, minute_of_week: float) -> float:
+        """
+        Returns the minutes from a point in the week
+        until the window opens, 0 if it is open.
+
+        Parameters
+        ----------
+        minute_of_week: float
+            Minutes since Monday 00:00 UTC.
+
+        Returns
+        -------
+        float
+            Minutes until the window opens.
+        """
+        offset = (self.center - minute_of_week) % MINUTES_PER_WEEK
+        if offset > MINUTES_PER_WEEK / 2:
+            offset -= MINUTES_PER_WEEK
+
+        if abs(offset) <= self.half_width:
+            return 0.0
+
+        return (offset - self.half_width) % MINUTES_PER_WEEK
+
+
+def minute_of_week(moment: datetime) -> float:
+    moment = moment.astimezone(UTC) if moment.tzinfo is not None else moment
+    return moment.weekday() * 24 * 60 + moment.hour * 60 + moment.minute + moment.second / 60
+
+
+def _to_datetime(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    return None
+
+
+def learn_window(show_id: int, arrivals: list[datetime]) -> ReleaseWindow | None:
+    """
+    Learns a show's weekly release window from
+    the times its episodes arrived.
+
+    Parameters
+    ----------
+    show_id: int
+        The ID of the show.
+    arrivals: list[datetime]
+        When each episode was first seen, in UTC.
+
+    Returns
+    -------
+    Optional[ReleaseWindow]
+        The window, or None if there are too few
+        arrivals or they do not follow a weekly schedule.
+    """
+    arrivals = sorted(arrivals)[-MAX_SAMPLES:]
+    if len(arrivals) < MIN_SAMPLES:
+        return None
+
+    angles = [2 * math.pi * minute_of_week(arrival) / MINUTES_PER_WEEK for arrival in arrivals]
+    cos_mean = sum(math.cos(angle) for angle in angles) / len(angles)
+    sin_mean = sum(math.sin(angle) for angle in angles) / len(angles)
+
+    concentration = math.hypot(cos_mean, sin_mean)
+    if concentration < MIN_CONCENTRATION:
+        return None
+
+    center = (math.atan2(sin_mean, cos_mean) / (2 * math.pi) * MINUTES_PER_WEEK) % MINUTES_PER_WEEK
+    spread = math.sqrt(-2 * math.log(concentration)) / (2 * math.pi) * MINUTES_PER_WEEK
+    half_width = min(max(2 * spread, MIN_HALF_WIDTH), MAX_HALF_WIDTH)
+
+    return ReleaseWindow(show_id, center, half_width, len(arrivals))
+
+
+class ReleasePredictor:
+    """
+    Predicts when each watched show releases new
+    episodes, from when earlier episodes arrived.
+
+    Arrival times come from the automatically created
+    entries of watched shows in `show_entry`, and from
+    `seen_release` rows whose title matches a watched
+    show's title, ignoring case.
+    """
+
+    __windows: dict[int, ReleaseWindow]
+
+    def __init__(self) -> None:
+        self.__windows = {}
+
+    @property
+    def windows(self) -> list[ReleaseWindow]:
+        return list(self.__windows.values())
+
+    async def refresh(self, app: "TsundokuApp") -> None:
+        """
+        Re-learns every show's release window.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to load arrival times with.
+        """
+        async with app.acquire_db() as con:
+            rows = await con.fetchall(
+                """
+                SELECT
+                    show_id,
+                    episode,
+                    MIN(arrived_at) AS arrived_at
+                FROM (
+                    SELECT
+                        se.show_id,
+                        se.episode,
+                        se.created_at AS arrived_at
+                    FROM
+                        show_entry AS se
+                    INNER JOIN
+                        shows AS s
+                    ON
+                        s.id = se.show_id
+                    WHERE
+                        s.watch = 1
+                        AND se.created_manually = 0
+                        AND se.created_at IS NOT NULL
+                    UNION ALL
+                    SELECT
+                        s.id AS show_id,
+                        sr.episode,
+                        sr.seen_at AS arrived_at
+                    FROM
+                        seen_release AS sr
+                    INNER JOIN
+                        shows AS s
+                    ON
+                        s.title = sr.title COLLATE NOCASE
+                    WHERE
+                        s.watch = 1
+                )
+                GROUP BY
+                    show_id,
+                    episode;
+            """
+            )
+
+        arrivals: dict[int, list[datetime]] = {}
+        for row in rows:
+            arrived_at = _to_datetime(row["arrived_at"])
+            if arrived_at is not None:
+                arrivals.setdefault(row["show_id"], []).append(arrived_at)
+
+        windows = {}
+        for show_id, show_arrivals in arrivals.items():
+            window = learn_window(show_id, show_arrivals)
+            if window is not None:
+                windows[show_id] = window
+
+        self.__windows = windows
+        logger.debug(f"Learned release windows for {len(windows)} shows")
+
+    def active_windows(self, now: datetime) -> list[ReleaseWindow]:
+        """
+        Returns every window that is open.
+
+        Parameters
+        ----------
+        now: datetime
+            The current time, in UTC.
+
+        Returns
+        -------
+        List[ReleaseWindow]
+            The open windows.
+        """
+        minute = minute_of_week(now)
+        return [window for window in self.__windows.values() if window.minutes_until(minute) == 0]
+
+    def seconds_until_next_window(self, now: datetime) -> float | None:
+        """
+        Returns the seconds until the next window opens.
+
+        Parameters
+        ----------
+        now: datetime
+            The current time, in UTC.
+
+        Returns
+        -------
+        Optional[float]
+            The seconds until a window opens, 0 if one is
+            open, or None if no windows were learned.
+        """
+        if not self.__windows:
+            return None
+
+        minute = minute_of_week(now)
+        return min(window.minutes_until(minute) for window in self.__windows.values()) * 60
@@ -0,0 +1,177 @@
+import base64
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import gzip
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tsundoku.feeds.poller import FeedResponse
+    from tsundoku.sources import Source
+
+from tsundoku.constants import DATA_DIR
+
+logger = logging.getLogger("tsundoku")
+
+RECORDINGS_DIR = DATA_DIR / "recordings"
+RECORDING_SUFFIX = ".jsonl.gz"
+
+
+@dataclass
+class FeedRecording:
+    """
+    A single recorded feed response.
+
+    Attributes
+    ----------
+    source: str
+        The name of the source that was fetched.
+    version: str
+        The version of the source.
+    page: int
+        The page of the feed that was fetched.
+    recorded_at: datetime
+        When the response was received, in UTC.
+    request_headers: dict[str, str]
+        The headers the feed was requested with.
+    status: int
+        The HTTP status of the response.
+    etag: Optional[str]
+        The ETag header of the response.
+    last_modified: Optional[str]
+        The Last-Modified header of the response.
+    body: bytes
+        The raw body of the response.
+    """
+
+    source: str
+    version: str
+    page: int
+    recorded_at: datetime
+    request_headers: dict[str, str]
+    status: int
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+
+    def to_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "version": self.version,
+            "page": self.page,
+            "recorded_at": self.recorded_at.isoformat(),
+            "request_headers": self.request_headers,
+            "status": self.status,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "body": base64.b64encode(self.body).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FeedRecording":
+        return cls(
+            source=data["source"],
+            version=data["version"],
+            page=int(data["page"]),
+            recorded_at=datetime.fromisoformat(data["recorded_at"]),
+            request_headers=data["request_headers"],
+            status=int(data["status"]),
+            etag=data["etag"],
+            last_modified=data["last_modified"],
+            body=base64.b64decode(data["body"]),
+        )
+
+
+def _recording_path(directory: Path, source_name: str) -> Path:
+    name = re.sub(r"[^\w.-]+", "_", source_name)
+    return directory / f"{name}{RECORDING_SUFFIX}"
+
+
+class FeedRecorder:
+    """
+    Saves every feed response the poller receives,
+    so that polls can be replayed offline.
+
+    Responses are appended to one gzip-compressed
+    JSON lines file per source. Each response is
+    written as its own gzip member, so a file stays
+    readable if writing is interrupted.
+    """
+
+    directory: Path
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.__lock = threading.Lock()
+
+    def record(self, source: "Source", page: int, request_headers: dict[str, str], response: "FeedResponse") -> None:
+        """
+        Appends a response to the source's recording.
+        Blocks on file IO, run it in an executor.
+
+        Parameters
+        ----------
+        source: Source
+            The source that was fetched.
+        page: int
+            The page that was fetched.
+        request_headers: dict[str, str]
+            The headers the feed was requested with.
+        response: FeedResponse
+            The response to record.
+        """
+        recording = FeedRecording(
+            source=source.name,
+            version=source.version,
+            page=page,
+            recorded_at=datetime.now(UTC),
+            request_headers=dict(request_headers),
+            status=response.status,
+            etag=response.etag,
+            last_modified=response.last_modified,
+            body=response.body,
+        )
+        line = json.dumps(recording.to_dict()).encode("utf-8") + b"\n"
+
+        with self.__lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with _recording_path(self.directory, source.name).open("ab") as fp:
+                fp.write(gzip.compress(line))
+
+
+def load_recordings(directory: Path) -> dict[str, list[FeedRecording]]:
+    """
+    Loads every recording in a directory.
+
+    Parameters
+    ----------
+    directory: Path
+        The directory recordings were saved to.
+
+    Returns
+    -------
+    Dict[str, List[FeedRecording]]
+        The recordings of each source, keyed by
+        source name, in the order they were received.
+    """
+    recordings: dict[str, list[FeedRecording]] = {}
+    if not directory.is_dir():
+        return recordings
+
+    for path in sorted(directory.glob(f"*{RECORDING_SUFFIX}")):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fp:
+                for line in fp:
+                    recording = FeedRecording.from_dict(json.loads(line))
+                    recordings.setdefault(recording.source, []).append(recording)
+        except (OSError, EOFError, ValueError, KeyError):
+            logger.warning(f"Recording '{path}' is incomplete or invalid, loaded what could be read", exc_info=True)
+
+    for source_recordings in recordings.values():
+        source_recordings.sort(key=lambda recording: recording.recorded_at)
+
+    return recordings
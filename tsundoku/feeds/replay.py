@@ -0,0 +1,259 @@
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, closing
+from dataclasses import dataclass, field
+import hashlib
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from tsundoku import asqlite
+from tsundoku.asqlite import Connection
+from tsundoku.feeds.downloader import Downloader
+from tsundoku.feeds.matcher import EpisodeMap, ShowRuleIndex, WatchedShowIndex
+from tsundoku.feeds.parse_cache import ParseCache
+from tsundoku.feeds.pipeline import StageStats
+from tsundoku.feeds.poller import FeedResponse, Poller
+from tsundoku.feeds.recorder import FeedRecording, load_recordings
+from tsundoku.flags import Flags
+from tsundoku.sources import Source
+
+logger = logging.getLogger("tsundoku")
+
+_BTIH_RE = re.compile(r"urn:btih:([A-Za-z\d]+)")
+
+
+class ReplayDownloadClient:
+    """
+    Stands in for the download client during a replay.
+
+    Torrents are only remembered, and torrent files
+    are never downloaded: their magnet URLs are derived
+    from their location and their file lists are empty.
+    """
+
+    torrents: set[str]
+
+    def __init__(self) -> None:
+        self.torrents = set()
+
+    async def get_magnet(self, location: str) -> str:
+        if location.startswith("magnet:?"):
+            return location
+
+        return f"magnet:?xt=urn:btih:{hashlib.sha1(location.encode()).hexdigest()}"
+
+    async def get_file_structure(self, location: str) -> list[str]:
+        return []
+
+    async def add_torrent(self, magnet_url: str) -> str | None:
+        match = _BTIH_RE.search(magnet_url)
+        if match is None:
+            return None
+
+        torrent_hash = match.group(1).lower()
+        self.torrents.add(torrent_hash)
+        return torrent_hash
+
+
+class ReplayApp:
+    """
+    The parts of the app a poll needs, backed by a
+    copy of the database and a ReplayDownloadClient.
+    """
+
+    def __init__(self, database: Path) -> None:
+        self.database = database
+
+        self.flags = Flags()
+        self.flags.RECORD_FEEDS = False
+
+        self.show_index = WatchedShowIndex()
+        self.episode_map = EpisodeMap()
+        self.parse_cache = ParseCache()
+        self.show_rules = ShowRuleIndex()
+        self.dl_client = ReplayDownloadClient()
+
+        context = SimpleNamespace(app=self)
+        self.downloader = Downloader(context)
+        self.poller: ReplayPoller | None = None
+
+    @asynccontextmanager
+    async def acquire_db(self) -> AsyncIterator[Connection]:
+        async with asqlite.connect(str(self.database)) as con:
+            yield con
+
+
+class ReplayPoller(Poller):
+    """
+    A Poller that reads feeds from recordings
+    instead of fetching them.
+
+    Every fetch of a source's page returns the next
+    recorded response for that page, and a 304 once
+    the recordings run out. Sources are never shared
+    with other instances.
+    """
+
+    recordings: dict[tuple[str, int], deque[FeedRecording]]
+    items_fetched: int
+
+    def __init__(self, app_context: Any, recordings: dict[str, list[FeedRecording]]) -> None:
+        super().__init__(app_context)
+
+        # Recorded items must never be published to running instances.
+        self.shared_sources = None
+
+        self.recordings = {}
+        for source_recordings in recordings.values():
+            for recording in source_recordings:
+                self.recordings.setdefault((recording.source, recording.page), deque()).append(recording)
+
+        self.items_fetched = 0
+
+    @property
+    def remaining(self) -> int:
+        return sum(len(queue) for (_, page), queue in self.recordings.items() if page == 1)
+
+    async def fetch_feed(self, source: Source, headers: dict[str, str], page: int = 1) -> FeedResponse:
+        queue = self.recordings.get((source.name, page))
+        if not queue:
+            return FeedResponse(304, None, None, b"")
+
+        recording = queue.popleft()
+        return FeedResponse(recording.status, recording.etag, recording.last_modified, recording.body)
+
+    async def fetch_items_from_source(self, source: Source) -> list[dict]:
+        items = await super().fetch_items_from_source(source)
+        self.items_fetched += len(items)
+        return items
+
+
+@dataclass
+class ReplayReport:
+    """
+    The outcome of replaying recorded feeds.
+
+    Attributes
+    ----------
+    polls: int
+        The number of polls run.
+    items: int
+        The number of new items the polls checked.
+    matches: int
+        The number of episodes that would have been downloaded.
+    torrents: int
+        The number of torrents that would have been added.
+    elapsed: float
+        Seconds spent polling.
+    stages: dict[str, StageStats]
+        Counters for each pipeline stage, summed over polls.
+    """
+
+    polls: int = 0
+    items: int = 0
+    matches: int = 0
+    torrents: int = 0
+    elapsed: float = 0.0
+    stages: dict[str, StageStats] = field(default_factory=dict)
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    def add_stage_stats(self, stats: list[StageStats]) -> None:
+        for stage in stats:
+            total = self.stages.setdefault(stage.name, StageStats(stage.name, stage.workers))
+            total.processed += stage.processed
+            total.busy += stage.busy
+            total.blocked += stage.blocked
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.polls} polls, {self.items} items, {self.matches} matches, {self.torrents} torrents",
+            f"{self.elapsed:.3f}s elapsed, {self.items_per_second:.1f} items/s",
+        ]
+        lines += [str(stats) for stats in self.stages.values()]
+        return "\n".join(lines)
+
+
+def _copy_database(source: Path, destination: Path) -> None:
+    with closing(sqlite3.connect(source)) as src, closing(sqlite3.connect(destination)) as dst:
+        src.backup(dst)
+
+        # A replay must never notify anyone about the entries it creates.
+        dst.execute("PRAGMA foreign_keys=ON;")
+        dst.execute("DELETE FROM webhook_base;")
+        dst.commit()
+
+
+async def replay(directory: Path, database: Path) -> ReplayReport:
+    """
+    Replays recorded feeds through the poller.
+
+    Polls run against a copy of the database, so the
+    watched shows, rules, and existing entries are taken
+    into account without modifying them. Sources are read
+    from the sources directory as usual, and recordings of
+    sources that no longer exist are skipped.
+
+    Parameters
+    ----------
+    directory: Path
+        The directory recordings were saved to.
+    database: Path
+        The database to copy.
+
+    Returns
+    -------
+    ReplayReport
+        The outcome of the replay.
+
+    Raises
+    ------
+    ValueError
+        There are no recordings in the directory.
+    """
+    recordings = load_recordings(directory)
+    if not recordings:
+        raise ValueError(f"No recordings found in '{directory}'")
+
+    report = ReplayReport()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        copy = Path(temp_dir) / database.name
+        _copy_database(database, copy)
+
+        app = ReplayApp(copy)
+        poller = ReplayPoller(SimpleNamespace(app=app), recordings)
+        app.poller = poller
+
+        await poller.update_config()
+        try:
+            # Each poll consumes one recorded response of every source,
+            # stop once a poll no longer finds any recorded source.
+            remaining = poller.remaining
+            while remaining:
+                start = time.perf_counter()
+                found = await poller.poll()
+                report.elapsed += time.perf_counter() - start
+
+                report.polls += 1
+                report.matches += len(found)
+                report.add_stage_stats(poller.stage_stats)
+
+                if poller.remaining == remaining:
+                    break
+                remaining = poller.remaining
+        finally:
+            poller.shutdown_parse_executor()
+
+        report.items = poller.items_fetched
+        report.torrents = len(app.dl_client.torrents)
+
+    logger.info(f"Replayed recordings from '{directory}'")
+    return report
@@ -0,0 +1,141 @@
+from collections.abc import Callable, Iterable
+import logging
+from typing import cast
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+logger = logging.getLogger("tsundoku")
+
+# Size of each slice of the body handed to the pull parser.
+_CHUNK_SIZE = 16 * 1024
+
+# Stop reading once this many consecutive items were already seen.
+EARLY_EXIT_SEEN_RUN = 3
+
+# Item fields that are always pulled, as they are used to key items.
+_KEY_FIELDS = frozenset(("id", "title", "description"))
+
+
+class UnsupportedFeedError(Exception):
+    """
+    Raised when a feed does not have a layout the
+    streaming parser understands.
+    """
+
+
+def _split_tag(tag: str) -> tuple[str | None, str]:
+    if tag.startswith("{"):
+        uri, _, local = tag[1:].partition("}")
+        return uri, local
+
+    return None, tag
+
+
+def parse_rss_items(body: bytes, fields: Iterable[str], is_seen: Callable[[dict], bool] | None = None, optional_fields: Iterable[str] = ()) -> list[dict]:
+    """
+    Parses the items of an RSS 2.0 feed, pulling only
+    the requested fields of each item.
+
+    Field names follow feedparser's conventions, so items
+    returned here can be used interchangeably with
+    feedparser's: `guid` is stored as `id` and namespaced
+    elements are stored as `prefix_name`, e.g.
+    `nyaa_infohash`. Fields ending in `_infohash` are
+    always pulled.
+
+    Parameters
+    ----------
+    body: bytes
+        The raw feed document.
+    fields: Iterable[str]
+        The item fields to pull.
+    is_seen: Optional[Callable[[dict], bool]]
+        Called with every parsed item. Parsing stops
+        after `EARLY_EXIT_SEEN_RUN` consecutive items for
+        which it returns True.
+    optional_fields: Iterable[str]
+        Item fields to pull if present.
+
+    Returns
+    -------
+    List[dict]
+        The parsed items, in feed order.
+
+    Raises
+    ------
+    UnsupportedFeedError
+        The document is not a well-formed RSS 2.0 feed,
+        or an item is missing a requested field.
+    """
+    wanted = set(fields)
+    required = wanted - _KEY_FIELDS
+    wanted |= _KEY_FIELDS | set(optional_fields)
+
+    parser = XMLPullParser(events=("start-ns", "start", "end"))
+    prefixes: dict[str, str] = {}
+
+    items: list[dict] = []
+    item: dict | None = None
+    depth = 0
+    has_root = False
+    seen_run = 0
+
+    for offset in range(0, len(body), _CHUNK_SIZE):
+        try:
+            parser.feed(body[offset : offset + _CHUNK_SIZE])
+            # Only start-ns, start and end events are requested,
+            # and those always carry a value.
+            events = cast(list[tuple[str, tuple[str, str] | Element]], list(parser.read_events()))
+        except ParseError as e:
+            raise UnsupportedFeedError(f"Malformed feed: {e}") from e
+
+        for event, value in events:
+            if event == "start-ns":
+                prefix, uri = cast(tuple[str, str], value)
+                prefixes[uri] = prefix
+                continue
+
+            element = cast(Element, value)
+
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    if element.tag != "rss":
+                        raise UnsupportedFeedError(f"Unsupported root element '{element.tag}'")
+                    has_root = True
+                elif depth == 3 and element.tag == "item":
+                    item = {}
+                continue
+
+            # rss > channel > item > field
+            ended_depth = depth
+            depth -= 1
+            if item is None:
+                continue
+
+            if ended_depth == 4:
+                uri, local = _split_tag(element.tag)
+                key = local.lower()
+                if uri is not None:
+                    key = f"{prefixes.get(uri, '')}_{key}"
+                elif key == "guid":
+                    key = "id"
+
+                if key in wanted or key.endswith("_infohash"):
+                    item[key] = (element.text or "").strip()
+            elif ended_depth == 3:
+                missing = required - item.keys()
+                if missing:
+                    raise UnsupportedFeedError(f"Item is missing fields {', '.join(sorted(missing))}")
+
+                items.append(item)
+                seen_run = seen_run + 1 if is_seen is not None and is_seen(item) else 0
+                item = None
+                element.clear()
+
+                if seen_run >= EARLY_EXIT_SEEN_RUN:
+                    return items
+
+    if depth != 0 or not has_root:
+        raise UnsupportedFeedError("Truncated feed")
+
+    return items
@@ -0,0 +1,300 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import json
+import logging
+from pathlib import Path
+import time
+from uuid import uuid4
+
+from tsundoku import asqlite
+from tsundoku.asqlite import Connection
+
+logger = logging.getLogger("tsundoku")
+
+# Seconds a lease is held for without being renewed.
+LEASE_TTL = 90.0
+
+# Seconds between renewals of held leases.
+LEASE_HEARTBEAT_INTERVAL = 30.0
+
+# Seconds published items are kept for followers to read.
+SHARED_ITEM_RETENTION = 24 * 60 * 60.0
+
+
+class SharedSources:
+    """
+    Shares the work of polling sources between several
+    Tsundoku instances through a common SQLite database.
+
+    Every source is leased to a single instance, which
+    fetches and parses the source and publishes its new
+    items. The other instances read the published items
+    instead of fetching the source themselves. A lease is
+    kept alive by its holder's heartbeats and can be taken
+    over by another instance once it expires.
+    """
+
+    path: Path
+    owner: str
+    ttl: float
+
+    __held: dict[str, float]
+    __cursors: dict[str, int]
+    __is_setup: bool
+
+    def __init__(self, path: Path, owner: str | None = None, ttl: float = LEASE_TTL) -> None:
+        self.path = path
+        self.owner = owner or uuid4().hex
+        self.ttl = ttl
+
+        self.__held = {}
+        self.__cursors = {}
+        self.__is_setup = False
+
+    @asynccontextmanager
+    async def acquire_db(self) -> AsyncIterator[Connection]:
+        async with asqlite.connect(str(self.path), timeout=10.0) as con:
+            if not self.__is_setup:
+                await self.__setup(con)
+            yield con
+
+    async def __setup(self, con: Connection) -> None:
+        await con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS source_lease (
+                source_name TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            """
+        )
+        await con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shared_item (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_name TEXT NOT NULL,
+                item TEXT NOT NULL,
+                published_at REAL NOT NULL
+            );
+            """
+        )
+        await con.execute(
+            """
+            CREATE INDEX IF NOT EXISTS shared_item_source_name_id ON shared_item (source_name, id);
+            """
+        )
+        self.__is_setup = True
+
+    def holds(self, source_name: str) -> bool:
+        return source_name in self.__held
+
+    async def acquire(self, source_name: str) -> bool:
+        """
+        Takes or renews the lease of a source.
+
+        Parameters
+        ----------
+        source_name: str
+            The name of the source.
+
+        Returns
+        -------
+        bool
+            True if this instance holds the lease and
+            should fetch the source.
+        """
+        now = time.time()
+        async with self.acquire_db() as con:
+            await con.execute(
+                """
+                INSERT INTO source_lease (
+                    source_name,
+                    owner,
+                    expires_at
+                ) VALUES (?, ?, ?)
+                ON CONFLICT (source_name)
+                DO UPDATE SET
+                    owner = excluded.owner,
+                    expires_at = excluded.expires_at
+                WHERE
+                    source_lease.owner = excluded.owner
+                    OR source_lease.expires_at < ?;
+                """,
+                source_name,
+                self.owner,
+                now + self.ttl,
+                now,
+            )
+            owner = await con.fetchval(
+                """
+                SELECT
+                    owner
+                FROM
+                    source_lease
+                WHERE
+                    source_name = ?;
+                """,
+                source_name,
+            )
+
+        if owner != self.owner:
+            self.__held.pop(source_name, None)
+            return False
+
+        if source_name not in self.__held:
+            logger.info(f"Acquired the lease of shared source '{source_name}'")
+        self.__held[source_name] = now
+        return True
+
+    async def heartbeat(self, stale_after: float) -> None:
+        """
+        Renews every held lease of a source that
+        was fetched recently, and gives up the rest.
+
+        Parameters
+        ----------
+        stale_after: float
+            Seconds after its last fetch that the
+            lease of a source is given up.
+        """
+        now = time.time()
+        stale = [name for name, fetched_at in self.__held.items() if now - fetched_at > stale_after]
+        for name in stale:
+            del self.__held[name]
+
+        async with self.acquire_db() as con, con.transaction():
+            if stale:
+                await con.executemany(
+                    """
+                    DELETE FROM
+                        source_lease
+                    WHERE
+                        source_name = ?
+                        AND owner = ?;
+                    """,
+                    [(name, self.owner) for name in stale],
+                )
+
+            await con.executemany(
+                """
+                UPDATE
+                    source_lease
+                SET
+                    expires_at = ?
+                WHERE
+                    source_name = ?
+                    AND owner = ?;
+                """,
+                [(now + self.ttl, name, self.owner) for name in self.__held],
+            )
+
+    async def release_all(self) -> None:
+        """
+        Gives up every held lease, so that other
+        instances can take over immediately.
+        """
+        if not self.__held:
+            return
+
+        held = list(self.__held)
+        self.__held.clear()
+
+        async with self.acquire_db() as con:
+            await con.executemany(
+                """
+                DELETE FROM
+                    source_lease
+                WHERE
+                    source_name = ?
+                    AND owner = ?;
+                """,
+                [(name, self.owner) for name in held],
+            )
+
+    async def publish(self, source_name: str, items: list[dict]) -> None:
+        """
+        Publishes the new items of a source that
+        this instance fetched.
+
+        Parameters
+        ----------
+        source_name: str
+            The name of the source.
+        items: list[dict]
+            The new items, in feed order.
+        """
+        now = time.time()
+        async with self.acquire_db() as con, con.transaction():
+            await con.executemany(
+                """
+                INSERT INTO shared_item (
+                    source_name,
+                    item,
+                    published_at
+                ) VALUES (?, ?, ?);
+                """,
+                [(source_name, json.dumps(item, default=str), now) for item in items],
+            )
+            await con.execute(
+                """
+                DELETE FROM
+                    shared_item
+                WHERE
+                    published_at < ?;
+                """,
+                now - SHARED_ITEM_RETENTION,
+            )
+
+            # Items this instance published should not be read back later.
+            last_id = await con.fetchval(
+                """
+                SELECT
+                    MAX(id)
+                FROM
+                    shared_item
+                WHERE
+                    source_name = ?;
+                """,
+                source_name,
+            )
+
+        if last_id is not None:
+            self.__cursors[source_name] = last_id
+
+    async def read(self, source_name: str) -> list[dict]:
+        """
+        Returns the items of a source published
+        since the last read.
+
+        Parameters
+        ----------
+        source_name: str
+            The name of the source.
+
+        Returns
+        -------
+        List[dict]
+            The published items, in feed order.
+        """
+        async with self.acquire_db() as con:
+            rows = await con.fetchall(
+                """
+                SELECT
+                    id,
+                    item
+                FROM
+                    shared_item
+                WHERE
+                    source_name = ?
+                    AND id > ?
+                ORDER BY
+                    id ASC;
+                """,
+                source_name,
+                self.__cursors.get(source_name, 0),
+            )
+
+        if rows:
+            self.__cursors[source_name] = rows[-1]["id"]
+
+        return [json.loads(row["item"]) for row in rows]
@@ -6,6 +6,7 @@ from tsundoku.git import UpdateInformation
 class Flags:
     IS_DOCKER: bool = bool(os.getenv("IS_DOCKER"))
     IS_DEBUG: bool = bool(os.getenv("IS_DEBUG"))
+    RECORD_FEEDS: bool = bool(os.getenv("RECORD_FEEDS"))
     IS_FIRST_LAUNCH: bool = False
     DL_CLIENT_CONNECTION_ERROR: bool = False
     UPDATE_INFO: UpdateInformation | None = None
@@ -3,5 +3,6 @@ from .library import Library
 from .seen_release import SeenRelease
 from .show import Show
 from .show_collection import ShowCollection
+from .show_rule import ShowRule
 
-__all__ = ("Entry", "EntryState", "Library", "SeenRelease", "Show", "ShowCollection")
+__all__ = ("Entry", "EntryState", "Library", "SeenRelease", "Show", "ShowCollection", "ShowRule")
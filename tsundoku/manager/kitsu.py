@@ -480,3 +480,4 @@ class KitsuManager:
                     False,
                     self.show_id,
                 )
+                self.app.show_index.invalidate()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 import logging
 from typing import TYPE_CHECKING
 
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from tsundoku.app import TsundokuApp
 
 from tsundoku.constants import VALID_RESOLUTIONS
-from tsundoku.utils import ParserResult, compare_version_strings, normalize_resolution
+from tsundoku.utils import ParserResult, normalize_resolution
 
 logger = logging.getLogger("tsundoku")
 
@@ -182,15 +182,14 @@ class SeenRelease:
 
         logger.info(f"Deleted {deleted} old SeenReleases.")
 
-    @classmethod
-    async def add(cls, app: "TsundokuApp", parsed: ParserResult, torrent_destination: str) -> "SeenRelease | None":
+    @staticmethod
+    def _to_row(parsed: ParserResult, torrent_destination: str) -> tuple[str, str, int, str, str, str] | None:
         """
-        Adds a new SeenRelease to the database.
+        Validates a parsed release and converts it into
+        a `seen_release` row.
 
         Parameters
         ----------
-        app : TsundokuApp
-            The TsundokuApp instance.
         parsed : ParserResult
             The result of parsing a torrent's filename
             with anitomy.
@@ -199,8 +198,8 @@ class SeenRelease:
 
         Returns
         -------
-        SeenRelease
-            The SeenRelease that was added.
+        Optional[tuple]
+            The row, or None if the release should not be stored.
         """
         if "file_name" not in parsed:
             logger.warning(f"Not adding '{parsed}' to seen releases because it has no file name.")
@@ -235,29 +234,33 @@ class SeenRelease:
 
         episode = int(parsed["episode_number"])
 
-        async with app.acquire_db() as con:
-            existing_version = await con.fetchval(
-                """
-                SELECT
-                    version
-                FROM
-                    seen_release
-                WHERE
-                    title = ?
-                    AND release_group = ?
-                    AND episode = ?
-                    AND resolution = ?;
-                """,
-                parsed["anime_title"],
-                release_group,
-                episode,
-                resolution,
-            )
-            if existing_version and compare_version_strings(version, existing_version) <= 0:
-                logger.debug(f"Not adding '{parsed['file_name']}' to seen releases because it has a lower (or same) version than the existing release.")
-                return None
+        return (parsed["anime_title"], release_group, episode, resolution, version, torrent_destination)
 
-            await con.execute(
+    @classmethod
+    async def add_many(cls, app: "TsundokuApp", releases: list[tuple[ParserResult, str]]) -> None:
+        """
+        Adds many SeenReleases to the database
+        in a single transaction.
+
+        An existing release is only replaced by one
+        with a higher version. Versions are compared
+        like `compare_version_strings`, using the
+        VERSION collation.
+
+        Parameters
+        ----------
+        app : TsundokuApp
+            The TsundokuApp instance.
+        releases : list[tuple[ParserResult, str]]
+            Pairs of anitomy parse results and
+            torrent destinations.
+        """
+        rows = [row for parsed, torrent_destination in releases if (row := cls._to_row(parsed, torrent_destination)) is not None]
+        if not rows:
+            return
+
+        async with app.acquire_db() as con, con.transaction():
+            await con.executemany(
                 """
                 INSERT INTO seen_release (
                     title,
@@ -270,23 +273,11 @@ class SeenRelease:
                 ON CONFLICT (title, release_group, episode, resolution)
                 DO UPDATE SET
                     version = excluded.version,
-                    torrent_destination = excluded.torrent_destination;
+                    torrent_destination = excluded.torrent_destination
+                WHERE
+                    excluded.version COLLATE VERSION > seen_release.version;
                 """,
-                parsed["anime_title"],
-                release_group,
-                episode,
-                resolution,
-                version,
-                torrent_destination,
+                rows,
             )
 
-        return cls(
-            app,
-            parsed["anime_title"],
-            release_group,
-            episode,
-            resolution,
-            version,
-            torrent_destination,
-            datetime.now(UTC).replace(tzinfo=None),
-        )
+        logger.debug(f"Added {len(rows)} releases to seen releases.")
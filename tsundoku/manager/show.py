@@ -250,6 +250,8 @@ class Show:
         if new_id is None:
             raise Exception("Failed to insert show into database")
 
+        app.show_index.invalidate()
+
         return await Show.from_id(app, new_id)
 
     async def update(self) -> None:
@@ -287,6 +289,8 @@ class Show:
                 self.id_,
             )
 
+        self.app.show_index.invalidate()
+
     async def entries(self) -> list[Entry]:
         """
         Retrieves and sets a list of this Show's
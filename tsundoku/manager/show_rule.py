@@ -0,0 +1,268 @@
+from dataclasses import dataclass
+import re
+from sqlite3 import Row
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tsundoku.app import TsundokuApp
+
+VALID_RULE_ACTIONS = ("include", "exclude")
+VALID_RULE_MATCH_TYPES = ("keyword", "regex", "group")
+
+# Numbered backreferences would point at the wrong
+# group once rules are combined into a single pattern.
+_BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=")
+
+
+def _split_terms(pattern: str) -> list[str]:
+    return [term.strip() for term in pattern.split(",") if term.strip()]
+
+
+@dataclass
+class ShowRule:
+    """
+    An include or exclude rule for the
+    releases of a single show.
+
+    Attributes
+    ----------
+    id_: int
+        The ID of the rule.
+    show_id: int
+        The ID of the show the rule is for.
+    action: str
+        "include" if a release must match one of the show's
+        include rules, "exclude" if a matching release is
+        ignored.
+    match_type: str
+        "keyword" to match comma-separated words or terms such
+        as "HEVC", "group" to match comma-separated release groups
+        in brackets, or "regex" to match a regular expression.
+    pattern: str
+        The keywords, groups, or regular expression.
+    """
+
+    app: "TsundokuApp"
+
+    id_: int
+    show_id: int
+    action: str
+    match_type: str
+    pattern: str
+
+    def to_dict(self) -> dict:
+        return {
+            "id_": self.id_,
+            "show_id": self.show_id,
+            "action": self.action,
+            "match_type": self.match_type,
+            "pattern": self.pattern,
+        }
+
+    def to_regex(self) -> str:
+        return ShowRule.compile_pattern(self.match_type, self.pattern)
+
+    @staticmethod
+    def compile_pattern(match_type: str, pattern: str) -> str:
+        """
+        Converts a rule's pattern into a regular expression
+        that can be embedded in a larger expression. Matching
+        is expected to be case-insensitive.
+
+        Parameters
+        ----------
+        match_type: str
+            The rule's match type.
+        pattern: str
+            The rule's pattern.
+
+        Returns
+        -------
+        str
+            The regular expression.
+
+        Raises
+        ------
+        ValueError
+            The match type is invalid or the pattern is
+            empty or not a supported regular expression.
+        """
+        if match_type not in VALID_RULE_MATCH_TYPES:
+            raise ValueError(f"Invalid match type '{match_type}'")
+
+        if match_type == "keyword":
+            terms = _split_terms(pattern)
+            if not terms:
+                raise ValueError("Keyword rules need at least one keyword")
+
+            return rf"(?<![a-z0-9])(?:{'|'.join(re.escape(term) for term in terms)})(?![a-z0-9])"
+        if match_type == "group":
+            groups = _split_terms(pattern)
+            if not groups:
+                raise ValueError("Group rules need at least one release group")
+
+            return rf"(?:^|[\[(])\s*(?:{'|'.join(re.escape(group) for group in groups)})\s*[\])]"
+
+        if not pattern:
+            raise ValueError("Regex rules need a pattern")
+        if _BACKREFERENCE.search(pattern):
+            raise ValueError("Backreferences are not supported in rule patterns")
+
+        # Compiling the pattern in the same form it is combined in
+        # also rejects global flags, which must start an expression.
+        try:
+            compiled = re.compile(f"(?P<rule>{pattern})")
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression: {e}") from e
+
+        if len(compiled.groupindex) > 1:
+            raise ValueError("Named groups are not supported in rule patterns")
+
+        return pattern
+
+    @classmethod
+    def from_data(cls, app: "TsundokuApp", row: Row) -> "ShowRule":
+        return cls(
+            app,
+            id_=row["id"],
+            show_id=row["show_id"],
+            action=row["action"],
+            match_type=row["match_type"],
+            pattern=row["pattern"],
+        )
+
+    @classmethod
+    async def from_id(cls, app: "TsundokuApp", id_: int) -> "ShowRule":
+        async with app.acquire_db() as con:
+            rule = await con.fetchone(
+                """
+                SELECT
+                    id,
+                    show_id,
+                    action,
+                    match_type,
+                    pattern
+                FROM
+                    show_rule
+                WHERE
+                    id=?;
+                """,
+                (id_,),
+            )
+
+        if rule is None:
+            raise ValueError(f"Show rule with ID '{id_}' does not exist")
+
+        return ShowRule.from_data(app, rule)
+
+    @classmethod
+    async def from_show_id(cls, app: "TsundokuApp", show_id: int) -> list["ShowRule"]:
+        async with app.acquire_db() as con:
+            rules = await con.fetchall(
+                """
+                SELECT
+                    id,
+                    show_id,
+                    action,
+                    match_type,
+                    pattern
+                FROM
+                    show_rule
+                WHERE
+                    show_id=?
+                ORDER BY id ASC;
+                """,
+                (show_id,),
+            )
+
+        return [ShowRule.from_data(app, row) for row in rules]
+
+    @classmethod
+    async def all(cls, app: "TsundokuApp") -> list["ShowRule"]:
+        async with app.acquire_db() as con:
+            rules = await con.fetchall(
+                """
+                SELECT
+                    id,
+                    show_id,
+                    action,
+                    match_type,
+                    pattern
+                FROM
+                    show_rule
+                ORDER BY id ASC;
+            """
+            )
+
+        return [ShowRule.from_data(app, row) for row in rules]
+
+    @classmethod
+    async def new(cls, app: "TsundokuApp", show_id: int, action: str, match_type: str, pattern: str) -> "ShowRule":
+        """
+        Creates a new rule for a show.
+
+        Parameters
+        ----------
+        app: TsundokuApp
+            The app to save the rule with.
+        show_id: int
+            The ID of the show.
+        action: str
+            Either "include" or "exclude".
+        match_type: str
+            One of "keyword", "group", or "regex".
+        pattern: str
+            The keywords, groups, or regular expression.
+
+        Returns
+        -------
+        ShowRule
+            The new rule.
+
+        Raises
+        ------
+        ValueError
+            The action, match type, or pattern is invalid.
+        """
+        if action not in VALID_RULE_ACTIONS:
+            raise ValueError(f"Invalid action '{action}'")
+
+        pattern = pattern.strip()
+        ShowRule.compile_pattern(match_type, pattern)
+
+        async with app.acquire_db() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                    INSERT INTO
+                        show_rule (
+                            show_id,
+                            action,
+                            match_type,
+                            pattern
+                        )
+                    VALUES
+                        (?, ?, ?, ?);
+                """,
+                (show_id, action, match_type, pattern),
+            )
+            id_ = cur.lastrowid
+            if id_ is None:
+                raise Exception("Failed to create new show rule, lastrowid is None")
+
+        app.show_rules.invalidate()
+
+        return cls(app, id_=id_, show_id=show_id, action=action, match_type=match_type, pattern=pattern)
+
+    async def delete(self) -> None:
+        async with self.app.acquire_db() as con:
+            await con.execute(
+                """
+                    DELETE FROM
+                        show_rule
+                    WHERE
+                        id = ?;
+                """,
+                (self.id_,),
+            )
+
+        self.app.show_rules.invalidate()
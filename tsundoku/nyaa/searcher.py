@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 import feedparser
 
 from tsundoku.manager import Entry, EntryState
-from tsundoku.utils import parse_anime_title, parse_anime_titles
+from tsundoku.utils import parse_anime_titles
 
 logger = logging.getLogger("tsundoku")
 
@@ -252,7 +252,7 @@ class SearchResult:
 
 class NyaaSearcher:
     @staticmethod
-    def _get_query_url(query: str) -> str:
+    def _get_query_url(query: str, newest_first: bool = False) -> str:
         """
         Sets the query for searching nyaa.si.
 
@@ -260,7 +260,13 @@ class NyaaSearcher:
         ----------
         query: str
             The search query.
+        newest_first: bool
+            Sort results by upload date instead
+            of by seeders.
         """
+        if newest_first:
+            return f"https://nyaa.si/?page=rss&c=1_2&q={quote_plus(query)}"
+
         return f"https://nyaa.si/?page=rss&c=1_2&s=seeders&o=desc&q={quote_plus(query)}"
 
     @staticmethod
@@ -290,7 +296,7 @@ class NyaaSearcher:
                 logger.error(f"NyaaSearcher - Skipping entry with non-string title: {title}")
                 continue
             try:
-                parse_anime_title(title)
+                app.parse_cache.parse(title)
             except Exception:
                 logger.error(f"Could not parse `{title}`, skipping", exc_info=True)
                 continue
@@ -1,17 +1,171 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
+import hashlib
 import json
+import logging
 from pathlib import Path
+import re
+from typing import Any, ClassVar
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 import aiofiles
 
 from tsundoku.constants import DATA_DIR
+from tsundoku.utils import compare_version_strings, normalize_infohash
+
+logger = logging.getLogger("tsundoku")
+
+# Defaults for sources that do not set their own limits.
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_MAX_RESPONSE_SIZE = 10 * 1024 * 1024
+
+# Digests of every released default source definition, installed
+# copies matching one of these were not edited and can be upgraded.
+# Add the digest of a definition here before changing it.
+PREVIOUS_DEFAULT_SOURCES = frozenset(
+    {
+        "c666b7509cef635b3f4ee10b160a0fc030976ca0200fa9bc30ca0994991ac73a",  # nyaa.json 1.0.0
+        "ab95415f76916241dcde4289e325d6726a9c99eddb0ccfeb41ee6c1edf542456",  # subsplease.json 1.0.0
+        "eef9132727dcf269348905f7b163b8bcfa494e350668c6b2f00e1a1ef49e62ad",  # tokyotosho.json 1.0.0
+    }
+)
+
+
+class JsonPath:
+    """
+    A compiled path into a decoded JSON document,
+    such as `$.data.releases` or `$.links[0].url`.
+    """
+
+    __slots__ = ("path", "steps")
+
+    path: str
+    steps: tuple[str | int, ...]
+
+    _STEP = re.compile(r"\.([^.\[\]]+)|\[(\d+)\]")
+
+    def __init__(self, path: str) -> None:
+        if not path.startswith("$"):
+            raise Exception(f"Invalid JSON path '{path}', must start with '$'")
+
+        steps: list[str | int] = []
+        position = 1
+        while position < len(path):
+            match = self._STEP.match(path, position)
+            if match is None:
+                raise Exception(f"Invalid JSON path '{path}', unexpected '{path[position:]}'")
+
+            key, index = match.groups()
+            steps.append(int(index) if index is not None else key)
+            position = match.end()
+
+        self.path = path
+        self.steps = tuple(steps)
+
+    def __repr__(self) -> str:
+        return f"<JsonPath {self.path}>"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, JsonPath) and other.path == self.path
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+    def get(self, document: Any) -> Any:
+        """
+        Returns the value at the path.
+
+        Parameters
+        ----------
+        document: Any
+            The decoded JSON document.
+
+        Returns
+        -------
+        Any
+            The value, or None if the path does
+            not exist in the document.
+        """
+        value = document
+        for step in self.steps:
+            try:
+                value = value[step]
+            except (KeyError, IndexError, TypeError):
+                return None
+
+        return value
+
+
+@dataclass
+class JsonItemMapping:
+    """
+    Where the fields of an item are found
+    in each element of a JSON source.
+    """
+
+    items: JsonPath
+    fields: dict[str, JsonPath]
+
+    # Names of the flattened item fields, chosen to match
+    # feedparser's so JSON items are interchangeable with RSS items.
+    FIELD_NAMES: ClassVar[dict[str, str]] = {"filename": "title", "torrent": "link", "infohash": "infohash", "guid": "id"}
+
+    @classmethod
+    def from_object(cls, items_path: str, obj: dict) -> "JsonItemMapping":
+        for key in ("filename", "torrent"):
+            if key not in obj:
+                raise Exception(f"Invalid JSON Source Key Mapping object, missing required key '{key}'")
+
+        for key, value in obj.items():
+            if key not in cls.FIELD_NAMES:
+                raise Exception(f"Invalid JSON Source Key Mapping object, unknown key '{key}'")
+            if not isinstance(value, str):
+                raise TypeError(f"Invalid JSON Source Key Mapping object, '{key}' must be a string")
+
+        return cls(JsonPath(items_path), {cls.FIELD_NAMES[key]: JsonPath(value) for key, value in obj.items()})
+
+    def get_items(self, body: bytes) -> list[dict]:
+        """
+        Extracts the flattened items of a JSON document.
+
+        Elements that are missing the filename or
+        torrent field are skipped.
+
+        Parameters
+        ----------
+        body: bytes
+            The raw JSON document.
+
+        Returns
+        -------
+        List[dict]
+            The items, in document order.
+        """
+        elements = self.items.get(json.loads(body))
+        if not isinstance(elements, list):
+            raise TypeError(f"JSON source items at '{self.items.path}' are not a list")
+
+        items = []
+        for element in elements:
+            item = {}
+            for name, path in self.fields.items():
+                value = path.get(element)
+                if isinstance(value, str | int | float) and not isinstance(value, bool):
+                    item[name] = str(value)
+
+            if "title" in item and "link" in item:
+                items.append(item)
+
+        return items
 
 
 @dataclass
 class SourceKeyMapping:
     filename: str
     torrent: str
+    infohash: str | None = None
 
     @classmethod
     def from_object(cls, obj: dict) -> "SourceKeyMapping":
@@ -20,7 +174,8 @@ class SourceKeyMapping:
             if key not in obj:
                 raise Exception(f"Invalid RSS Source Key Mapping object, missing required key '{key}'")
 
-        return cls(cls._get_true_key(obj["filename"]), cls._get_true_key(obj["torrent"]))
+        infohash = cls._get_true_key(obj["infohash"]) if "infohash" in obj else None
+        return cls(cls._get_true_key(obj["filename"]), cls._get_true_key(obj["torrent"]), infohash)
 
     @staticmethod
     def _get_true_key(value: str) -> str:
@@ -40,6 +195,16 @@ class SourceKeyMapping:
     def get_torrent(self, item: dict) -> str:
         return item[self.torrent]
 
+    def get_infohash(self, item: dict) -> str | None:
+        if self.infohash is None:
+            return None
+
+        value = item.get(self.infohash)
+        if not isinstance(value, str):
+            return None
+
+        return normalize_infohash(value)
+
 
 @dataclass
 class Source:
@@ -48,10 +213,25 @@ class Source:
     url: str
 
     rss_key_map: SourceKeyMapping
+    page_parameter: str | None = None
+
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    read_timeout: float = DEFAULT_READ_TIMEOUT
+    max_response_size: int = DEFAULT_MAX_RESPONSE_SIZE
+
+    trackers: tuple[str, ...] = ()
+
+    type_: str = "rss"
+    json_map: JsonItemMapping | None = None
 
     @classmethod
     def from_object(cls, obj: dict) -> "Source":
-        required_keys = ("name", "version", "url", "rssItemKeyMapping")
+        type_ = obj.get("type", "rss")
+        if type_ not in ("rss", "json"):
+            raise Exception(f"Invalid RSS Source object, unknown type '{type_}'")
+
+        mapping_key = "jsonItemKeyMapping" if type_ == "json" else "rssItemKeyMapping"
+        required_keys = ("name", "version", "url", mapping_key)
         for key in required_keys:
             if key not in obj:
                 raise Exception(f"Invalid RSS Source object, missing required key '{key}'")
@@ -62,11 +242,62 @@ class Source:
             raise TypeError("Invalid RSS Source object, version must be a string")
         if not isinstance(obj["url"], str):
             raise TypeError("Invalid RSS Source object, url must be a string")
-        if not isinstance(obj["rssItemKeyMapping"], dict):
-            raise TypeError("Invalid RSS Source object, rssItemKeyMapping must be a dictionary")
+        if not isinstance(obj[mapping_key], dict):
+            raise TypeError(f"Invalid RSS Source object, {mapping_key} must be a dictionary")
+        if not isinstance(obj.get("itemsPath", "$"), str):
+            raise TypeError("Invalid RSS Source object, itemsPath must be a string")
+        if not isinstance(obj.get("pageParameter", ""), str):
+            raise TypeError("Invalid RSS Source object, pageParameter must be a string")
+        if not isinstance(obj.get("trackers", []), list) or not all(isinstance(tracker, str) for tracker in obj.get("trackers", [])):
+            raise TypeError("Invalid RSS Source object, trackers must be a list of strings")
+        for key in ("connectTimeout", "readTimeout", "maxResponseSize"):
+            value = obj.get(key, 1)
+            if isinstance(value, bool) or not isinstance(value, int | float) or value <= 0:
+                raise TypeError(f"Invalid RSS Source object, {key} must be a positive number")
+
+        json_map = None
+        if type_ == "json":
+            json_map = JsonItemMapping.from_object(obj.get("itemsPath", "$"), obj[mapping_key])
+            mapping = SourceKeyMapping("title", "link", "infohash" if "infohash" in json_map.fields else None)
+        else:
+            mapping = SourceKeyMapping.from_object(obj[mapping_key])
+
+        return cls(
+            obj["name"],
+            obj["version"],
+            obj["url"],
+            mapping,
+            obj.get("pageParameter"),
+            float(obj.get("connectTimeout", DEFAULT_CONNECT_TIMEOUT)),
+            float(obj.get("readTimeout", DEFAULT_READ_TIMEOUT)),
+            int(obj.get("maxResponseSize", DEFAULT_MAX_RESPONSE_SIZE)),
+            tuple(obj.get("trackers", ())),
+            type_,
+            json_map,
+        )
+
+    def get_page_url(self, page: int) -> str:
+        """
+        Returns the URL of a page of the source's feed.
+
+        Parameters
+        ----------
+        page: int
+            The 1-indexed page number.
 
-        mapping = SourceKeyMapping.from_object(obj["rssItemKeyMapping"])
-        return cls(obj["name"], obj["version"], obj["url"], mapping)
+        Returns
+        -------
+        str
+            The page's URL.
+        """
+        if page == 1 or self.page_parameter is None:
+            return self.url
+
+        parts = urlsplit(self.url)
+        query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != self.page_parameter]
+        query.append((self.page_parameter, str(page)))
+
+        return parts._replace(query=urlencode(query)).geturl()
 
     def get_filename(self, item: dict) -> str:
         return self.rss_key_map.get_filename(item)
@@ -74,26 +305,170 @@ class Source:
     def get_torrent(self, item: dict) -> str:
         return self.rss_key_map.get_torrent(item)
 
+    def get_infohash(self, item: dict) -> str | None:
+        return self.rss_key_map.get_infohash(item)
+
+    def get_magnet(self, item: dict) -> str | None:
+        """
+        Builds a magnet URL for an item straight from
+        its mapped infohash field, without downloading
+        the torrent file.
+
+        Parameters
+        ----------
+        item: dict
+            The item to build the magnet URL for.
+
+        Returns
+        -------
+        Optional[str]
+            The magnet URL, or None if the source does not
+            map an infohash or the item does not have one.
+        """
+        infohash = self.get_infohash(item)
+        if infohash is None:
+            return None
+
+        params = [("dn", self.get_filename(item))] + [("tr", tracker) for tracker in self.trackers]
+        return f"magnet:?xt=urn:btih:{infohash}&{urlencode(params)}"
+
     def __repr__(self) -> str:
         return f"<Source name={self.name} version={self.version} url={self.url}>"
 
 
+class SourceRegistry:
+    """
+    An in-memory registry of every installed RSS source.
+
+    Source definitions are read and validated once, then
+    only re-read when a file's modification time changes,
+    a file is added or removed, or the registry is
+    invalidated. Definitions that fail validation are
+    reported once per modification.
+
+    Bundled default sources are copied on first start,
+    and replace unedited installed copies with an older
+    version on later starts.
+    """
+
+    __path: Path
+    __defaults: Path
+    __prepared: bool
+    __files: dict[Path, tuple[int, Source | None]]
+
+    def __init__(self, path: Path | None = None, defaults: Path | None = None) -> None:
+        self.__path = path or DATA_DIR / "sources"
+        self.__defaults = defaults or Path.cwd() / "default_sources"
+        self.__prepared = False
+        self.__files = {}
+
+    def invalidate(self) -> None:
+        """
+        Forgets every loaded definition, they will
+        be re-read on the next lookup.
+        """
+        self.__files = {}
+
+    def _prepare(self) -> None:
+        self.__path.mkdir(exist_ok=True, parents=True)
+
+        copied = (self.__path / "COPIED").exists()
+        for default in self.__defaults.glob("*.json"):
+            installed = self.__path / default.name
+            if not installed.exists():
+                # Defaults removed after the first start stay removed.
+                if not copied:
+                    installed.write_bytes(default.read_bytes())
+                continue
+
+            self._upgrade(default, installed)
+
+        if not copied:
+            (self.__path / "COPIED").write_bytes(b"")
+
+        self.__prepared = True
+
+    def _upgrade(self, default: Path, installed: Path) -> None:
+        try:
+            bundled = json.loads(default.read_bytes())
+            current = json.loads(installed.read_bytes())
+            if bundled["name"] != current["name"] or compare_version_strings(bundled["version"], current["version"]) <= 0:
+                return
+        except Exception:
+            # Invalid definitions are reported when they are loaded.
+            return
+
+        if get_definition_digest(current) not in PREVIOUS_DEFAULT_SOURCES:
+            logger.warning(f"`{current['name']}@{current['version']}` - installed source '{installed.name}' was edited, keeping it instead of upgrading to version {bundled['version']}")
+            return
+
+        installed.write_bytes(default.read_bytes())
+        logger.info(f"`{bundled['name']}@{bundled['version']}` - upgraded default source from version {current['version']}")
+
+    def _scan(self) -> dict[Path, int]:
+        if not self.__prepared:
+            self._prepare()
+
+        return {source: source.stat().st_mtime_ns for source in self.__path.glob("*.json")}
+
+    async def get_all(self) -> list[Source]:
+        """
+        Returns every valid source, reloading any
+        definition that changed since the last call.
+
+        Returns
+        -------
+        List[Source]
+            The installed sources.
+        """
+        # Copying the default sources and checking every definition's
+        # modification time is blocking file IO, done on every poll.
+        mtimes = await asyncio.to_thread(self._scan)
+
+        files = {}
+        for path, mtime in mtimes.items():
+            cached = self.__files.get(path)
+            if cached is not None and cached[0] == mtime:
+                files[path] = cached
+                continue
+
+            try:
+                async with aiofiles.open(path) as fp:
+                    source = Source.from_object(json.loads(await fp.read()))
+            except Exception as e:
+                logger.error(f"Invalid RSS source definition '{path.name}', skipping: {e}")
+                source = None
+            else:
+                logger.debug(f"`{source.name}@{source.version}` - loaded source definition")
+
+            files[path] = (mtime, source)
+
+        self.__files = files
+        return [source for _, source in files.values() if source is not None]
+
+
+def get_definition_digest(definition: dict) -> str:
+    """
+    Returns a digest of a source definition that does
+    not depend on its formatting or key order.
+
+    Parameters
+    ----------
+    definition: dict
+        The decoded source definition.
+
+    Returns
+    -------
+    str
+        The SHA-256 digest of the definition.
+    """
+    canonical = json.dumps(definition, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+source_registry = SourceRegistry()
+
+
 async def get_all_sources() -> AsyncGenerator[Source, None]:
-    source_path = DATA_DIR / "sources"
-    source_path.mkdir(exist_ok=True, parents=True)
-
-    if not (source_path / "COPIED").exists():
-        # Small, bundled directory of source definitions - not worth threading off.
-        default_sources = Path("default_sources").glob("*.json")  # noqa: ASYNC240
-        for source in default_sources:
-            source = source.name
-            if not (source_path / source).exists():
-                async with aiofiles.open(source_path / source, "wb") as fp, aiofiles.open(Path.cwd() / "default_sources" / source, "rb") as default_fp:
-                    await fp.write(await default_fp.read())
-
-        async with aiofiles.open(source_path / "COPIED", "wb") as fp:
-            await fp.write(b"")
-
-    for source in source_path.glob("*.json"):
-        async with aiofiles.open(source) as fp:
-            yield Source.from_object(json.loads(await fp.read()))
+    for source in await source_registry.get_all():
+        yield source
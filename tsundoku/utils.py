@@ -1,8 +1,12 @@
 import asyncio
+import base64
+import binascii
 from functools import partial, wraps
 import logging
 from pathlib import Path
+import re
 import shutil
+import string
 from typing import TYPE_CHECKING, Any, TypedDict, cast
 from uuid import uuid4
 
@@ -100,6 +104,27 @@ def parse_anime_title(title: str) -> ParserResult:
     return _elements_to_result(title, anitomy_parse(title, _PARSE_OPTIONS))
 
 
+def parse_anime_title_batch(titles: list[str]) -> list[ParserResult | None]:
+    """
+    Parse a batch of *unrelated* anime filenames one by one.
+
+    Unlike `parse_anime_titles`, every title is parsed independently.
+    This is a module-level function so that it can be sent to a process
+    pool. A title that fails to parse yields None instead of failing
+    the whole batch.
+
+    Results are returned in the same order as ``titles``.
+    """
+    results: list[ParserResult | None] = []
+    for title in titles:
+        try:
+            results.append(parse_anime_title(title))
+        except Exception:
+            results.append(None)
+
+    return results
+
+
 def parse_anime_titles(titles: list[str]) -> list[ParserResult]:
     """
     Parse a set of *related* anime filenames together.
@@ -161,6 +186,108 @@ def normalize_resolution(original: str) -> str:
     return original
 
 
+def normalize_infohash(value: str) -> str | None:
+    """
+    Returns the lowercase hex SHA-1 infohash of a torrent
+    from a hex or base32 infohash, or a magnet URL.
+
+    Parameters
+    ----------
+    value: str
+        An infohash or magnet URL.
+
+    Returns
+    -------
+    Optional[str]
+        The 40 character hex infohash, or None
+        if the value does not contain one.
+    """
+    value = value.strip()
+
+    match = re.search(r"\burn:btih:([A-Za-z\d]+)", value)
+    if match is not None:
+        value = match.group(1)
+
+    if len(value) == 40 and all(c in string.hexdigits for c in value):
+        return value.lower()
+    if len(value) == 32:
+        try:
+            return base64.b32decode(value.upper()).hex()
+        except binascii.Error:
+            return None
+
+    return None
+
+
+def normalize_release_name(filename: str) -> str:
+    """
+    Normalizes a release's filename so that the same
+    release listed by different sources compares equal.
+
+    Parameters
+    ----------
+    filename: str
+        The release's filename.
+
+    Returns
+    -------
+    str
+        The casefolded filename, without a video file
+        extension and with punctuation collapsed.
+    """
+    name = re.sub(r"\.(mkv|mp4|avi|webm)$", "", filename.strip(), flags=re.IGNORECASE)
+    return " ".join(re.sub(r"[\W_]+", " ", name.casefold()).split())
+
+
+def get_release_version(parsed: ParserResult) -> str:
+    """
+    Returns the release version of a parsed filename.
+
+    Parameters
+    ----------
+    parsed: ParserResult
+        The parsed filename.
+
+    Returns
+    -------
+    str
+        The version prefixed with "v", "v0" if the
+        filename has none.
+    """
+    version = parsed.get("release_version", "v0")
+    if not version.startswith("v"):
+        version = f"v{version}"
+
+    return version
+
+
+def get_batch_episodes(parsed: ParserResult) -> list[int]:
+    """
+    Returns the episodes a batch release covers,
+    according to its parsed filename.
+
+    Parameters
+    ----------
+    parsed: ParserResult
+        The parsed filename.
+
+    Returns
+    -------
+    List[int]
+        The episodes of the range in the filename, or
+        an empty list if it does not have one.
+    """
+    numbers = parsed.get("episode_number")
+    if not isinstance(numbers, list) or not all(number.isdigit() for number in numbers):
+        return []
+
+    episodes = [int(number) for number in numbers]
+    if len(episodes) == 2:
+        return list(range(min(episodes), max(episodes) + 1))
+
+    return sorted(set(episodes))
+
+
 def compare_version_strings(first: str, second: str) -> int:
     """
     Compare two version strings.